@@ -0,0 +1,258 @@
+"""Headless benchmarks of the dashboard's load, render, search and correlation paths on synthetic data.
+
+    python benchmark.py --sizes 100 10000 --out before.json
+    python benchmark.py --out after.json --compare before.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import tempfile
+import time
+
+import matplotlib
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import ds1
+
+DEFAULT_SIZES = [10**2, 10**4, 10**6]
+ECON_YEARS = range(1960, 2021)
+SEARCH_QUERIES = ['i', 'in', 'ind', 'indi', '2008']
+PREDICATE_QUERIES = ['Year>=1991', 'GDP growth (annual %) < 0',
+                     '1991 <= Year < 2000 & GDP growth (annual %) > 5', 'Country Name = india']
+PANEL_MAX_ROWS = 10**4
+LINE_BAR_CHARTS = ['inflation_trends', 'government_debt']
+
+
+def write_econ(path, rows, rng):
+    """indianEco.csv layout, India first and further countries until rows is reached"""
+    countries = -(-rows // len(ECON_YEARS))
+    names = ['India'] + [f"Country {i}" for i in range(1, countries)]
+    years = np.tile(np.array(ECON_YEARS), countries)[:rows]
+    country = np.repeat(names, len(ECON_YEARS))[:rows]
+    growth = rng.normal(5, 3, rows)
+    df = pd.DataFrame({
+        'Year': years,
+        'Country Name': country,
+        'GDP (current US$) ': np.round(np.exp(rng.normal(25, 1, rows)), 2),
+        ' GDP per capita (current US$) ': rng.integers(80, 2500, rows),
+        'GDP growth (annual %)': np.round(growth, 2),
+        'Imports of goods and services (% of GDP)': np.round(rng.uniform(3, 30, rows), 2),
+        'Exports of goods and services (% of GDP)': np.round(rng.uniform(3, 25, rows), 2),
+        ' Total reserves (includes gold, current US$) ': np.round(np.exp(rng.normal(22, 2, rows)), 2),
+        'Inflation, consumer prices (annual %)': np.round(rng.normal(7, 4, rows), 2),
+        'Population, total': rng.integers(10**6, 1.4 * 10**9, rows),
+        'Population growth (annual %)': np.round(rng.uniform(0.5, 2.5, rows), 2),
+        'Life expectancy at birth, total (years)': np.round(rng.uniform(40, 75, rows), 2),
+    })
+    df.to_csv(path, index=False)
+
+
+def synthetic_years(rows, last_year):
+    """rows consecutive years ending in last_year, or starting at year 1 when that would go below it"""
+    start = max(last_year - rows + 1, 1)
+    return np.arange(start, start + rows)
+
+
+def write_tax(path, rows, rng):
+    """Tax table layout: "2000-01" style year labels"""
+    years = synthetic_years(rows, 2017)
+    df = pd.DataFrame({
+        'Year': [f"{year}-{(year + 1) % 100:02d}" for year in years],
+        'Value of Import (in ? Crore)': rng.integers(10**5, 3 * 10**6, rows),
+        'Growth in Value of Imports ( %)': np.round(rng.normal(10, 12, rows), 1),
+        'Net Custom Revenue from Import Duties (in ? Crore)': rng.integers(10**4, 2 * 10**5, rows),
+        'Growth in Revenue from Import Duty (%)': np.round(rng.normal(8, 10, rows), 1),
+        'Collection Rates (Percent)': np.round(rng.uniform(5, 25, rows), 1),
+    })
+    df.to_csv(path, index=False)
+
+
+def write_percent_table(path, rows, rng, value_column, mean, spread):
+    """Inflation/debt layout: newest year first, values as "6.70%" strings"""
+    years = synthetic_years(rows, 2022)[::-1]
+    values = np.abs(rng.normal(mean, spread, rows))
+    growth = np.r_[np.diff(values[::-1])[::-1], 0.0]
+    df = pd.DataFrame({
+        'year': years,
+        value_column: [f"{v:.2f}%" for v in values],
+        'Annual_percent_geowth': [f"{g:.2f}%" for g in growth],
+    })
+    df.to_csv(path)
+
+
+def write_datasets(directory, rows, seed=0):
+    """Write synthetic versions of every DATA_SOURCES file with rows rows each"""
+    rng = np.random.default_rng(seed)
+    files = {attr: os.path.join(directory, spec[0]) for attr, spec in ds1.DATA_SOURCES.items()}
+    write_econ(files['econ_data'], rows, rng)
+    write_tax(files['tax_data'], rows, rng)
+    write_percent_table(files['inflation_data'], rows, rng, 'Inflation_Rate', 7, 4)
+    write_percent_table(files['debt_data'], rows, rng, 'Government_Debt_as_percent_of_GDP', 65, 10)
+
+
+def timed(func, repeat):
+    """Run func repeat times; returns (last result, [seconds per run])"""
+    runs = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        runs.append(time.perf_counter() - start)
+    return result, runs
+
+
+def load_all(cache_dir):
+    cache = ds1.DataCache(cache_dir)
+    return {attr: ds1.load_dataset(cache, attr) for attr in ds1.DATA_SOURCES}
+
+
+def build_panel(datasets):
+    index = ds1.CountryIndex(datasets['econ_data'])
+    return ds1.EconomicPanel(ds1.country_datasets(datasets, index, ds1.DEFAULT_COUNTRY))
+
+
+def render_chart(panel, name, chart_type=None):
+    """Build and draw one chart on a fresh Agg figure with cold stats, switched to chart_type if given"""
+    charts = ds1.ChartBuilder(ds1.StatsEngine(lambda: panel))
+    fig = Figure(figsize=ds1.ChartBuilder.FIGSIZES[name])
+    FigureCanvasAgg(fig)
+    chart_artists = getattr(charts, name)(fig)
+    if chart_type is not None:
+        ds1.ChartBuilder.set_chart_type(chart_artists, chart_type)
+    fig.canvas.draw()
+
+
+def build_search_index(df):
+    index = ds1.TableSearchIndex(df)
+    index.build()
+    return index
+
+
+def search_session(index):
+    """Type a query one key at a time into a built search index, as the data table does"""
+    for query in SEARCH_QUERIES:
+        index.search(query, "All Columns")
+    index.search('india', 'Country Name')
+
+
+def predicate_session(df):
+    """Build the table's search index and run the predicate queries, sorted indexes included"""
+    index = ds1.TableSearchIndex(df)
+    for query in PREDICATE_QUERIES:
+        index.query(query)
+
+
+def correlate(panel):
+    matrix = ds1.StatsEngine(lambda: panel).correlation_matrix()
+    return matrix.correlations(int(matrix.years[0]), int(matrix.years[-1]))
+
+
+def run_size(rows, repeat, charts, panel_max_rows=PANEL_MAX_ROWS):
+    """Every benchmark case at one dataset size; returns [(case, runs)], runs is None when skipped"""
+    results = []
+    work_dir = tempfile.mkdtemp(prefix=f"dashboard_bench_{rows}_")
+    cwd = os.getcwd()
+    try:
+        write_datasets(work_dir, rows)
+        os.chdir(work_dir)  # DATA_SOURCES paths are relative to the project directory
+        cache_dir = os.path.join(work_dir, 'cache')
+
+        def cold_load():
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            return load_all(cache_dir)
+
+        _, runs = timed(cold_load, repeat)
+        results.append(('load_data:parse', runs))
+        datasets, runs = timed(lambda: load_all(cache_dir), repeat)
+        results.append(('load_data:cached', runs))
+
+        panel, runs = timed(lambda: build_panel(datasets), repeat)
+        results.append(('panel', runs))
+
+        # Built on a worker thread when the dataset is selected, so off the keystroke path
+        index, runs = timed(lambda: build_search_index(datasets['econ_data']), repeat)
+        results.append(('data_table:index', runs))
+        _, runs = timed(lambda: search_session(index), repeat)
+        results.append(('data_table:search', runs))
+        _, runs = timed(lambda: predicate_session(datasets['econ_data']), repeat)
+        results.append(('data_table:predicate', runs))
+
+        panel_cases = [(f"view:{name}", lambda name=name: render_chart(panel, name)) for name in charts]
+        # The Line/Bar charts draw their bars on the first switch to Bar
+        panel_cases += [(f"view:{name}:bar", lambda name=name: render_chart(panel, name, 'Bar'))
+                        for name in charts if name in LINE_BAR_CHARTS]
+        panel_cases.append(('compare:correlation', lambda: correlate(panel)))
+        for case, func in panel_cases:
+            if rows > panel_max_rows:
+                results.append((case, None))
+                continue
+            _, runs = timed(func, repeat)
+            results.append((case, runs))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def compare(results, baseline_path):
+    """Print each case's best time against the same case in an earlier results file"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {(r['rows'], r['case']): r['best'] for r in json.load(f)['results'] if 'best' in r}
+    print(f"\n{'rows':>9}  {'case':<36} {'before':>10} {'after':>10} {'change':>8}")
+    for r in results:
+        if 'best' not in r:
+            continue
+        before = baseline.get((r['rows'], r['case']))
+        if before:
+            print(f"{r['rows']:>9}  {r['case']:<36} {before:>10.4f} {r['best']:>10.4f} "
+                  f"{(r['best'] / before - 1) * 100:>+7.1f}%")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard's data and chart paths")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="rows per dataset")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per case; the best is reported")
+    parser.add_argument('--charts', nargs='+', choices=list(ds1.ChartBuilder.FIGSIZES),
+                        default=list(ds1.ChartBuilder.FIGSIZES), help="charts to time (default: all)")
+    parser.add_argument('--panel-max-rows', type=int, default=PANEL_MAX_ROWS,
+                        help="largest size the chart and correlation cases run at")
+    parser.add_argument('--out', default='benchmark_results.json')
+    parser.add_argument('--compare', metavar='BASELINE', help="earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    results = []
+    for rows in args.sizes:
+        for case, runs in run_size(rows, args.repeat, args.charts, args.panel_max_rows):
+            if runs is None:
+                results.append({'rows': rows, 'case': case, 'skipped': f"rows > {args.panel_max_rows}"})
+                print(f"{rows:>9}  {case:<36} {'skipped':>13}")
+                continue
+            results.append({'rows': rows, 'case': case, 'best': round(min(runs), 6),
+                            'runs': [round(run, 6) for run in runs]})
+            print(f"{rows:>9}  {case:<36} {min(runs) * 1000:>10.1f} ms")
+
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump({
+            'created': datetime.datetime.now().isoformat(timespec='seconds'),
+            'platform': platform.platform(),
+            'python': platform.python_version(),
+            'versions': {'pandas': pd.__version__, 'numpy': np.__version__,
+                         'matplotlib': matplotlib.__version__},
+            'repeat': args.repeat,
+            'results': results,
+        }, f, indent=2)
+    print(f"Results written to {args.out}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
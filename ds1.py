@@ -1,12 +1,2504 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import numpy as np
-from PIL import Image, ImageTk
 import os
+import sys
 import io
+import re
+import json
+import operator
+import shutil
+import hashlib
+import base64
+import pickle
+import zipfile
+import queue
+import threading
+import time
+import functools
+import datetime
+import argparse
+import tempfile
+import importlib.util
+import gzip
+from collections import namedtuple, defaultdict
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Parquet and zstd table exports need pyarrow; it is only imported by the export itself
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+
+class LazyImport:
+    """Stand-in for a heavy module-level import that imports it and rebinds the global on first use"""
+
+    def __init__(self, name, module, attr=None):
+        self.name = name
+        self.module = module
+        self.attr = attr
+
+    def resolve(self):
+        with PROFILER.phase('import'):
+            target = importlib.import_module(self.module)
+        if self.attr is not None:
+            target = getattr(target, self.attr)
+        globals()[self.name] = target
+        return target
+
+    def __getattr__(self, attr):
+        return getattr(self.resolve(), attr)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+
+pd = LazyImport('pd', 'pandas')
+np = LazyImport('np', 'numpy')
+matplotlib = LazyImport('matplotlib', 'matplotlib')
+mpimage = LazyImport('mpimage', 'matplotlib.image')
+FigureCanvasTkAgg = LazyImport('FigureCanvasTkAgg', 'matplotlib.backends.backend_tkagg', 'FigureCanvasTkAgg')
+FigureCanvasAgg = LazyImport('FigureCanvasAgg', 'matplotlib.backends.backend_agg', 'FigureCanvasAgg')
+PdfPages = LazyImport('PdfPages', 'matplotlib.backends.backend_pdf', 'PdfPages')
+Figure = LazyImport('Figure', 'matplotlib.figure', 'Figure')
+Line2D = LazyImport('Line2D', 'matplotlib.lines', 'Line2D')
+PolyCollection = LazyImport('PolyCollection', 'matplotlib.collections', 'PolyCollection')
+MaxNLocator = LazyImport('MaxNLocator', 'matplotlib.ticker', 'MaxNLocator')
+FuncFormatter = LazyImport('FuncFormatter', 'matplotlib.ticker', 'FuncFormatter')
+IdentityTransform = LazyImport('IdentityTransform', 'matplotlib.transforms', 'IdentityTransform')
+
+
+def resolve_lazy_imports():
+    """Import everything still deferred, so the first chart doesn't pay for it"""
+    for value in list(globals().values()):
+        if isinstance(value, LazyImport):
+            value.resolve()
+
+CACHE_DIR = '.dashboard_cache'
+CACHE_VERSION = 3
+IMAGE_CACHE_DIR = os.path.join(CACHE_DIR, 'images')
+IMAGE_CACHE_MAX_BYTES = 64 * 2**20
+# Quiet time before idle prefetching hands out the next chart
+PREFETCH_IDLE_MS = 1500
+# How often the source files are checked for appended rows
+WATCH_INTERVAL_MS = 2000
+
+# World Bank style dumps are read in chunks of this many rows. ECON_COUNTRIES
+# limits loading to a list of countries; None keeps every country in the file,
+# which the country selector then offers.
+ECON_COUNTRIES = None
+ECON_CHUNK_ROWS = 100_000
+# Country selected at startup; the tax, inflation and debt files only describe this one
+DEFAULT_COUNTRY = 'India'
+PROFILE_LOG = 'dashboard_profile.jsonl'
+# Rows the data table export formats and writes at a time
+TABLE_EXPORT_CHUNK_ROWS = 50_000
+
+
+def parse_econ_data(path, countries=None, chunksize=ECON_CHUNK_ROWS):
+    """Parse indianEco.csv (or a multi-country dump shaped like it) in chunks, keeping the rows of countries and the registered indicators"""
+    header = pd.read_csv(path, nrows=0).columns
+    wanted = {'Year', 'Country Name'} | {col for col, spec in INDICATOR_REGISTRY.items()
+                                          if spec.source == 'econ_data'}
+    usecols = [raw for raw in header if raw.strip() in wanted]
+    country_col = next(raw for raw in usecols if raw.strip() == 'Country Name')
+    indicators = [raw for raw in usecols if raw.strip() not in ('Year', 'Country Name')]
+    
+    def read(indicator_dtype):
+        parts = []
+        if hasattr(path, 'seek'):
+            path.seek(0)  # A buffer (the appended tail of the file) is read more than once
+        dtypes = {raw: indicator_dtype for raw in indicators}
+        dtypes[country_col] = 'str'
+        # World Bank exports write missing values as '..'
+        for chunk in pd.read_csv(path, usecols=usecols, dtype=dtypes, na_values=['..'], chunksize=chunksize):
+            if countries is not None:
+                chunk = chunk[chunk[country_col].isin(countries)]
+            if indicator_dtype == 'str':
+                chunk = chunk.assign(**{raw: pd.to_numeric(chunk[raw], errors='coerce') for raw in indicators})
+            parts.append(chunk)
+        return pd.concat(parts, ignore_index=True)
+    
+    try:
+        df = read('float64')
+    except ValueError:
+        df = read('str')
+    df.columns = df.columns.str.strip()
+    # Blank lines and the footer World Bank exports end with have no year or country
+    df['Year'] = pd.to_numeric(df['Year'], errors='coerce')
+    df = df.dropna(subset=['Year', 'Country Name']).reset_index(drop=True)
+    df['Year'] = df['Year'].astype('int64')
+    return df
+
+
+def parse_tax_data(path):
+    """Parse syb-18-chapter_6_direct_indirect_taxes_table_6.11.csv, keeping the first year of each "2000-01" label"""
+    df = pd.read_csv(path)
+    df['Year'] = df['Year'].str.split('-').str[0].astype(int)
+    for col in df.columns:
+        if col != 'Year':
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    return df
+
+
+def parse_inflation_data(path):
+    """Parse India_Inflation_Rate.csv, converting the '%' strings to floats"""
+    df = pd.read_csv(path)
+    df = df.rename(columns={
+        'year': 'Year',
+        'Inflation_Rate': 'Inflation Rate (%)',
+        'Annual_percent_geowth': 'Inflation Growth Rate (%)'
+    })
+    df['Inflation Rate (%)'] = df['Inflation Rate (%)'].str.rstrip('%').astype(float)
+    df['Inflation Growth Rate (%)'] = df['Inflation Growth Rate (%)'].str.rstrip('%').astype(float)
+    if 'Unnamed: 0' in df.columns:
+        df = df.drop(columns=['Unnamed: 0'])
+    return df
+
+
+def parse_debt_data(path):
+    """Parse India_Government_Debt.csv, converting the '%' strings to floats"""
+    df = pd.read_csv(path)
+    df = df.rename(columns={
+        'year': 'Year',
+        'Government_Debt_as_percent_of_GDP': 'Government Debt (% of GDP)',
+        'Annual_percent_geowth': 'Debt Growth Rate (%)'
+    })
+    df['Government Debt (% of GDP)'] = df['Government Debt (% of GDP)'].str.rstrip('%').astype(float)
+    df['Debt Growth Rate (%)'] = df['Debt Growth Rate (%)'].str.rstrip('%').astype(float)
+    if 'Unnamed: 0' in df.columns:
+        df = df.drop(columns=['Unnamed: 0'])
+    return df
+
+
+# Dashboard attribute -> (source file, parser, parser options)
+DATA_SOURCES = {
+    'econ_data': ('indianEco.csv', parse_econ_data, {'countries': ECON_COUNTRIES}),
+    'tax_data': ('syb-18-chapter_6_direct_indirect_taxes_table_6.11.csv', parse_tax_data, {}),
+    'inflation_data': ('India_Inflation_Rate.csv', parse_inflation_data, {}),
+    'debt_data': ('India_Government_Debt.csv', parse_debt_data, {}),
+}
+
+# Datasets with a 'Country Name' column; the rest describe DEFAULT_COUNTRY only
+MULTI_COUNTRY_SOURCES = {'econ_data'}
+
+
+def load_dataset(cache, attr):
+    """Load one entry of DATA_SOURCES through the cache"""
+    file_name, parser, options = DATA_SOURCES[attr]
+    try:
+        return cache.load(attr, file_name, parser, options)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{file_name} not found in the project directory")
+
+
+class Profiler:
+    """Optional phase timing of views, dataset loads and startup, logged as JSON lines; off unless enable() is called"""
+
+    def __init__(self):
+        self.enabled = False
+        self.log_path = None
+        self.context = dict
+        self.listeners = []
+        self.local = threading.local()
+        self.started = time.perf_counter()
+        self.milestones = {}
+
+    def enable(self, log_path=PROFILE_LOG):
+        self.enabled = True
+        self.log_path = log_path
+
+    def _stack(self):
+        if not hasattr(self.local, 'stack'):
+            self.local.stack = []
+        return self.local.stack
+
+    @contextmanager
+    def phase(self, name):
+        """Book the time spent in the block to name, if a run is active on this thread"""
+        stack = self._stack() if self.enabled else None
+        if not stack:
+            yield
+            return
+        
+        now = time.perf_counter()
+        parent = stack[-1]
+        self.local.phases[parent[0]] += now - parent[1]
+        stack.append([name, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            name, start = stack.pop()
+            self.local.phases[name] += now - start
+            stack[-1][1] = now
+
+    @contextmanager
+    def run(self, label):
+        """Time the block as one record, or as a phase of the enclosing run"""
+        if not self.enabled:
+            yield
+            return
+        if self._stack():
+            with self.phase(label):
+                yield
+            return
+        
+        start = time.perf_counter()
+        self.local.phases = defaultdict(float)
+        self._stack().append(['view', start])
+        try:
+            yield
+        finally:
+            name, phase_start = self._stack().pop()
+            end = time.perf_counter()
+            self.local.phases[name] += end - phase_start
+            self._emit({
+                'ts': datetime.datetime.now().isoformat(timespec='milliseconds'),
+                'run': label,
+                'total_ms': round((end - start) * 1000, 2),
+                'phases_ms': {phase: round(seconds * 1000, 2) for phase, seconds
+                              in sorted(self.local.phases.items(), key=lambda item: -item[1])},
+                **self.context(),
+            })
+
+    def timed(self, label):
+        """Decorator form of run(); costs one attribute check while profiling is off"""
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.run(label):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def milestone(self, name):
+        """Mark a startup step as reached; only the first mark of a name counts"""
+        self.milestones.setdefault(name, time.perf_counter())
+
+    def report_startup(self):
+        """Emit the milestones so far as one 'startup' record"""
+        if not self.enabled:
+            return
+        phases = {}
+        previous = self.started
+        for name, at in sorted(self.milestones.items(), key=lambda item: item[1]):
+            phases[name] = round((at - previous) * 1000, 2)
+            previous = at
+        self._emit({
+            'ts': datetime.datetime.now().isoformat(timespec='milliseconds'),
+            'run': 'startup',
+            'total_ms': round((previous - self.started) * 1000, 2),
+            'phases_ms': phases,
+            **self.context(),
+        })
+
+    def _emit(self, record):
+        try:
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + '\n')
+        except OSError:
+            pass  # Profiling must never break the dashboard
+        for listener in self.listeners:
+            listener(record)
+
+    @staticmethod
+    def summary(record):
+        """One-line breakdown of a record for the overlay"""
+        phases = ' · '.join(f"{phase} {ms:.0f}" for phase, ms in record['phases_ms'].items())
+        return f"{record['run']}: {record['total_ms']:.0f} ms ({phases})"
+
+
+PROFILER = Profiler()
+
+
+class DataCache:
+    """Columnar .npy cache of the cleaned datasets, keyed on the parser options and the source file, safe to share between processes"""
+
+    LOCK_TIMEOUT = 10.0
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.manifest_path = os.path.join(cache_dir, 'manifest.json')
+        self.manifest = self._read_manifest()
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get('version') != CACHE_VERSION:
+            return {}
+        return manifest.get('entries', {})
+
+    @contextmanager
+    def _locked(self):
+        """Hold the cache directory's lock file; a lock older than LOCK_TIMEOUT is taken as left by a dead process"""
+        lock_path = os.path.join(self.cache_dir, 'manifest.lock')
+        deadline = time.monotonic() + self.LOCK_TIMEOUT
+        while True:
+            try:
+                os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                if time.monotonic() > deadline:
+                    try:
+                        os.remove(lock_path)
+                    except OSError:
+                        pass
+                    deadline = time.monotonic() + self.LOCK_TIMEOUT
+                time.sleep(0.01)
+        try:
+            yield
+        finally:
+            try:
+                os.remove(lock_path)
+            except FileNotFoundError:
+                pass
+
+    def _write_manifest(self, name):
+        """Merge name's entry into the manifest on disk; the caller holds the lock"""
+        manifest = self._read_manifest()
+        manifest[name] = self.manifest[name]
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'entries': manifest}, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+        self.manifest = manifest
+
+    @staticmethod
+    def file_hash(path):
+        """SHA-1 of a file, read in 1 MB blocks"""
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _is_fresh(self, name, entry, path, stat):
+        if entry['size'] != stat.st_size:
+            return False
+        if entry['mtime_ns'] == stat.st_mtime_ns:
+            return True
+        if entry['sha1'] != self.file_hash(path):
+            return False
+        # Same content under a new mtime: remember it so the next launch skips the hash
+        entry['mtime_ns'] = stat.st_mtime_ns
+        try:
+            with self._locked():
+                self._write_manifest(name)
+        except OSError:
+            pass
+        return True
+
+    def load(self, name, source_path, parser, options=None):
+        """Return the cleaned frame for source_path, parsing it only on a cache miss"""
+        options = options or {}
+        stat = os.stat(source_path)
+        entry = self.manifest.get(name)
+        if (entry is not None and entry.get('source') == source_path and entry.get('options') == options
+                and self._is_fresh(name, entry, source_path, stat)):
+            try:
+                with PROFILER.phase('cache'):
+                    return self._read_frame(name, entry)
+            except (OSError, ValueError, KeyError):
+                pass  # Damaged cache entry, fall through and rebuild it
+        
+        with PROFILER.phase('load'):
+            df = parser(source_path, **options)
+        try:
+            self._write_frame(name, df, source_path, stat, options)
+        except OSError:
+            pass  # A read-only working directory just means no cache
+        return df
+
+    def _read_frame(self, name, entry):
+        frame_dir = os.path.join(self.cache_dir, name)
+        columns = {}
+        for i, (col, kind) in enumerate(entry['columns']):
+            values = np.load(os.path.join(frame_dir, f"{i}.npy"), mmap_mode='r', allow_pickle=False)
+            if kind == 'str':
+                values = values.astype(object)
+            columns[col] = values
+        return pd.DataFrame(columns, copy=False)
+
+    def _write_frame(self, name, df, source_path, stat, options):
+        frame_dir = os.path.join(self.cache_dir, name)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=self.cache_dir, prefix=f"{name}.", suffix='.tmp')
+        try:
+            columns = []
+            for i, col in enumerate(df.columns):
+                if pd.api.types.is_numeric_dtype(df[col]):
+                    kind = 'num'
+                    values = df[col].to_numpy()
+                else:
+                    kind = 'str'
+                    values = df[col].astype(str).to_numpy(dtype=str)
+                np.save(os.path.join(tmp_dir, f"{i}.npy"), values, allow_pickle=False)
+                columns.append((col, kind))
+            entry = {
+                'source': source_path,
+                'options': options,
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'sha1': self.file_hash(source_path),
+                'columns': columns,
+            }
+            
+            with self._locked():
+                shutil.rmtree(frame_dir, ignore_errors=True)
+                os.replace(tmp_dir, frame_dir)
+                self.manifest[name] = entry
+                self._write_manifest(name)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def store(self, name, df, source_path, stat, options=None):
+        """Replace name's entry with an already parsed frame of source_path as it was at stat"""
+        try:
+            self._write_frame(name, df, source_path, stat, options or {})
+        except OSError:
+            pass
+
+    def version(self, name):
+        """SHA-1 of the source file the cached entry was built from, or None when there is no entry"""
+        entry = self.manifest.get(name)
+        return entry['sha1'] if entry else None
+
+
+class ImageCache:
+    """Content-addressed PNG cache of rendered charts with LRU eviction"""
+
+    _code_version = None
+
+    def __init__(self, cache_dir=IMAGE_CACHE_DIR, max_bytes=IMAGE_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+
+    @classmethod
+    def key(cls, params):
+        """Hex key of a chart described by the JSON-serializable params and this module's source"""
+        if cls._code_version is None:
+            # Any change to the chart code must miss, so the source itself is part of the key
+            cls._code_version = DataCache.file_hash(__file__)
+        payload = json.dumps({'params': params, 'code': cls._code_version,
+                              'matplotlib': matplotlib.__version__}, sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.png")
+
+    def get(self, key):
+        """PNG bytes stored under key, or None"""
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def put(self, key, rgba):
+        """Store an RGBA pixel array under key as PNG and evict down to max_bytes"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{self.path(key)}.{threading.get_ident()}.tmp"
+            mpimage.imsave(tmp_path, rgba, format='png', pil_kwargs={'compress_level': 1})
+            os.replace(tmp_path, self.path(key))
+            self.evict()
+        except OSError:
+            pass  # Charts just render live
+
+    def put_canvas(self, key, canvas):
+        """Copy a drawn Agg canvas' pixels and store them on a worker thread"""
+        rgba = np.asarray(canvas.buffer_rgba()).copy()
+        threading.Thread(target=self.put, args=(key, rgba), daemon=True).start()
+
+    def evict(self):
+        with self.lock:
+            entries = []
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith('.png'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+
+
+def merge_rows(attr, df, tail):
+    """Append freshly parsed rows to a dataset; a year already present is replaced by the new row"""
+    keys = ['Country Name', 'Year'] if attr in MULTI_COUNTRY_SOURCES else ['Year']
+    merged = pd.concat([df, tail], ignore_index=True)
+    return merged.drop_duplicates(keys, keep='last').reset_index(drop=True)
+
+
+class SourceWatcher:
+    """Polls the DATA_SOURCES files and parses only the rows appended to them, on a worker thread"""
+
+    ANCHOR_BYTES = 4096
+
+    def __init__(self, sources=DATA_SOURCES, cache_dir=CACHE_DIR):
+        self.sources = sources
+        self.cache_dir = cache_dir
+        self.state = {}
+        self.busy = set()
+        self.results = queue.Queue()
+
+    def track(self, attr):
+        """Start watching attr's file from its current contents, which are assumed loaded"""
+        path = self.sources[attr][0]
+        try:
+            with open(path, 'rb') as f:
+                self.state[attr] = self._snapshot(f, os.fstat(f.fileno()))
+        except OSError:
+            self.state.pop(attr, None)
+
+    def _snapshot(self, f, stat):
+        f.seek(0)
+        header = f.readline()
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        # Only complete lines count as parsed; a partial last line is read again next time
+        f.seek(max(end - self.ANCHOR_BYTES, 0))
+        block = f.read()
+        offset = end - len(block) + block.rfind(b'\n') + 1 if b'\n' in block else end
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'header': header,
+                'offset': offset, 'anchor': self._anchor(f, offset)}
+
+    def _anchor(self, f, offset):
+        f.seek(max(offset - self.ANCHOR_BYTES, 0))
+        return hashlib.sha1(f.read(min(offset, self.ANCHOR_BYTES))).hexdigest()
+
+    def check(self, current):
+        """Start a worker for every changed file; current(attr) returns the frame in memory"""
+        for attr, state in list(self.state.items()):
+            if attr in self.busy:
+                continue
+            try:
+                stat = os.stat(self.sources[attr][0])
+            except OSError:
+                continue
+            if (stat.st_size, stat.st_mtime_ns) != (state['size'], state['mtime_ns']):
+                self.busy.add(attr)
+                threading.Thread(target=self._update, args=(attr, current(attr)), daemon=True).start()
+
+    def _update(self, attr, df):
+        path, parser, options = self.sources[attr]
+        state = self.state[attr]
+        try:
+            with open(path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                grown = stat.st_size >= state['offset'] and self._anchor(f, state['offset']) == state['anchor']
+                if grown:
+                    f.seek(state['offset'])
+                    tail = f.read(stat.st_size - state['offset'])
+                    complete = tail[:tail.rfind(b'\n') + 1]
+                    if complete.strip():
+                        df = merge_rows(attr, df, parser(io.BytesIO(state['header'] + complete), **options))
+                    offset = state['offset'] + len(complete)
+                    self.state[attr] = dict(state, size=stat.st_size, mtime_ns=stat.st_mtime_ns,
+                                            offset=offset, anchor=self._anchor(f, offset))
+            
+            cache = DataCache(self.cache_dir)
+            if not grown:
+                df = load_dataset(cache, attr)
+                self.track(attr)
+            elif not complete.strip():
+                self.results.put((attr, None, None, None))  # Nothing new but a partial line or a touch
+                return
+            elif offset == stat.st_size:
+                cache.store(attr, df, path, stat, options)
+            # The hash is only known when the cache describes the whole file
+            version = cache.version(attr) if not grown or offset == stat.st_size else None
+            self.results.put((attr, df, version, None))
+        except Exception as e:
+            self.track(attr)  # Don't retry a broken file until it changes again
+            self.results.put((attr, None, None, e))
+
+    def poll(self):
+        results = []
+        while True:
+            try:
+                result = self.results.get_nowait()
+            except queue.Empty:
+                return results
+            self.busy.discard(result[0])
+            results.append(result)
+
+
+def current_rss_mb():
+    """Resident set size of this process in MB, or None when it cannot be read"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / 2**20
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class FigureManager:
+    """Owns a fixed pool of Figures and their Tk canvases, shared by every view and kept out of pyplot"""
+
+    def __init__(self, pool_size=4):
+        self.pool = [None] * pool_size
+        self.canvases = [None] * pool_size
+        self.names = [None] * pool_size
+        self.tools = [[] for _ in range(pool_size)]
+        self.next_slot = 0
+
+    def acquire(self, figsize, slot=None, name=None):
+        """Return a cleared Figure from the pool, resized to figsize"""
+        if slot is None:
+            slot = self.next_slot
+        if slot >= len(self.pool):
+            raise RuntimeError(f"Figure pool exhausted ({len(self.pool)} figures)")
+        self.next_slot = max(self.next_slot, slot + 1)
+        self.names[slot] = name or f"chart_{slot + 1}"
+        
+        if self.pool[slot] is None:
+            self.pool[slot] = Figure()
+        fig = self.pool[slot]
+        self._drop_tools(slot)
+        fig.clear()
+        fig.set_size_inches(figsize)
+        return fig
+
+    def subplots(self, nrows=1, ncols=1, figsize=(12, 6), slot=None, name=None, **kwargs):
+        """Pool-backed replacement for plt.subplots"""
+        fig = self.acquire(figsize, slot, name)
+        return fig, fig.subplots(nrows, ncols, **kwargs)
+
+    def canvas(self, fig, master):
+        """Draw fig into master, creating and packing its Tk canvas on first use"""
+        slot = self.pool.index(fig)
+        canvas = self.canvases[slot]
+        if canvas is None or not canvas.get_tk_widget().winfo_exists():
+            canvas = FigureCanvasTkAgg(fig, master=master)
+            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            self.canvases[slot] = canvas
+        with PROFILER.phase('draw'):
+            canvas.draw()
+        return canvas
+
+    def attach(self, fig, *tools):
+        """Connect interactive tools (Crosshair, PanZoom) to fig's canvas, replacing the slot's previous ones"""
+        slot = self.pool.index(fig)
+        self._drop_tools(slot)
+        # The only reference to the tools: mpl_connect holds their callbacks weakly
+        self.tools[slot] = [tool(self.canvases[slot]) for tool in tools]
+        return self.tools[slot]
+
+    def _drop_tools(self, slot):
+        # Canvas callbacks live on the figure, so they outlast the canvas unless disconnected
+        for tool in self.tools[slot]:
+            tool.disconnect()
+        self.tools[slot] = []
+
+    def release_all(self):
+        """Destroy the Tk canvases and clear every figure so its artists can be freed"""
+        for slot, canvas in enumerate(self.canvases):
+            self._drop_tools(slot)
+            if canvas is not None:
+                canvas.get_tk_widget().destroy()
+                self.canvases[slot] = None
+        for fig in self.pool[:self.next_slot]:
+            if fig is not None:
+                fig.clear()
+        self.names = [None] * len(self.pool)
+        self.next_slot = 0
+
+    def in_use(self):
+        """(name, figure) for every figure the current view has drawn, in slot order"""
+        return [(name, fig) for name, fig in zip(self.names[:self.next_slot], self.pool)
+                if name is not None]
+
+    @property
+    def dpi(self):
+        """dpi the pool's figures are created with"""
+        return matplotlib.rcParams['figure.dpi']
+
+    def live_figures(self):
+        """Figures currently alive: the pool plus anything left in pyplot's registry"""
+        pyplot = sys.modules.get('matplotlib.pyplot')  # Never imported means no pyplot figures
+        pool = sum(fig is not None for fig in self.pool)
+        return pool + (len(pyplot.get_fignums()) if pyplot else 0)
+
+    def status_text(self):
+        rss = current_rss_mb()
+        rss_text = f"{rss:.0f} MB" if rss is not None else "n/a"
+        return f"Figures: {self.next_slot}/{len(self.pool)} in use, {self.live_figures()} live\nRSS: {rss_text}"
+
+
+class Prefetcher:
+    """Renders charts the user is likely to open next into the ImageCache while the UI is idle"""
+
+    def __init__(self, root, images):
+        self.root = root
+        self.images = images
+        self.plan = []
+        self.busy = False
+        self.last_input = time.monotonic()
+        self.after_id = None
+        self.generation = 0
+        self.jobs = queue.Queue()
+        self.done = queue.Queue()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def touch(self, event=None):
+        self.last_input = time.monotonic()
+
+    def idle_ms(self):
+        """Milliseconds since the last input"""
+        return (time.monotonic() - self.last_input) * 1000
+
+    def invalidate(self):
+        """Forget the plan and discard the result of any job in flight"""
+        self.plan = []
+        self.generation += 1
+
+    def schedule(self, plan):
+        """Replace the plan with [(key, render)], most likely first; renders may only read data snapshotted on the Tk thread"""
+        self.plan = list(plan)
+        if self.after_id is None and self.plan:
+            self.after_id = self.root.after(PREFETCH_IDLE_MS, self._tick)
+
+    def _tick(self):
+        self.after_id = None
+        while not self.done.empty():
+            self.done.get()
+            self.busy = False
+        if not self.plan and not self.busy:
+            return
+        idle_ms = self.idle_ms()
+        if not self.busy and idle_ms >= PREFETCH_IDLE_MS:
+            self.root.after_idle(self._dispatch)
+        self.after_id = self.root.after(max(PREFETCH_IDLE_MS - int(idle_ms), 100), self._tick)
+
+    def _dispatch(self):
+        if self.busy or self.idle_ms() < PREFETCH_IDLE_MS:
+            return
+        while self.plan:
+            key, render = self.plan.pop(0)
+            if not os.path.exists(self.images.path(key)):
+                self.busy = True
+                self.jobs.put((key, render, self.generation))
+                return
+
+    def _run(self):
+        while True:
+            key, render, generation = self.jobs.get()
+            try:
+                rgba = render()
+                if rgba is not None and generation == self.generation:
+                    self.images.put(key, rgba)
+            except Exception:
+                pass  # Prefetching is best effort; the view renders live when opened
+            self.done.put(key)
+
+
+class ExportQueue:
+    """Writes chart exports (an image, a multi-page PDF or a ZIP of PNGs) on a worker thread, one job at a time"""
+
+    def __init__(self, dpi=300):
+        self.dpi = dpi
+        self.jobs = queue.Queue()
+        self.events = queue.Queue()
+        self.pending = 0
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def submit(self, figures, path):
+        """Queue an export of [(name, figure)] to path"""
+        snapshots = [(name, pickle.dumps(fig)) for name, fig in figures]
+        self.jobs.put((snapshots, path))
+        self.pending += 1
+
+    def poll(self):
+        """Drain the worker's events: ('progress', path, done, total) or ('done', path, error)"""
+        events = []
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                return events
+            if event[0] == 'done':
+                self.pending -= 1
+            events.append(event)
+
+    def _run(self):
+        while True:
+            snapshots, path = self.jobs.get()
+            try:
+                self._write(snapshots, path)
+                self.events.put(('done', path, None))
+            except Exception as e:
+                self.events.put(('done', path, e))
+
+    def _write(self, snapshots, path):
+        ext = os.path.splitext(path)[1].lower()
+        tmp_path = path + '.tmp'
+        total = len(snapshots)
+        
+        def figures():
+            for done, (name, data) in enumerate(snapshots, 1):
+                fig = pickle.loads(data)
+                FigureCanvasAgg(fig)
+                yield name, fig
+                self.events.put(('progress', path, done, total))
+        
+        try:
+            if ext == '.pdf':
+                with PdfPages(tmp_path) as pdf:
+                    for name, fig in figures():
+                        pdf.savefig(fig, bbox_inches='tight')
+            elif ext == '.zip':
+                with zipfile.ZipFile(tmp_path, 'w') as archive:
+                    for name, fig in figures():
+                        buf = io.BytesIO()
+                        fig.savefig(buf, format='png', dpi=self.dpi, bbox_inches='tight')
+                        archive.writestr(f"{name}.png", buf.getvalue())
+            else:
+                for name, fig in figures():
+                    fig.savefig(tmp_path, format=ext.lstrip('.') or 'png', dpi=self.dpi, bbox_inches='tight')
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class TableExport:
+    """Streams selected rows of a table to .csv, .csv.gz, .csv.zst or .parquet on a worker thread"""
+
+    FORMATS = [('.csv.gz', 'gzip'), ('.csv.zst', 'zstd'), ('.parquet', 'parquet'), ('.csv', 'csv')]
+    NEEDS_PYARROW = {'zstd', 'parquet'}
+
+    def __init__(self, df, rows, path, chunk_rows=TABLE_EXPORT_CHUNK_ROWS):
+        self.df = df
+        self.rows = rows
+        self.path = path
+        self.chunk_rows = chunk_rows
+        self.kind = self.format_of(path)
+        self.events = queue.Queue()
+        self.cancelled = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    @classmethod
+    def format_of(cls, path):
+        """Format of a path by its extension, CSV for anything unrecognized"""
+        name = path.lower()
+        kind = next((kind for ext, kind in cls.FORMATS if name.endswith(ext)), 'csv')
+        if kind in cls.NEEDS_PYARROW and not PYARROW_AVAILABLE:
+            raise ValueError(f"Exporting {kind} files needs the pyarrow package")
+        return kind
+
+    @classmethod
+    def filetypes(cls):
+        """filedialog filetypes for the formats available here"""
+        types = [("CSV files", "*.csv"), ("Gzip-compressed CSV", "*.csv.gz")]
+        if PYARROW_AVAILABLE:
+            types += [("Zstandard-compressed CSV", "*.csv.zst"), ("Parquet files", "*.parquet")]
+        return types + [("All files", "*.*")]
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def poll(self):
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def _chunks(self):
+        """DataFrames of the rows, chunk_rows at a time (one empty frame when there are none)"""
+        total = len(self.rows)
+        for start in range(0, max(total, 1), self.chunk_rows):
+            if self.cancelled.is_set():
+                return
+            yield self.df.take(self.rows[start:start + self.chunk_rows])
+            self.events.put(('progress', self.path, min(start + self.chunk_rows, total), total))
+
+    def _run(self):
+        tmp_path = self.path + '.tmp'
+        try:
+            if self.kind == 'parquet':
+                self._write_parquet(tmp_path)
+            else:
+                self._write_csv(tmp_path)
+            if self.cancelled.is_set():
+                self.events.put(('cancelled', self.path))
+                return
+            os.replace(tmp_path, self.path)
+            self.events.put(('done', self.path, None))
+        except Exception as e:
+            self.events.put(('done', self.path, e))
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _write_csv(self, tmp_path):
+        if self.kind == 'gzip':
+            sink = gzip.open(tmp_path, 'wb', compresslevel=6)
+        elif self.kind == 'zstd':
+            import pyarrow as pa
+            sink = pa.CompressedOutputStream(tmp_path, 'zstd')
+        else:
+            sink = open(tmp_path, 'wb')
+        with sink:
+            for i, chunk in enumerate(self._chunks()):
+                sink.write(chunk.to_csv(index=False, header=(i == 0)).encode('utf-8'))
+
+    def _write_parquet(self, tmp_path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        writer = None
+        try:
+            for chunk in self._chunks():
+                table = pa.Table.from_pandas(chunk, schema=writer.schema if writer else None,
+                                             preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp_path, table.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+
+
+class TableSearchIndex:
+    """Lower-cased string index of a DataFrame for substring and predicate (`Year>=1991 & ...`) search"""
+
+    ALL_COLUMNS = "All Columns"
+    OPERATOR = re.compile(r'(<=|>=|!=|==|=|<|>)')
+    FLIPPED = {'<': '>', '<=': '>=', '>': '<', '>=': '<=', '=': '=', '==': '==', '!=': '!='}
+    COMPARE = {'<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge,
+               '=': operator.eq, '==': operator.eq, '!=': operator.ne}
+
+    def __init__(self, df):
+        self.df = df.reset_index(drop=True)
+        self.columns = {}
+        self.all_rows = np.arange(len(self.df))
+        self._joined = None
+        self.last_query = ""
+        self.last_column = None
+        self.last_rows = self.all_rows
+        self.sorted = {}
+        self.names = {col.strip().lower(): col for col in self.df.columns}
+        self.ready = threading.Event()
+
+    def build(self):
+        """Compute the string index of every column and of whole rows"""
+        self.column_values(self.ALL_COLUMNS)
+        self.ready.set()
+
+    def strings(self, column):
+        """Lower-cased string form of a column"""
+        if column not in self.columns:
+            self.columns[column] = self.df[column].astype(str).str.lower()
+        return self.columns[column]
+
+    def column_values(self, column):
+        if column != self.ALL_COLUMNS:
+            return self.strings(column)
+        if self._joined is None:
+            # The unit separator cannot be typed, so a match never spans two cells
+            values = [self.strings(col) for col in self.df.columns]
+            joined = values[0]
+            for col_values in values[1:]:
+                joined = joined + '\x1f' + col_values
+            self._joined = joined
+        return self._joined
+
+    def search(self, text, column=ALL_COLUMNS):
+        """Return the positions of the rows whose column (or any column) contains text"""
+        text = text.lower()
+        if not text:
+            rows = self.all_rows
+        else:
+            if column == self.last_column and self.last_query and text.startswith(self.last_query):
+                candidates = self.last_rows
+            else:
+                candidates = self.all_rows
+            values = self.column_values(column).iloc[candidates]
+            rows = candidates[values.str.contains(text, regex=False).to_numpy()]
+        
+        self.last_query = text
+        self.last_column = column
+        self.last_rows = rows
+        return rows
+
+    @classmethod
+    def is_predicate(cls, text):
+        return cls.OPERATOR.search(text) is not None
+
+    def query(self, text, column=ALL_COLUMNS):
+        """Positions, in table order, of the rows matching every clause of a predicate query; raises ValueError"""
+        clauses = defaultdict(list)
+        for part in text.split('&'):
+            for col, op, value in self._parse_clause(part, column):
+                clauses[col].append((op, value))
+        
+        # Clauses on one column intersect as slices of its sorted order
+        bounds = {}
+        for col, ops in clauses.items():
+            ranges = [(0, len(self._sorted_column(col)[1]))]
+            for op, value in ops:
+                ranges = [(max(lo, lo2), min(hi, hi2)) for lo, hi in ranges
+                          for lo2, hi2 in self._bounds(col, op, value) if max(lo, lo2) < min(hi, hi2)]
+            bounds[col] = ranges
+        
+        narrowest = min(bounds, key=lambda col: sum(hi - lo for lo, hi in bounds[col]))
+        order = self._sorted_column(narrowest)[0]
+        rows = np.concatenate([order[:0]] + [order[lo:hi] for lo, hi in bounds[narrowest]])
+        for col, ops in clauses.items():
+            if col == narrowest:
+                continue
+            values = self._sorted_column(col)[2][rows]
+            keep = np.ones(len(rows), dtype=bool)
+            if values.dtype.kind == 'f':
+                keep &= ~np.isnan(values)  # Missing values match nothing, as in the sorted index
+            for op, value in ops:
+                keep &= self.COMPARE[op](values, value)
+            rows = rows[keep]
+        return np.sort(rows)
+
+    def _parse_clause(self, clause, default_column):
+        """[(column, op, value)] of one clause; a range clause gives two"""
+        if not clause.strip():
+            raise ValueError("Add a condition after &")
+        parts = [part.strip() for part in self.OPERATOR.split(clause)]
+        if len(parts) == 3:
+            left, op, right = parts
+            if not left and default_column != self.ALL_COLUMNS:
+                left = default_column
+            if left.lower() in self.names:
+                return [self._clause(left, op, right)]
+            if right.lower() in self.names:
+                return [self._clause(right, self.FLIPPED[op], left)]
+            raise ValueError(f"Unknown column: {left or right}" if left else
+                             "Name a column or pick one in Filter Column")
+        if len(parts) == 5:
+            low, op_low, name, op_high, high = parts
+            if op_low not in ('<', '<=') or op_high not in ('<', '<=') or name.lower() not in self.names:
+                raise ValueError("Write a range as: low <= column <= high")
+            return [self._clause(name, self.FLIPPED[op_low], low), self._clause(name, op_high, high)]
+        raise ValueError(f"Can't read the condition: {clause.strip()}")
+
+    def _clause(self, name, op, text):
+        column = self.names[name.lower()]
+        text = text.strip().strip('"\'')
+        if not text:
+            raise ValueError(f"Missing value after {name} {op}")
+        if self._is_numeric(column):
+            try:
+                return column, op, float(text.replace(',', ''))
+            except ValueError:
+                raise ValueError(f"{column.strip()} needs a number, not {text!r}") from None
+        return column, op, text.lower()
+
+    def _is_numeric(self, column):
+        return pd.api.types.is_numeric_dtype(self.df[column])
+
+    def _sorted_column(self, column):
+        """(argsort order, sorted values, values) of a column, built on first use"""
+        if column not in self.sorted:
+            if self._is_numeric(column):
+                values = self.df[column].to_numpy(dtype='float64')
+            else:
+                values = self.strings(column).to_numpy(dtype=str)
+            order = np.argsort(values, kind='stable')
+            if values.dtype.kind == 'f':
+                order = order[:np.count_nonzero(~np.isnan(values))]  # NaN sorts last
+            self.sorted[column] = (order, values[order], values)
+        return self.sorted[column]
+
+    def _bounds(self, column, op, value):
+        """[(lo, hi)] slices of the column's sorted order where op holds"""
+        sorted_values = self._sorted_column(column)[1]
+        left = int(np.searchsorted(sorted_values, value, side='left'))
+        right = int(np.searchsorted(sorted_values, value, side='right'))
+        end = len(sorted_values)
+        return {
+            '<': [(0, left)], '<=': [(0, right)], '>': [(right, end)], '>=': [(left, end)],
+            '=': [(left, right)], '==': [(left, right)], '!=': [(0, left), (right, end)],
+        }[op]
+
+
+class VirtualTable:
+    """Treeview that only materializes the rows in its visible window"""
+
+    def __init__(self, master, height=20):
+        self.height = height
+        self.df = None
+        self.rows = np.arange(0)
+        self.offset = 0
+        self.slots = []
+        
+        self.scroll_y = ttk.Scrollbar(master, orient=tk.VERTICAL, command=self.yview)
+        self.scroll_y.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.scroll_x = ttk.Scrollbar(master, orient=tk.HORIZONTAL)
+        self.scroll_x.pack(side=tk.BOTTOM, fill=tk.X)
+        
+        self.tree = ttk.Treeview(master, xscrollcommand=self.scroll_x.set, height=height)
+        self.tree.pack(fill=tk.BOTH, expand=True)
+        self.scroll_x.config(command=self.tree.xview)
+        
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll(-1 if e.delta > 0 else 1))
+        self.tree.bind("<Button-4>", lambda e: self.scroll(-1))
+        self.tree.bind("<Button-5>", lambda e: self.scroll(1))
+
+    def set_data(self, df):
+        """Switch to a new DataFrame, rebuilding the columns and the fixed row slots"""
+        self.df = df.reset_index(drop=True)
+        self.tree.delete(*self.tree.get_children())
+        self.tree['columns'] = list(self.df.columns)
+        for col in self.df.columns:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=100, anchor='w')
+        self.slots = [self.tree.insert("", tk.END, values=()) for _ in range(self.height)]
+        self.show_rows(np.arange(len(self.df)))
+
+    def show_rows(self, rows):
+        """Display the given row positions of the DataFrame, scrolled to the top"""
+        self.rows = rows
+        self.offset = 0
+        self.render()
+
+    def render(self):
+        window = self.rows[self.offset:self.offset + self.height]
+        values = list(self.df.iloc[window].itertuples(index=False, name=None))
+        for i, slot in enumerate(self.slots):
+            self.tree.item(slot, values=values[i] if i < len(values) else ())
+        
+        total = len(self.rows)
+        if total:
+            self.scroll_y.set(self.offset / total, min(1.0, (self.offset + self.height) / total))
+        else:
+            self.scroll_y.set(0.0, 1.0)
+
+    def scroll(self, rows):
+        max_offset = max(0, len(self.rows) - self.height)
+        offset = min(max(0, self.offset + rows), max_offset)
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+
+    def yview(self, *args):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', n, 'units'|'pages')"""
+        if args[0] == 'moveto':
+            self.scroll(int(float(args[1]) * len(self.rows)) - self.offset)
+        elif args[0] == 'scroll':
+            step = self.height if args[2] == 'pages' else 1
+            self.scroll(int(args[1]) * step)
+
+
+# Indicators offered by the compare view, in the order of its checkbox list
+COMPARE_INDICATORS = [
+    'GDP (current US$)', 'GDP per capita (current US$)', 'GDP growth (annual %)',
+    'Population, total', 'Population growth (annual %)', 
+    'Life expectancy at birth, total (years)', 
+    'Imports of goods and services (% of GDP)', 
+    'Exports of goods and services (% of GDP)', 
+    'Total reserves (includes gold, current US$)',
+    'Inflation Rate (%)', 'Inflation Growth Rate (%)',
+    'Government Debt (% of GDP)', 'Debt Growth Rate (%)'
+]
+
+
+Indicator = namedtuple('Indicator', ['source', 'scale', 'unit'])
+
+# Panel column -> source dataset, divisor for display, and the unit after dividing
+INDICATOR_REGISTRY = {
+    'GDP (current US$)': Indicator('econ_data', 1e9, 'Billion US$'),
+    'GDP per capita (current US$)': Indicator('econ_data', 1, 'US$'),
+    'GDP growth (annual %)': Indicator('econ_data', 1, '%'),
+    'Imports of goods and services (% of GDP)': Indicator('econ_data', 1, '% of GDP'),
+    'Exports of goods and services (% of GDP)': Indicator('econ_data', 1, '% of GDP'),
+    'Total reserves (includes gold, current US$)': Indicator('econ_data', 1e9, 'Billion US$'),
+    'Inflation, consumer prices (annual %)': Indicator('econ_data', 1, '%'),
+    'Population, total': Indicator('econ_data', 1e6, 'Million'),
+    'Population growth (annual %)': Indicator('econ_data', 1, '%'),
+    'Life expectancy at birth, total (years)': Indicator('econ_data', 1, 'Years'),
+    'Value of Import (in ? Crore)': Indicator('tax_data', 1, '₹ Crore'),
+    'Growth in Value of Imports ( %)': Indicator('tax_data', 1, '%'),
+    'Net Custom Revenue from Import Duties (in ? Crore)': Indicator('tax_data', 1, '₹ Crore'),
+    'Growth in Revenue from Import Duty (%)': Indicator('tax_data', 1, '%'),
+    'Collection Rates (Percent)': Indicator('tax_data', 1, '%'),
+    'Inflation Rate (%)': Indicator('inflation_data', 1, '%'),
+    'Inflation Growth Rate (%)': Indicator('inflation_data', 1, '%'),
+    'Government Debt (% of GDP)': Indicator('debt_data', 1, '% of GDP'),
+    'Debt Growth Rate (%)': Indicator('debt_data', 1, '%'),
+}
+
+
+def scaled(column, values):
+    """A registry column's values (or a single value) divided by its display scale"""
+    return values / INDICATOR_REGISTRY[column].scale
+
+
+def unit_of(column):
+    """The unit of a registry column's scaled() values"""
+    return INDICATOR_REGISTRY[column].unit
+
+
+class CountryIndex:
+    """econ_data for every country, sorted by (country, year) so each country is one contiguous block"""
+
+    def __init__(self, df):
+        countries = df['Country Name'].astype('category').cat.remove_unused_categories()
+        df = df.assign(**{'Country Name': countries}).sort_values(['Country Name', 'Year'], kind='stable')
+        self.frame = df.set_index(['Country Name', 'Year'])
+        self.countries = list(countries.cat.categories)
+        self.codes = df['Country Name'].cat.codes.to_numpy()
+        self.code_of = {country: code for code, country in enumerate(self.countries)}
+
+    def __contains__(self, country):
+        return country in self.code_of
+
+    def rows(self, country):
+        """Slice of the rows belonging to country (empty when it is unknown)"""
+        code = self.codes.dtype.type(self.code_of.get(country, -1))
+        return slice(np.searchsorted(self.codes, code, side='left'),
+                     np.searchsorted(self.codes, code, side='right'))
+
+    def country(self, country):
+        """One country's rows as a frame with a Year column, like a single-country econ_data"""
+        return self.frame.iloc[self.rows(country)].reset_index(level='Country Name', drop=True).reset_index()
+
+
+def country_datasets(datasets, country_index, country):
+    """The loaded datasets that describe country, with econ_data cut down to its rows"""
+    selected = {}
+    for attr, df in datasets.items():
+        if attr in MULTI_COUNTRY_SOURCES:
+            selected[attr] = country_index.country(country)
+        elif country == DEFAULT_COUNTRY:
+            selected[attr] = df
+    return selected
+
+
+class EconomicPanel:
+    """Every registered indicator for one country on one sorted, float64 frame indexed by year"""
+
+    def __init__(self, datasets, country=DEFAULT_COUNTRY):
+        self.country = country
+        frames = []
+        for source, df in datasets.items():
+            columns = [col for col, spec in INDICATOR_REGISTRY.items()
+                       if spec.source == source and col in df.columns]
+            frames.append(df.set_index('Year')[columns])
+        
+        frame = pd.concat(frames, axis=1).astype('float64').sort_index()
+        self.first_year = int(frame.index.min())
+        self.last_year = int(frame.index.max())
+        frame = frame.reindex(pd.RangeIndex(self.first_year, self.last_year + 1, name='Year'))
+        self.values = np.asfortranarray(frame.to_numpy())
+        # The frame is a view of the same array
+        self.frame = pd.DataFrame(self.values, index=frame.index, columns=frame.columns, copy=False)
+        self.years = self.frame.index.to_numpy()
+        self.column_index = {col: i for i, col in enumerate(self.frame.columns)}
+        
+        valid = self.frame.notna().to_numpy()
+        has_values = valid.any(axis=0)
+        first_rows = valid.argmax(axis=0)
+        last_rows = len(valid) - 1 - valid[::-1].argmax(axis=0)
+        self.spans = {col: (int(self.years[first_rows[i]]), int(self.years[last_rows[i]]))
+                      for i, col in enumerate(self.frame.columns) if has_values[i]}
+
+    def row(self, year):
+        """Row position of a year, clamped to the panel"""
+        return min(max(int(year) - self.first_year, 0), len(self.years) - 1)
+
+    def value(self, year, column):
+        """Value of one indicator in one year (NaN when the year is outside the panel)"""
+        if not self.first_year <= year <= self.last_year:
+            return np.nan
+        return self.values[self.row(year), self.column_index[column]]
+
+    def span(self, columns):
+        """First and last year in which any of the columns has a value, or None when none has any"""
+        spans = [self.spans[col] for col in columns if col in self.spans]
+        if not spans:
+            return None
+        return min(first for first, _ in spans), max(last for _, last in spans)
+
+    def slice(self, columns, start=None, end=None):
+        """Year-indexed frame of the columns, defaulting to the span they cover (empty without one)"""
+        span = self.span(columns)
+        if span is None:
+            return self.frame.iloc[:0][columns]
+        first, last = span
+        start = first if start is None else max(start, first)
+        end = last if end is None else min(end, last)
+        return self.frame.iloc[self.row(start):self.row(end) + 1][columns]
+
+    def column(self, column, start=None, end=None):
+        """(years, values) arrays of one column, over the same default span as slice()"""
+        if column not in self.spans:
+            return self.years[:0], self.values[:0, self.column_index[column]]
+        first, last = self.spans[column]
+        start = first if start is None else max(start, first)
+        end = last if end is None else min(end, last)
+        rows = slice(self.row(start), self.row(end) + 1)
+        return self.years[rows], self.values[rows, self.column_index[column]]
+
+
+def debt_1990_2018(panel):
+    """Debt indicators for 1990-2018, keeping only years with a non-zero debt ratio"""
+    df = panel.slice(['Government Debt (% of GDP)', 'Debt Growth Rate (%)'], 1990, 2018)
+    return df[df['Government Debt (% of GDP)'] > 0]
+
+
+# Derived frames the views plot and summarize: name -> (source datasets, builder from the panel)
+DERIVED_DATASETS = {
+    'debt_1990_2018': (('debt_data',), debt_1990_2018),
+}
+
+
+class CorrelationMatrix:
+    """Prefix-sum tables giving the pairwise-complete correlations of the compare indicators over any year window"""
+
+    PREFIX_RTOL = 1e-8
+    VARIANCE_RTOL = 1e-12
+
+    def __init__(self, frame):
+        self.frame = frame
+        self.indicators = list(frame.columns)
+        self.years = frame.index.to_numpy()
+        
+        values = frame.to_numpy(dtype=float)
+        present = ~np.isnan(values)
+        count = np.maximum(present.sum(axis=0), 1)
+        mean = np.where(present, values, 0.0).sum(axis=0) / count
+        std = np.sqrt((np.where(present, values - mean, 0.0) ** 2).sum(axis=0) / count)
+        self.values = (values - mean) / np.where(std > 0, std, 1.0)
+        x = np.where(present, self.values, 0.0)
+        m = present.astype(float)
+        
+        self.count = self._prefix(m[:, :, None] * m[:, None, :])
+        self.sum_x = self._prefix(x[:, :, None] * m[:, None, :])
+        self.sum_xx = self._prefix((x * x)[:, :, None] * m[:, None, :])
+        self.sum_xy = self._prefix(x[:, :, None] * x[:, None, :])
+
+    @staticmethod
+    def _prefix(a):
+        return np.concatenate([np.zeros((1,) + a.shape[1:]), np.cumsum(a, axis=0)])
+
+    def window(self, start_year, end_year):
+        """Row slice covering the inclusive year range"""
+        lo = np.searchsorted(self.years, start_year, side='left')
+        hi = np.searchsorted(self.years, end_year, side='right')
+        return slice(lo, hi)
+
+    def correlations(self, start_year, end_year, indicators=None):
+        """Pairwise-complete correlation DataFrame of the indicators over the year range"""
+        rows = self.window(start_year, end_year)
+        lo, hi = rows.start, rows.stop
+        n = self.count[hi] - self.count[lo]
+        sx = self.sum_x[hi] - self.sum_x[lo]
+        sxx = self.sum_xx[hi] - self.sum_xx[lo]
+        sxy = self.sum_xy[hi] - self.sum_xy[lo]
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cov = sxy - sx * sx.T / n
+            var_x = sxx - sx * sx / n
+            var_y = sxx.T - sx.T * sx.T / n
+        noise = self.PREFIX_RTOL * (self.sum_xx[hi] + self.sum_xx[lo])
+        if np.any(((var_x <= noise) | (var_y <= noise.T)) & (n >= 2)):
+            cov, var_x, var_y, sxx = self._centred(rows)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            r = cov / np.sqrt(var_x * var_y)
+        r[(n < 2) | (var_x <= self.VARIANCE_RTOL * sxx) | (var_y <= self.VARIANCE_RTOL * sxx.T)] = np.nan
+        r = np.clip(r, -1.0, 1.0)
+        
+        result = pd.DataFrame(r, index=self.indicators, columns=self.indicators)
+        if indicators is not None:
+            result = result.loc[indicators, indicators]
+        return result
+
+    def _centred(self, rows):
+        """Covariance, both variances and sum of x^2 of every pair over rows, each pair centred on its own means"""
+        values = self.values[rows]
+        present = ~np.isnan(values)
+        x = np.where(present, values, 0.0)
+        both = present[:, :, None] & present[:, None, :]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            n = both.sum(axis=0)
+            mean_x = np.where(both, x[:, :, None], 0.0).sum(axis=0) / n
+        dx = np.where(both, x[:, :, None] - mean_x, 0.0)
+        dy = np.where(both, x[:, None, :] - mean_x.T, 0.0)
+        sxx = np.where(both, x[:, :, None] ** 2, 0.0).sum(axis=0)
+        return (dx * dy).sum(axis=0), (dx * dx).sum(axis=0), (dy * dy).sum(axis=0), sxx
+
+
+def summarize(years, values, above=(), below=()):
+    """Summary statistics of one float series and its years, as plain Python numbers"""
+    present = ~np.isnan(values)
+    valid = values[present]
+    if not len(valid):
+        # A country may have no data for an indicator; views show these as n/a (see na())
+        return {'count': 0, 'sum': 0.0, 'mean': np.nan, 'median': np.nan,
+                'max': np.nan, 'max_year': None, 'min': np.nan, 'min_year': None,
+                'first': np.nan, 'first_year': None, 'last': np.nan, 'last_year': None,
+                'above': dict.fromkeys(above, 0), 'below': dict.fromkeys(below, 0)}
+    valid_years = years[present]
+    max_row = int(valid.argmax())
+    min_row = int(valid.argmin())
+    total = float(valid.sum())
+    # valid has no NaN, so one partition gives the median without np.median's own NaN scan and copy
+    n = len(valid)
+    middle = np.partition(valid, [(n - 1) // 2, n // 2])
+    return {
+        'count': n,
+        'sum': total,
+        'mean': total / n,
+        'median': float((middle[(n - 1) // 2] + middle[n // 2]) / 2),
+        'max': float(valid[max_row]),
+        'max_year': int(valid_years[max_row]),
+        'min': float(valid[min_row]),
+        'min_year': int(valid_years[min_row]),
+        'first': float(valid[0]),
+        'first_year': int(valid_years[0]),
+        'last': float(valid[-1]),
+        'last_year': int(valid_years[-1]),
+        'above': {t: int(np.count_nonzero(valid > t)) for t in above},
+        'below': {t: int(np.count_nonzero(valid < t)) for t in below},
+    }
+
+
+def na(value, spec=''):
+    """value formatted with spec, or 'n/a' for a missing (None or NaN) statistic"""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return 'n/a'
+    return format(value, spec)
+
+
+def decade_means(years, values):
+    """{decade's first year: mean of its valid values}, NaN for a decade without any"""
+    present = ~np.isnan(values)
+    decades, groups = np.unique((years // 10) * 10, return_inverse=True)
+    sums = np.bincount(groups[present], weights=values[present], minlength=len(decades))
+    counts = np.bincount(groups[present], minlength=len(decades))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts
+    return dict(zip(decades.tolist(), means.tolist()))
+
+
+def nan_mean(values):
+    """Mean of the non-NaN values, NaN when there are none"""
+    valid = values[~np.isnan(values)]
+    return float(valid.mean()) if len(valid) else np.nan
+
+
+class StatsEngine:
+    """Memoized summary statistics behind the stats panels, invalidated per source dataset"""
+
+    def __init__(self, get_panel):
+        self.get_panel = get_panel
+        self.versions = {}
+        self.cache = {}
+
+    def snapshot(self):
+        """A private engine over the current panel for a worker thread, starting from a copy of the memo"""
+        panel = self.get_panel()
+        engine = StatsEngine(lambda: panel)
+        engine.versions = dict(self.versions)
+        engine.cache = dict(self.cache)
+        return engine
+
+    def invalidate(self, dataset=None):
+        """Mark one dataset (or all of them) as changed"""
+        names = [dataset] if dataset is not None else list(DATA_SOURCES)
+        for name in names:
+            self.versions[name] = self.versions.get(name, 0) + 1
+
+    def _memo(self, key, sources, compute):
+        version = tuple(self.versions.get(name, 0) for name in sources)
+        cached = self.cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        with PROFILER.phase('aggregate'):
+            value = compute()
+        self.cache[key] = (version, value)
+        return value
+
+    def _sources(self, column, frame):
+        if frame is not None:
+            return DERIVED_DATASETS[frame][0]
+        return (INDICATOR_REGISTRY[column].source,)
+
+    def frame(self, name):
+        """A derived frame from DERIVED_DATASETS, built once per data version"""
+        sources, build = DERIVED_DATASETS[name]
+        return self._memo(('frame', name), sources, lambda: build(self.get_panel()))
+
+    def arrays(self, column, frame=None):
+        """(years, float values) of the column over its own span of the panel, or over a derived frame"""
+        if frame is not None:
+            df = self.frame(frame)
+            return df.index.to_numpy(), df[column].to_numpy(dtype='float64')
+        return self.get_panel().column(column)
+
+    def summary(self, column, frame=None, above=(), below=()):
+        """Mean/median/extremes of a column with their years, first and last values, and threshold counts"""
+        return self._memo(('summary', column, frame, tuple(above), tuple(below)), self._sources(column, frame),
+                          lambda: summarize(*self.arrays(column, frame), above, below))
+
+    def decade_means(self, column, frame=None):
+        """{decade's first year: the column's mean over that decade}, in decade order"""
+        return self._memo(('decades', column, frame), self._sources(column, frame),
+                          lambda: decade_means(*self.arrays(column, frame)))
+
+    def mean_between(self, column, start_year, end_year):
+        """Mean of the column over the inclusive year range"""
+        return self._memo(('mean_between', column, start_year, end_year), self._sources(column, None),
+                          lambda: nan_mean(self.get_panel().column(column, start_year, end_year)[1]))
+
+    def correlation_matrix(self):
+        """COMPARE_INDICATORS sliced from the panel into one CorrelationMatrix, missing ones as NaN columns"""
+        def compute():
+            panel = self.get_panel()
+            present = [col for col in COMPARE_INDICATORS if col in panel.column_index]
+            return CorrelationMatrix(panel.slice(present).reindex(columns=COMPARE_INDICATORS))
+        sources = tuple(sorted({INDICATOR_REGISTRY[col].source for col in COMPARE_INDICATORS}))
+        return self._memo(('correlation_matrix',), sources, compute)
+
+
+# Event years on the charts that are not specific to India
+GLOBAL_EVENT_YEARS = {1979, 2008, 2020}
+
+
+# Level of detail for line series: at most this many points per pixel of axes
+# width, and markers only while neighbouring points are this many pixels apart
+LOD_POINTS_PER_PIXEL = 1.0
+MARKER_MIN_SPACING_PX = 5
+# Most year labels an x-axis gets; longer series widen the tick step instead
+MAX_YEAR_TICKS = 32
+# Span factor of one mouse-wheel notch or zoom button press, and the fewest
+# points a zoomed-in year range may show
+PAN_ZOOM_STEP = 1.25
+MIN_VISIBLE_POINTS = 4
+
+
+def minmax_indices(y, buckets):
+    """Indices of the smallest and largest value in each of `buckets` equal runs of y, in order"""
+    n = len(y)
+    size = -(-n // buckets)
+    rows = np.full(size * -(-n // size), np.nan)
+    rows[:n] = y
+    rows = rows.reshape(-1, size)
+    
+    missing = np.isnan(rows)
+    offsets = np.arange(len(rows)) * size
+    valid = ~missing.all(axis=1)
+    lows = np.argmin(np.where(missing, np.inf, rows), axis=1) + offsets
+    highs = np.argmax(np.where(missing, -np.inf, rows), axis=1) + offsets
+    return np.unique(np.concatenate([[0, n - 1], lows[valid], highs[valid]]))
+
+
+class RangeMinMax:
+    """Sparse tables answering min/max of any slice of a fixed array in O(1), ignoring NaN"""
+
+    def __init__(self, values):
+        values = np.asarray(values, dtype=float)
+        self.lows = [np.where(np.isnan(values), np.inf, values)]
+        self.highs = [np.where(np.isnan(values), -np.inf, values)]
+        width = 1
+        while width * 2 <= len(values):
+            self.lows.append(np.minimum(self.lows[-1][:-width], self.lows[-1][width:]))
+            self.highs.append(np.maximum(self.highs[-1][:-width], self.highs[-1][width:]))
+            width *= 2
+
+    def query(self, start, end):
+        """(min, max) of values[start:end], or (nan, nan) when the slice has no values"""
+        if end <= start:
+            return np.nan, np.nan
+        level = int(end - start).bit_length() - 1
+        last = end - (1 << level)
+        low = min(self.lows[level][start], self.lows[level][last])
+        high = max(self.highs[level][start], self.highs[level][last])
+        return (low, high) if low <= high else (np.nan, np.nan)
+
+
+def year_label(years, value, pos=None):
+    """Tick label at x-position value: the year itself, or years[value] when the axis numbers the years"""
+    if value != int(value):
+        return ''
+    if years is None:
+        return f"{int(value)}"
+    return f"{years[int(value)]}" if 0 <= value < len(years) else ''
+
+
+def set_year_ticks(ax, years, step=1, positions=None, rotation=None):
+    """Label whole years, about every step-th over the full range and at most MAX_YEAR_TICKS, following zoom"""
+    # Two more intervals than labels: the locator counts a tick past each end of the view
+    bins = min(MAX_YEAR_TICKS, -(-len(years) // step) + 2)
+    ax.xaxis.set_major_locator(MaxNLocator(nbins=bins, steps=[1, 2, 5, 10], integer=True, min_n_ticks=2))
+    # A partial of a module-level function, so the figure still pickles for exports
+    labels = None if positions is None else tuple(years)
+    ax.xaxis.set_major_formatter(FuncFormatter(functools.partial(year_label, labels)))
+    if rotation is not None:
+        ax.tick_params(axis='x', labelrotation=rotation)
+
+
+def nearest_index(x, value):
+    """Index of the element of the sorted array x closest to value"""
+    index = int(np.searchsorted(x, value))
+    if index == len(x) or (index > 0 and value - x[index - 1] < x[index] - value):
+        index -= 1
+    return index
+
+
+class LevelOfDetailLine:
+    """A line that only holds as many points as its axes can show, keeping each pixel's min and max"""
+
+    def __init__(self, ax, x, y, **kwargs):
+        self.ax = ax
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.marker = kwargs.get('marker')
+        self.range = None
+        x, y = self._visible(self.x[0], self.x[-1]) if len(self.x) else (self.x, self.y)
+        self.line, = ax.plot(x, y, **kwargs)
+        self.line.lod = self  # The callbacks below only hold weak references
+        self._set_marker()
+        ax.callbacks.connect('xlim_changed', self.update)
+        ax.figure.canvas.mpl_connect('resize_event', self.update)
+
+    def _visible(self, lo, hi):
+        start = max(np.searchsorted(self.x, lo, side='left') - 1, 0)
+        end = min(np.searchsorted(self.x, hi, side='right') + 1, len(self.x))
+        x, y = self.x[start:end], self.y[start:end]
+        budget = int(self.ax.bbox.width * LOD_POINTS_PER_PIXEL)
+        if len(x) > budget >= 2:
+            keep = minmax_indices(y, budget // 2)
+            x, y = x[keep], y[keep]
+        return x, y
+
+    def _set_marker(self):
+        if self.marker is None:
+            return
+        count = max(len(self.line.get_xdata()), 1)
+        dense = self.ax.bbox.width / count < MARKER_MIN_SPACING_PX
+        self.line.set_marker('None' if dense else self.marker)
+
+    def extent(self, lo, hi):
+        """(min, max) of the series over lo <= x <= hi, from a RangeMinMax built on first use"""
+        if self.range is None:
+            self.range = RangeMinMax(self.y)
+        return self.range.query(np.searchsorted(self.x, lo, side='left'),
+                                np.searchsorted(self.x, hi, side='right'))
+
+    def update(self, *args):
+        """Resample the series for the current x-limits and axes width"""
+        if not len(self.x):
+            return
+        self.line.set_data(*self._visible(*sorted(self.ax.get_xlim())))
+        self._set_marker()
+
+
+# One hoverable series of a Crosshair: the artist whose visibility it follows, and its sorted points
+HoverSeries = namedtuple('HoverSeries', ['artist', 'axes', 'x', 'y', 'color', 'label'])
+
+
+class Crosshair:
+    """Blitted hover crosshair and value tooltip for the visible series lines and bars of a Tk canvas"""
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.figure = canvas.figure
+        self.background = None
+        self.active = []
+        self._collect()
+        self.connections = [
+            canvas.mpl_connect('draw_event', self.on_draw),
+            canvas.mpl_connect('motion_notify_event', self.on_move),
+            canvas.mpl_connect('figure_leave_event', self.on_leave),
+        ]
+
+    def _collect(self):
+        self.series = []
+        for ax in self.figure.axes:
+            for line in ax.lines:
+                if hasattr(line, 'lod'):
+                    self.series.append(HoverSeries(line, ax, line.lod.x, line.lod.y, line.get_color(),
+                                                   ax.get_ylabel() or line.get_label()))
+            for bars in ax.collections:
+                if hasattr(bars, 'bar_x'):  # Drawn by ChartBuilder.bars
+                    order = np.argsort(bars.bar_x, kind='stable')
+                    self.series.append(HoverSeries(bars, ax, bars.bar_x[order], bars.bar_y[order],
+                                                   bars.get_facecolor()[0], ax.get_ylabel() or bars.get_label()))
+
+        # Added with add_artist so they never take part in autoscaling
+        style = dict(animated=True, visible=False)
+        self.vlines = {ax: ax.add_artist(Line2D([0, 0], [0, 1], transform=ax.get_xaxis_transform(),
+                                                color='#7f8c8d', linewidth=0.8, linestyle=':', **style))
+                       for ax in {series.axes for series in self.series}}
+        self.points = [series.axes.add_artist(Line2D([], [], marker='o', color=series.color,
+                                                     markersize=6, markeredgecolor='white', **style))
+                       for series in self.series]
+        self.tooltip = self.figure.text(0, 0, '', transform=IdentityTransform(), fontsize=9,
+                                        va='bottom', bbox=dict(boxstyle='round,pad=0.4', fc='white',
+                                                               ec='#7f8c8d', alpha=0.9), **style)
+
+    def refresh(self):
+        """Pick up series drawn after attaching, such as the bars of a first switch to Bar"""
+        for artist in self.artists():
+            artist.remove()
+        self.active = []
+        self._collect()
+
+    def disconnect(self):
+        for cid in self.connections:
+            self.canvas.mpl_disconnect(cid)
+        self.connections = []
+
+    def artists(self):
+        return list(self.vlines.values()) + self.points + [self.tooltip]
+
+    def on_draw(self, event):
+        # A full draw leaves the animated artists out, which is exactly the background we need
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        for artist in self.artists():
+            artist.set_visible(False)
+        self.active = []
+
+    def on_leave(self, event):
+        if self.active:
+            self.active = []
+            for artist in self.artists():
+                artist.set_visible(False)
+            self.blit()
+
+    def on_move(self, event):
+        if event.x is None:
+            return
+        if self.background is None:
+            # Attached after the canvas' first draw, which left the last render in place
+            self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        hovered = [i for i, series in enumerate(self.series)
+                   if series.artist.get_visible() and series.axes.bbox.contains(event.x, event.y)
+                   and len(series.x)]
+        if not hovered:
+            self.on_leave(event)
+            return
+        snapped = [(i, nearest_index(self.series[i].x, self.series[i].axes.transData.inverted().transform(
+                       (event.x, event.y))[0])) for i in hovered]
+        if snapped == self.active:
+            return  # Still on the same year: the blitted overlay is already right
+        self.active = snapped
+
+        rows = []
+        for artist in self.artists():
+            artist.set_visible(False)
+        for i, index in snapped:
+            series = self.series[i]
+            x, y = series.x[index], series.y[index]
+            self.vlines[series.axes].set_xdata([x, x])
+            self.vlines[series.axes].set_visible(True)
+            if not np.isnan(y):
+                self.points[i].set_data([x], [y])
+                self.points[i].set_visible(True)
+            rows.append(f"{series.label}: {y:,.2f}" if not np.isnan(y) else f"{series.label}: n/a")
+
+        series, index = self.series[snapped[0][0]], snapped[0][1]
+        x, y = series.x[index], series.y[index]
+        anchor = series.axes.transData.transform((x, y if not np.isnan(y) else 0))
+        self.tooltip.set_text("\n".join([f"{x:.0f}"] + rows))
+        self.tooltip.set_position(self._tooltip_position(anchor[0], event.y if np.isnan(y) else anchor[1]))
+        self.tooltip.set_visible(True)
+        self.blit()
+
+    def _tooltip_position(self, x, y):
+        """Right of and above the snapped point, flipped when that would leave the figure"""
+        right = x < self.figure.bbox.width * 0.7
+        above = y < self.figure.bbox.height * 0.7
+        self.tooltip.set_ha('left' if right else 'right')
+        self.tooltip.set_va('bottom' if above else 'top')
+        return x + (12 if right else -12), y + (12 if above else -12)
+
+    def blit(self):
+        self.canvas.restore_region(self.background)
+        for artist in self.artists():
+            if artist.get_visible():
+                self.figure.draw_artist(artist)
+        self.canvas.blit(self.figure.bbox)
+
+
+class PanZoom:
+    """Mouse-wheel zoom and drag pan along the year axis of a canvas' series charts; a double click resets"""
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.series = {}
+        for ax in canvas.figure.axes:
+            for line in ax.lines:
+                if hasattr(line, 'lod') and len(line.lod.x):
+                    self.series.setdefault(ax, []).append(line.lod)
+        self.home = {ax: (ax.get_xlim(), ax.get_ylim()) for ax in self.series}
+        self.drag = None
+        self.connections = [
+            canvas.mpl_connect('scroll_event', self.on_scroll),
+            canvas.mpl_connect('button_press_event', self.on_press),
+            canvas.mpl_connect('motion_notify_event', self.on_drag),
+            canvas.mpl_connect('button_release_event', self.on_release),
+        ]
+
+    def disconnect(self):
+        for cid in self.connections:
+            self.canvas.mpl_disconnect(cid)
+        self.connections = []
+
+    def _axes_at(self, event):
+        if event.x is None:
+            return None
+        return next((ax for ax in self.series if ax.bbox.contains(event.x, event.y)), None)
+
+    def _min_span(self, ax):
+        return max(MIN_VISIBLE_POINTS * (lod.x[-1] - lod.x[0]) / max(len(lod.x) - 1, 1)
+                   for lod in self.series[ax])
+
+    def set_xlim(self, ax, lo, hi):
+        """Clamp the year range to the initial view and apply it, refitting every y-range"""
+        home_lo, home_hi = self.home[ax][0]
+        span = min(max(hi - lo, self._min_span(ax)), home_hi - home_lo)
+        lo = min(max(lo, home_lo), home_hi - span)
+        ax.set_xlim(lo, lo + span)  # Shared and twin axes follow
+        self.fit_y()
+        self.canvas.draw_idle()
+
+    def fit_y(self):
+        for ax, series in self.series.items():
+            lo, hi = ax.get_xlim()
+            extents = np.array([lod.extent(lo, hi) for lod in series])
+            if np.isnan(extents).all():
+                continue
+            low, high = np.nanmin(extents[:, 0]), np.nanmax(extents[:, 1])
+            home_low, home_high = self.home[ax][1]
+            if home_low <= 0 <= home_high:
+                low, high = min(low, 0), max(high, 0)
+            pad = (high - low) * 0.05 or abs(high) * 0.05 or 1.0
+            ax.set_ylim(low - pad if low != 0 else 0, high + pad if high != 0 else 0)
+
+    def zoom(self, factor, ax=None, center=None):
+        """Scale the year range by factor around center (default: its middle)"""
+        ax = ax or next(iter(self.series), None)
+        if ax is None:
+            return
+        lo, hi = ax.get_xlim()
+        center = (lo + hi) / 2 if center is None else center
+        self.set_xlim(ax, center - (center - lo) * factor, center + (hi - center) * factor)
+
+    def rehome(self):
+        """Take the current y-ranges as the home view after a chart type switch, refitting them if zoomed"""
+        self.home = {ax: (xlim, ax.get_ylim()) for ax, (xlim, _) in self.home.items()}
+        if any(tuple(ax.get_xlim()) != tuple(xlim) for ax, (xlim, _) in self.home.items()):
+            self.fit_y()
+
+    def reset(self):
+        for ax, (xlim, ylim) in self.home.items():
+            ax.set_xlim(xlim)
+            ax.set_ylim(ylim)
+        self.canvas.draw_idle()
+
+    def on_scroll(self, event):
+        ax = self._axes_at(event)
+        if ax is not None:
+            center = ax.transData.inverted().transform((event.x, event.y))[0]
+            self.zoom(PAN_ZOOM_STEP ** -event.step, ax, center)
+
+    def on_press(self, event):
+        ax = self._axes_at(event)
+        if ax is None or event.button != 1:
+            return
+        if event.dblclick:
+            self.reset()
+        else:
+            self.drag = (ax, event.x, ax.get_xlim())
+
+    def on_drag(self, event):
+        if self.drag is None or event.x is None:
+            return
+        ax, start_x, (lo, hi) = self.drag
+        # Measured in pixels from the press, so redraws mid-drag cannot feed back
+        shift = (event.x - start_x) * (hi - lo) / ax.bbox.width
+        self.set_xlim(ax, lo - shift, hi - shift)
+
+    def on_release(self, event):
+        self.drag = None
+
+
+class ChartBuilder:
+    """Draws each dashboard chart onto a Figure it is handed, for the Tk views and the headless renderer alike"""
+
+    FIGSIZES = {
+        'gdp_overview': (12, 6),
+        'population_life_expectancy': (12, 8),
+        'inflation_trends': (12, 8),
+        'import_export': (12, 3),
+        'foreign_reserves': (10, 6),
+        'tax_revenue': (10, 5),
+        'tax_collection_rates': (10, 5),
+        'tax_growth': (10, 5),
+        'government_debt': (10, 8),
+        'growth_indicators': (12, 10),
+    }
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    @property
+    def panel(self):
+        return self.stats.get_panel()
+
+    def line(self, ax, x, y, **kwargs):
+        """ax.plot for one series, resampled to the axes' pixel width"""
+        return LevelOfDetailLine(ax, x, y, **kwargs).line
+
+    def bars(self, ax, x, heights, width=0.8, **kwargs):
+        """Bars from zero to heights as one PolyCollection, far cheaper to build and draw than ax.bar's Rectangles"""
+        x = np.asarray(x, dtype=float)
+        heights = np.asarray(heights, dtype=float)
+        drawn = ~np.isnan(heights)
+        left, right, top = x[drawn] - width / 2, x[drawn] + width / 2, heights[drawn]
+        zero = np.zeros_like(top)
+        verts = np.stack([np.column_stack([left, zero]), np.column_stack([left, top]),
+                          np.column_stack([right, top]), np.column_stack([right, zero])], axis=1)
+        bars = PolyCollection(verts, linewidths=0, **kwargs)
+        bars.sticky_edges.y.append(0)
+        ax.add_collection(bars)
+        bars.bar_x, bars.bar_y = x, heights  # Bar centres and tops, for Crosshair
+        return bars
+
+    def tight_layout(self, fig):
+        with PROFILER.phase('tight_layout'):
+            fig.tight_layout()
+
+    @staticmethod
+    def set_chart_type(chart_artists, chart_type):
+        """Show the artists a builder returned for chart_type and hide the others, drawing a deferred type first"""
+        if callable(chart_artists[chart_type]):
+            chart_artists[chart_type] = chart_artists[chart_type]()
+        for kind, entry in chart_artists.items():
+            if callable(entry):
+                continue
+            artists, limits = entry
+            visible = kind == chart_type
+            for artist in artists:
+                artist.set_visible(visible)
+            if visible:
+                for ax, ylim in limits:
+                    ax.set_ylim(ylim)
+
+    @staticmethod
+    def autoscale_y(*axes):
+        """Refit each axes' y-range to its data limits; returns [(ax, ylim)]"""
+        for ax in axes:
+            ax.set_autoscaley_on(True)
+            ax.autoscale_view(scalex=False)
+        return [(ax, ax.get_ylim()) for ax in axes]
+
+    def events(self, events):
+        """The (year, label) annotations that apply to the panel's country"""
+        if self.panel.country == DEFAULT_COUNTRY:
+            return events
+        return [(year, label) for year, label in events if year in GLOBAL_EVENT_YEARS]
+
+    @PROFILER.timed('artists')
+    def gdp_overview(self, fig):
+        """GDP and GDP per capita on twin axes"""
+        data = self.panel.slice(['GDP (current US$)', 'GDP per capita (current US$)'])
+        gdp_max = scaled('GDP (current US$)', self.stats.summary('GDP (current US$)')['max'])
+        gdp_per_capita_max = self.stats.summary('GDP per capita (current US$)')['max']
+
+        ax = fig.subplots()
+        self.line(ax, data.index, scaled('GDP (current US$)', data['GDP (current US$)']),
+                marker='o', linestyle='-', color='#3498db', linewidth=2)
+        ax.grid(True, linestyle='--', alpha=0.7)
+        ax.set_xlabel('Year', fontsize=12, fontweight='bold')
+        ax.set_ylabel(f"GDP ({unit_of('GDP (current US$)')})", fontsize=12, fontweight='bold')
+        ax.set_title(f'{self.panel.country} GDP Trend (1960-2020)', fontsize=14, fontweight='bold')
+        set_year_ticks(ax, data.index, 5)
+        ax.tick_params(axis='both', labelsize=10)
+
+        events = [
+            (1991, "Economic Liberalization"),
+            (2008, "Global Financial Crisis"),
+            (2016, "Demonetization"),
+            (2020, "COVID-19 Pandemic")
+        ]
+
+        for year, event in self.events(events):
+            event_gdp = scaled('GDP (current US$)', self.panel.value(year, 'GDP (current US$)'))
+            if not np.isnan(event_gdp):
+                ax.annotate(event, xy=(year, event_gdp), xytext=(0, 20),
+                          textcoords='offset points', ha='center', va='bottom',
+                          bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.5),
+                          arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0.3'))
+
+        ax2 = ax.twinx()
+        self.line(ax2, data.index, data['GDP per capita (current US$)'],
+                marker='^', linestyle='--', color='#e74c3c', linewidth=2)
+        ax2.set_ylabel('GDP per Capita (US$)', fontsize=12, fontweight='bold', color='#e74c3c')
+        ax2.tick_params(axis='y', labelcolor='#e74c3c')
+
+        # A country without any GDP values keeps matplotlib's default limits
+        if np.isfinite(gdp_max):
+            ax.set_ylim(0, gdp_max)
+        if np.isfinite(gdp_per_capita_max):
+            ax2.set_ylim(0, gdp_per_capita_max)
+
+        ax.legend([f"GDP ({unit_of('GDP (current US$)')})", 'GDP per Capita (US$)'], loc='upper left')
+        self.tight_layout(fig)
+        return ax, ax2
+
+    @PROFILER.timed('artists')
+    def population_life_expectancy(self, fig):
+        """Population with its growth rate above life expectancy"""
+        data = self.panel.slice(['Population, total', 'Population growth (annual %)',
+                                 'Life expectancy at birth, total (years)'])
+
+        ax1, ax2 = fig.subplots(2, 1, sharex=True)
+
+        self.line(ax1, data.index, scaled('Population, total', data['Population, total']),
+                marker='o', linestyle='-', color='#3498db', linewidth=2)
+        ax1.set_ylabel(f"Population ({unit_of('Population, total')})", fontsize=12, fontweight='bold')
+        ax1.set_title(f'{self.panel.country} Population Growth (1960-2020)', fontsize=14, fontweight='bold')
+        ax1.grid(True, linestyle='--', alpha=0.7)
+
+        ax1_twin = ax1.twinx()
+        self.line(ax1_twin, data.index, data['Population growth (annual %)'],
+                     marker='^', linestyle='--', color='#e74c3c', linewidth=2)
+        ax1_twin.set_ylabel('Population Growth Rate (%)', fontsize=12, fontweight='bold', color='#e74c3c')
+        ax1_twin.tick_params(axis='y', labelcolor='#e74c3c')
+
+        ax1.legend(['Population'], loc='upper left')
+        ax1_twin.legend(['Growth Rate'], loc='upper right')
+
+        self.line(ax2, data.index, data['Life expectancy at birth, total (years)'],
+                marker='s', linestyle='-', color='#2ecc71', linewidth=2)
+        ax2.set_xlabel('Year', fontsize=12, fontweight='bold')
+        ax2.set_ylabel('Life Expectancy (Years)', fontsize=12, fontweight='bold')
+        ax2.set_title('Life Expectancy at Birth (1960-2020)', fontsize=14, fontweight='bold')
+        ax2.grid(True, linestyle='--', alpha=0.7)
+
+        set_year_ticks(ax2, data.index, 5)
+
+        self.tight_layout(fig)
+        return ax1, ax2
+
+    @PROFILER.timed('artists')
+    def inflation_trends(self, fig):
+        """Inflation and its annual change, drawn both as lines and as bars"""
+        data = self.panel.slice(['Inflation Rate (%)', 'Inflation Growth Rate (%)'])
+        if data.empty:
+            return None
+
+        ax1, ax2 = fig.subplots(2, 1, sharex=True)
+
+        # The bars are only drawn on the first switch to Bar; after that the selector toggles visibility
+        line_artists = [
+            self.line(ax1, data.index, data['Inflation Rate (%)'],
+                marker='o', linestyle='-', color='#e74c3c', linewidth=2),
+            self.line(ax2, data.index, data['Inflation Growth Rate (%)'],
+                marker='s', linestyle='--', color='#2ecc71', linewidth=2),
+        ]
+
+        ax1.axhline(y=5, color='green', linestyle='--', alpha=0.7, label='Moderate Inflation (5%)')
+        ax1.axhline(y=10, color='orange', linestyle='--', alpha=0.7, label='High Inflation (10%)')
+        ax1.grid(True, linestyle='--', alpha=0.7)
+        ax1.set_ylabel('Inflation Rate (%)', fontsize=12, fontweight='bold')
+        ax1.set_title('India Inflation Trends (1960-2022)', fontsize=14, fontweight='bold')
+        ax1.legend(loc='upper right')
+
+        ax2.axhline(y=0, color='black', linestyle='-', alpha=0.3)
+        ax2.grid(True, linestyle='--', alpha=0.7)
+        ax2.set_xlabel('Year', fontsize=12, fontweight='bold')
+        ax2.set_ylabel('Inflation Growth Rate (%)', fontsize=12, fontweight='bold')
+        ax2.set_title('Annual Change in Inflation Rate (1960-2022)', fontsize=14, fontweight='bold')
+        line_limits = [(ax1, ax1.get_ylim()), (ax2, ax2.get_ylim())]
+
+        def draw_bars():
+            bar_artists = [
+                self.bars(ax1, data.index, data['Inflation Rate (%)'],
+                    facecolor='#e74c3c', alpha=0.7, width=0.6),
+                self.bars(ax2, data.index, data['Inflation Growth Rate (%)'],
+                    facecolor='#2ecc71', alpha=0.7, width=0.6),
+            ]
+            return bar_artists, self.autoscale_y(ax1, ax2)
+
+        set_year_ticks(ax2, data.index, 5)
+
+        self.tight_layout(fig)
+        return {"Line": (line_artists, line_limits), "Bar": draw_bars}
+
+    @PROFILER.timed('artists')
+    def import_export(self, fig):
+        """Imports, exports and the trade balance as a share of GDP"""
+        imports_col = 'Imports of goods and services (% of GDP)'
+        exports_col = 'Exports of goods and services (% of GDP)'
+        data = self.panel.slice([imports_col, exports_col])
+
+        ax = fig.subplots()
+
+        self.line(ax, data.index, data[imports_col],
+            marker='o', linestyle='-', color='#3498db', linewidth=2, label='Imports (% of GDP)')
+
+        self.line(ax, data.index, data[exports_col],
+            marker='s', linestyle='-', color='#2ecc71', linewidth=2, label='Exports (% of GDP)')
+
+        trade_balance = data[exports_col] - data[imports_col]
+        self.line(ax, data.index, trade_balance,
+            marker='^', linestyle='--', color='#e74c3c', linewidth=1.5, label='Trade Balance (% of GDP)')
+
+        ax.axhline(y=0, color='black', linestyle='-', alpha=0.3)
+
+        ax.grid(True, linestyle='--', alpha=0.7)
+
+        ax.set_xlabel('Year', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Percentage of GDP', fontsize=12, fontweight='bold')
+        ax.set_title(f'{self.panel.country} Import/Export Trends (1960-2020)', fontsize=14, fontweight='bold')
+
+        set_year_ticks(ax, data.index, 5)
+
+        ax.legend(loc='upper left')
+
+        events = [
+            (1991, "Economic Liberalization"),
+            (2000, "Y2K & IT Boom"),
+            (2008, "Global Financial Crisis"),
+            (2020, "COVID-19 Pandemic")
+        ]
+
+        for year, event in self.events(events):
+            event_imports = self.panel.value(year, imports_col)
+            if not np.isnan(event_imports):
+                ax.annotate(event, xy=(year, event_imports), xytext=(0, 20),
+                        textcoords='offset points', ha='center', va='bottom',
+                        bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.5),
+                        arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0.3'))
+
+        self.tight_layout(fig)
+        return ax
+
+    @PROFILER.timed('artists')
+    def foreign_reserves(self, fig):
+        """Total foreign reserves, in the registry's display unit"""
+        reserves_col = 'Total reserves (includes gold, current US$)'
+        data = self.panel.slice([reserves_col])
+
+        ax = fig.subplots()
+        self.line(ax, data.index, scaled(reserves_col, data[reserves_col]),
+                marker='o', linestyle='-', color='#f39c12', linewidth=2)
+
+        ax.grid(True, linestyle='--', alpha=0.7)
+        ax.set_xlabel('Year', fontsize=12, fontweight='bold')
+        ax.set_ylabel(f"Foreign Reserves ({unit_of(reserves_col)})", fontsize=12, fontweight='bold')
+        ax.set_title(f'{self.panel.country} Foreign Reserves (1960-2020)', fontsize=14, fontweight='bold')
+        set_year_ticks(ax, data.index, 5)
+        return ax
+
+    def _tax_data(self):
+        return self.panel.slice(['Value of Import (in ? Crore)', 'Growth in Value of Imports ( %)',
+                                 'Net Custom Revenue from Import Duties (in ? Crore)',
+                                 'Growth in Revenue from Import Duty (%)', 'Collection Rates (Percent)'])
+
+    @PROFILER.timed('artists')
+    def tax_revenue(self, fig):
+        """Net custom revenue from import duties per year"""
+        data = self._tax_data()
+
+        ax = fig.subplots()
+        ax.bar(data.index, data['Net Custom Revenue from Import Duties (in ? Crore)'],
+               color='#3498db')
+
+        ax.grid(True, linestyle='--', alpha=0.7, axis='y')
+        ax.set_xlabel('Year', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Revenue (₹ Crore)', fontsize=12, fontweight='bold')
+        ax.set_title('Net Custom Revenue from Import Duties (2000-2017)', fontsize=14, fontweight='bold')
+
+        set_year_ticks(ax, data.index, rotation=45)
+
+        self.tight_layout(fig)
+        return ax
+
+    @PROFILER.timed('artists')
+    def tax_collection_rates(self, fig):
+        """Import duty collection rates per year"""
+        data = self._tax_data()
+
+        ax = fig.subplots()
+        self.line(ax, data.index, data['Collection Rates (Percent)'],
+                marker='o', linestyle='-', color='#e74c3c', linewidth=2)
+
+        ax.grid(True, linestyle='--', alpha=0.7)
+        ax.set_xlabel('Year', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Collection Rate (%)', fontsize=12, fontweight='bold')
+        ax.set_title('Import Duties Collection Rates (2000-2017)', fontsize=14, fontweight='bold')
+
+        set_year_ticks(ax, data.index, rotation=45)
+
+        self.tight_layout(fig)
+        return ax
+
+    @PROFILER.timed('artists')
+    def tax_growth(self, fig):
+        """Import value growth against import duty revenue growth"""
+        data = self._tax_data()
+
+        ax = fig.subplots()
+
+        width = 0.35
+        indices = range(len(data) - 1)
+
+        ax.bar([i - width/2 for i in indices], data['Growth in Value of Imports ( %)'].iloc[1:],
+               width, color='#3498db', label='Import Value Growth (%)')
+
+        ax.bar([i + width/2 for i in indices], data['Growth in Revenue from Import Duty (%)'].iloc[1:],
+               width, color='#e74c3c', label='Import Revenue Growth (%)')
+
+        ax.grid(True, linestyle='--', alpha=0.7, axis='y')
+        ax.set_xlabel('Year', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Growth Rate (%)', fontsize=12, fontweight='bold')
+        ax.set_title('Comparison of Import Value vs. Revenue Growth (2001-2017)', fontsize=14, fontweight='bold')
+
+        set_year_ticks(ax, data.index[1:], positions=indices, rotation=45)
+
+        ax.legend()
+
+        self.tight_layout(fig)
+        return ax
+
+    @PROFILER.timed('artists')
+    def government_debt(self, fig):
+        """Debt as a share of GDP and its annual change, drawn both as lines and as bars"""
+        # Filter data for 1990-2018 (non-zero debt values)
+        data = self.stats.frame('debt_1990_2018')
+        if data.empty:
+            return None
+
+        ax1, ax2 = fig.subplots(2, 1, sharex=True)
+
+        line_artists = [
+            self.line(ax1, data.index, data['Government Debt (% of GDP)'],
+                marker='o', linestyle='-', color='#f39c12', linewidth=2),
+            self.line(ax2, data.index, data['Debt Growth Rate (%)'],
+                marker='s', linestyle='--', color='#9b59b6', linewidth=2),
+        ]
+
+        ax1.axhline(y=60, color='red', linestyle='--', alpha=0.7, label='High Debt Threshold (60%)')
+        ax1.grid(True, linestyle='--', alpha=0.7)
+        ax1.set_ylabel('Debt (% of GDP)', fontsize=12, fontweight='bold')
+        ax1.set_title('India Government Debt as % (1990-2018)', fontsize=14, fontweight='bold')
+        ax1.legend(loc='upper right')
+
+        ax2.axhline(y=0, color='black', linestyle='-', alpha=0.3)
+        ax2.grid(True, linestyle='--', alpha=0.7)
+        ax2.set_xlabel('Year', fontsize=12, fontweight='bold')
+        ax2.set_ylabel('Debt Growth Rate (%)', fontsize=12, fontweight='bold')
+        ax2.set_title('Annual Change in Government Debt (1990-2018)', fontsize=14, fontweight='bold')
+        line_limits = [(ax1, ax1.get_ylim()), (ax2, ax2.get_ylim())]
+
+        def draw_bars():
+            bar_artists = [
+                self.bars(ax1, data.index, data['Government Debt (% of GDP)'],
+                   facecolor='#f39c12', alpha=0.7),
+                self.bars(ax2, data.index, data['Debt Growth Rate (%)'],
+                   facecolor='#9b59b6', alpha=0.7),
+            ]
+            return bar_artists, self.autoscale_y(ax1, ax2)
+
+        set_year_ticks(ax2, data.index, 2)  # Every 2 years for clarity
+
+        self.tight_layout(fig)
+        return {"Line": (line_artists, line_limits), "Bar": draw_bars}
+
+    @PROFILER.timed('artists')
+    def growth_indicators(self, fig):
+        """GDP growth with major events above the inflation rate"""
+        growth_data = self.panel.slice(['GDP growth (annual %)'])
+        inflation_data = self.panel.slice(['Inflation Rate (%)'])
+
+        ax1, ax2 = fig.subplots(2, 1, sharex=True)
+
+        self.line(ax1, growth_data.index, growth_data['GDP growth (annual %)'],
+                marker='o', linestyle='-', color='#3498db', linewidth=2)
+
+        ax1.axhline(y=0, color='black', linestyle='-', alpha=0.3)
+
+        ax1.grid(True, linestyle='--', alpha=0.7)
+
+        ax1.set_ylabel('GDP Growth Rate (%)', fontsize=12, fontweight='bold')
+        ax1.set_title('GDP Annual Growth Rate (1960-2020)', fontsize=14, fontweight='bold')
+
+        events = [
+            (1979, "Oil Crisis"),
+            (1991, "Economic Liberalization"),
+            (2008, "Global Financial Crisis"),
+            (2016, "Demonetization"),
+            (2020, "COVID-19 Pandemic")
+        ]
+
+        for year, event in self.events(events):
+            growth = self.panel.value(year, 'GDP growth (annual %)')
+            if not np.isnan(growth):
+                ax1.annotate(event, xy=(year, growth), xytext=(0, 15 if growth > 0 else -15),
+                           textcoords='offset points', ha='center', va='bottom' if growth > 0 else 'top',
+                           bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.5),
+                           arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0.3'))
+
+        self.line(ax2, inflation_data.index, inflation_data['Inflation Rate (%)'],
+                marker='s', linestyle='-', color='#e74c3c', linewidth=2)
+
+        ax2.axhline(y=0, color='black', linestyle='-', alpha=0.3)
+
+        ax2.grid(True, linestyle='--', alpha=0.7)
+
+        ax2.set_xlabel('Year', fontsize=12, fontweight='bold')
+        ax2.set_ylabel('Inflation Rate (%)', fontsize=12, fontweight='bold')
+        ax2.set_title('Inflation Rate (1960-2022)', fontsize=14, fontweight='bold')
+
+        set_year_ticks(ax2, inflation_data.index, 5)
+
+        self.tight_layout(fig)
+        return ax1, ax2
+
+
+# View -> datasets it needs, used to enable the sidebar buttons and to pick what can be rendered
+VIEW_DATASETS = {
+    'gdp_overview': ('econ_data',),
+    'population_life_expectancy': ('econ_data',),
+    'inflation_trends': ('inflation_data',),
+    'import_export': ('econ_data',),
+    'tax_analysis': ('tax_data',),
+    'government_debt': ('debt_data',),
+    'growth_indicators': ('econ_data', 'inflation_data'),
+    'compare_indicators': ('econ_data', 'inflation_data', 'debt_data'),
+    'data_table': tuple(DATA_SOURCES),
+}
+
+# Views whose chart goes through draw_cached_chart, with the parameters they open with;
+# these can be prefetched into the image cache. The chart name is the view name
+PREFETCH_VIEWS = {
+    'gdp_overview': {},
+    'population_life_expectancy': {},
+    'inflation_trends': {'chart_type': 'Line'},
+    'government_debt': {'chart_type': 'Line'},
+    'growth_indicators': {},
+}
+
+# Chart types the Line/Bar views can show; the first is what they open with
+CHART_TYPES = ['Line', 'Bar']
+
+# Charts written by the headless renderer for each view, in tab order
+RENDER_VIEWS = {
+    'gdp_overview': ['gdp_overview'],
+    'population_life_expectancy': ['population_life_expectancy'],
+    'inflation_trends': ['inflation_trends'],
+    'import_export': ['import_export', 'foreign_reserves'],
+    'tax_analysis': ['tax_revenue', 'tax_collection_rates', 'tax_growth'],
+    'government_debt': ['government_debt'],
+    'growth_indicators': ['growth_indicators'],
+}
+
+_render_charts = None
+
+
+def _init_render_worker(country):
+    """Load the datasets once per worker process and build its ChartBuilder for country"""
+    global _render_charts
+    cache = DataCache()
+    datasets = {attr: load_dataset(cache, attr) for attr in DATA_SOURCES}
+    panel = EconomicPanel(country_datasets(datasets, CountryIndex(datasets['econ_data']), country), country)
+    _render_charts = ChartBuilder(StatsEngine(lambda: panel))
+
+
+def render_view(view, out_dir, formats=('png',), dpi=100, chart_types=CHART_TYPES[:1]):
+    """Render every chart of one view to out_dir, once per chart type; returns (view, seconds, written paths)"""
+    start = time.perf_counter()
+    written = []
+    for name in RENDER_VIEWS[view]:
+        fig = Figure(figsize=ChartBuilder.FIGSIZES[name])
+        FigureCanvasAgg(fig)
+        chart_artists = getattr(_render_charts, name)(fig)
+        if chart_artists is None:
+            continue
+        variants = [(chart_type, name if len(chart_types) == 1 else f"{name}_{chart_type.lower()}")
+                    for chart_type in chart_types] if isinstance(chart_artists, dict) else [(None, name)]
+        for chart_type, file_name in variants:
+            if chart_type is not None:
+                ChartBuilder.set_chart_type(chart_artists, chart_type)
+            for fmt in formats:
+                path = os.path.join(out_dir, f"{file_name}.{fmt}")
+                fig.savefig(path, dpi=dpi)
+                written.append(path)
+    return view, time.perf_counter() - start, written
+
+
+def render_chart_image(charts, name, chart_type=None, dpi=None, size=None):
+    """Draw one chart on an off-screen Agg figure; returns its RGBA pixels, or None without data"""
+    fig = Figure(figsize=ChartBuilder.FIGSIZES[name], dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    chart_artists = getattr(charts, name)(fig)
+    if chart_artists is None:
+        return None
+    if chart_type is not None:
+        ChartBuilder.set_chart_type(chart_artists, chart_type)
+    if size is not None:
+        # Stretched after building, as the Tk canvas stretches the live figure to its frame
+        fig.set_size_inches(size[0] / fig.dpi, size[1] / fig.dpi)
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba()).copy()
+
+
+def render_all(out_dir, views=None, formats=('png',), dpi=100, jobs=None, country=DEFAULT_COUNTRY,
+               chart_types=CHART_TYPES[:1]):
+    """Render views in parallel on a process pool, without a Tk root; returns {view: seconds}"""
+    os.makedirs(out_dir, exist_ok=True)
+    views = list(views or RENDER_VIEWS)
+    # Fill the cache here first, so the workers all read it instead of each parsing and writing the same entries
+    cache = DataCache()
+    datasets = {attr: load_dataset(cache, attr) for attr in DATA_SOURCES}
+    if country != DEFAULT_COUNTRY:
+        if country not in CountryIndex(datasets['econ_data']):
+            raise ValueError(f"{country} does not appear in {DATA_SOURCES['econ_data'][0]}")
+        views = [view for view in views if set(VIEW_DATASETS[view]) <= MULTI_COUNTRY_SOURCES]
+    timings = {}
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_render_worker, initargs=(country,)) as pool:
+        futures = [pool.submit(render_view, view, out_dir, tuple(formats), dpi, tuple(chart_types))
+                   for view in views]
+        for future in as_completed(futures):
+            view, seconds, written = future.result()
+            timings[view] = seconds
+            print(f"{view:<28} {seconds * 1000:8.1f} ms  {len(written)} file(s)")
+
+    with open(os.path.join(out_dir, 'render_times.json'), 'w') as f:
+        json.dump({view: round(timings[view], 4) for view in views}, f, indent=2)
+    return timings
+
 
 class IndianEconomyDashboard:
     def __init__(self, root):
@@ -30,69 +2522,254 @@ class IndianEconomyDashboard:
             'header_bg': '#1e88e5', 'header_fg': '#cccccc'
         }
         
-        try:
-            self.load_data()
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load data: {str(e)}")
-            root.destroy()
-            return
-            
+        # Datasets are filled in by the background loader
+        self.econ_data = None
+        self.tax_data = None
+        self.inflation_data = None
+        self.debt_data = None
+        self.datasets_ready = set()
+        # Row counts of the loaded datasets for profile records, replaced (never mutated) on the Tk thread
+        self.dataset_rows = {}
+        self.pending_datasets = set(DATA_SOURCES)
+        self.data_versions = {}
+        
+        # One panel and stats engine per country, built on first selection and kept until the data changes
+        self.country_index = None
+        self.panels = {}
+        self.engines = {}
+        self.country = DEFAULT_COUNTRY
+        self.panel = None
+        self.stats = self.stats_for(self.country)
+        self.charts = ChartBuilder(self.stats)
+        
+        self.current_view = None
         self.current_chart = None
         self.canvas = None
+        self.pending_tabs = {}
+        self.tabs = None
+        self.chart_placeholder = None
+        # Pixel size each view's chart was last laid out at, and the latest of any view
+        self.chart_sizes = {}
+        self.chart_size = None
+        # (canvas, callback id) waiting to store a live chart's first full-size drawing
+        self.chart_caching = None
+        # Set by a view that can take changed data in place; otherwise refresh_view() rebuilds it
+        self.view_refresh = None
+        # Control values a view being rebuilt by refresh_view() starts from instead of its defaults
+        self.view_seed = {}
+        self.figures = FigureManager()
+        self.exports = ExportQueue()
+        self.images = ImageCache()
+        self.prefetcher = Prefetcher(self.root, self.images)
+        self.watcher = SourceWatcher()
+        # view -> {next view: times opened right after it}, to rank prefetching
+        self.navigation = defaultdict(lambda: defaultdict(int))
+        
+        if PROFILER.enabled:
+            # Time every view as one record; must happen before setup_ui binds the buttons
+            for name in dir(self):
+                if name.startswith('show_'):
+                    setattr(self, name, PROFILER.timed(name[len('show_'):])(getattr(self, name)))
+            PROFILER.context = self.profile_context
+            PROFILER.listeners.append(self.update_profile_overlay)
         
         self.setup_ui()
+        for sequence in ("<Motion>", "<ButtonPress>", "<KeyPress>", "<MouseWheel>"):
+            self.root.bind_all(sequence, self.prefetcher.touch, add='+')
+        self.root.after_idle(PROFILER.milestone, 'window')
+        self.start_loading()
+        
+    def start_loading(self):
+        """Load the datasets, then import the chart modules, on a worker thread while the window is already up"""
+        self.load_queue = queue.Queue()
+        self.imports_pending = True
+        
+        def worker():
+            cache = DataCache()
+            for attr in DATA_SOURCES:
+                try:
+                    with PROFILER.run(f'load_{attr}'):
+                        df = load_dataset(cache, attr)
+                    self.load_queue.put((attr, df, None))
+                except Exception as e:
+                    self.load_queue.put((attr, None, e))
+            PROFILER.milestone('datasets')
+            try:
+                with PROFILER.run('load_chart_modules'):
+                    resolve_lazy_imports()
+                PROFILER.milestone('chart_modules')
+                self.load_queue.put((None, None, None))
+            except Exception as e:
+                self.load_queue.put((None, None, e))
         
-    def load_data(self):
-        """Load and preprocess the datasets"""
-        # Load indianEco.csv
-        try:
-            self.econ_data = pd.read_csv('indianEco.csv')
-            self.econ_data.columns = self.econ_data.columns.str.strip()
-            for col in self.econ_data.columns:
-                if col != 'Country Name':
-                    self.econ_data[col] = pd.to_numeric(self.econ_data[col], errors='coerce')
-        except FileNotFoundError:
-            raise FileNotFoundError("indianEco.csv not found in the project directory")
-        
-        # Load tax data
-        try:
-            self.tax_data = pd.read_csv('syb-18-chapter_6_direct_indirect_taxes_table_6.11.csv')
-            self.tax_data['Year'] = self.tax_data['Year'].str.split('-').str[0].astype(int)
-            for col in self.tax_data.columns:
-                if col != 'Year':
-                    self.tax_data[col] = pd.to_numeric(self.tax_data[col], errors='coerce')
-        except FileNotFoundError:
-            raise FileNotFoundError("syb-18-chapter_6_direct_indirect_taxes_table_6.11.csv not found in the project directory")
-        
-        # Load inflation data
-        try:
-            self.inflation_data = pd.read_csv('India_Inflation_Rate.csv')
-            self.inflation_data = self.inflation_data.rename(columns={
-                'year': 'Year',
-                'Inflation_Rate': 'Inflation Rate (%)',
-                'Annual_percent_geowth': 'Inflation Growth Rate (%)'
-            })
-            self.inflation_data['Inflation Rate (%)'] = self.inflation_data['Inflation Rate (%)'].str.rstrip('%').astype(float)
-            self.inflation_data['Inflation Growth Rate (%)'] = self.inflation_data['Inflation Growth Rate (%)'].str.rstrip('%').astype(float)
-            if 'Unnamed: 0' in self.inflation_data.columns:
-                self.inflation_data = self.inflation_data.drop(columns=['Unnamed: 0'])
-        except FileNotFoundError:
-            raise FileNotFoundError("India_Inflation_Rate.csv not found in the project directory")
-        
-        # Load government debt data
-        try:
-            self.debt_data = pd.read_csv('India_Government_Debt.csv')
-            self.debt_data = self.debt_data.rename(columns={
-                'year': 'Year',
-                'Government_Debt_as_percent_of_GDP': 'Government Debt (% of GDP)',
-                'Annual_percent_geowth': 'Debt Growth Rate (%)'
-            })
-            self.debt_data['Government Debt (% of GDP)'] = self.debt_data['Government Debt (% of GDP)'].str.rstrip('%').astype(float)
-            self.debt_data['Debt Growth Rate (%)'] = self.debt_data['Debt Growth Rate (%)'].str.rstrip('%').astype(float)
-            if 'Unnamed: 0' in self.debt_data.columns:
-                self.debt_data = self.debt_data.drop(columns=['Unnamed: 0'])
-        except FileNotFoundError:
-            raise FileNotFoundError("India_Government_Debt.csv not found in the project directory")
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(50, self.poll_loading)
+    
+    def poll_loading(self):
+        """Pick up finished datasets on the Tk thread and enable the views that need them"""
+        while True:
+            try:
+                attr, df, error = self.load_queue.get_nowait()
+            except queue.Empty:
+                break
+            if attr is None:
+                self.imports_pending = False
+                if error is not None:
+                    messagebox.showerror("Error", f"Failed to load the charting libraries: {str(error)}")
+                continue
+            self.pending_datasets.discard(attr)
+            if error is None:
+                setattr(self, attr, df)
+                self.datasets_ready.add(attr)
+                self.data_versions[attr] = DataCache().version(attr)
+                self.rebuild_panel(attr)
+            else:
+                messagebox.showerror("Error", f"Failed to load data: {str(error)}")
+            self.update_view_buttons()
+        
+        loaded = len(DATA_SOURCES) - len(self.pending_datasets)
+        self.loading_bar.config(value=loaded)
+        self.loading_label.config(text=f"Loading data... ({loaded}/{len(DATA_SOURCES)})")
+        if self.pending_datasets or self.imports_pending:
+            if not self.pending_datasets:
+                self.loading_label.config(text="Loading charts...")
+            self.root.after(50, self.poll_loading)
+        else:
+            PROFILER.report_startup()
+            self.loading_frame.destroy()
+            self.plan_prefetch()
+            for attr in self.datasets_ready:
+                self.watcher.track(attr)
+            self.root.after(WATCH_INTERVAL_MS, self.poll_sources)
+    
+    def poll_sources(self):
+        """Merge appended or reloaded source files and redraw the open view if it uses them"""
+        changed = set()
+        for attr, df, version, error in self.watcher.poll():
+            if error is not None:
+                messagebox.showerror("Error", f"Failed to reload {DATA_SOURCES[attr][0]}: {str(error)}")
+            elif df is not None:
+                setattr(self, attr, df)
+                self.data_versions[attr] = version
+                self.rebuild_panel(attr)
+                changed.add(attr)
+        
+        if changed:
+            self.update_view_buttons()
+            name = self.current_view_name()
+            if name and changed & set(VIEW_DATASETS[name]) and self.view_available(name):
+                self.refresh_view(changed)
+            self.plan_prefetch()
+        
+        self.watcher.check(lambda attr: getattr(self, attr))
+        self.root.after(WATCH_INTERVAL_MS, self.poll_sources)
+    
+    def rebuild_panel(self, changed=None):
+        """Drop the panels and cached stats built from a changed dataset (or all) and reselect the country"""
+        if changed in MULTI_COUNTRY_SOURCES or (changed is None and 'econ_data' in self.datasets_ready):
+            self.country_index = CountryIndex(self.econ_data)
+            self.update_country_selector()
+        self.dataset_rows = {attr: len(getattr(self, attr)) for attr in sorted(self.datasets_ready)}
+        self.prefetcher.invalidate()
+        self.panels.clear()
+        for stats in self.engines.values():
+            stats.invalidate(changed)
+        self.select_country(self.country)
+    
+    def available_datasets(self, country=None):
+        """Loaded datasets that describe country (the selected one by default)"""
+        if (country or self.country) == DEFAULT_COUNTRY:
+            return set(self.datasets_ready)
+        return self.datasets_ready & MULTI_COUNTRY_SOURCES
+    
+    def panel_for(self, country):
+        """The country's EconomicPanel, aligned on first use"""
+        panel = self.panels.get(country)
+        if panel is None:
+            datasets = {attr: getattr(self, attr) for attr in DATA_SOURCES
+                        if attr in self.available_datasets(country)}
+            panel = self.panels[country] = EconomicPanel(
+                country_datasets(datasets, self.country_index, country), country)
+        return panel
+    
+    def stats_for(self, country):
+        """The country's StatsEngine, whose memoized results survive switching away and back"""
+        stats = self.engines.get(country)
+        if stats is None:
+            stats = self.engines[country] = StatsEngine(lambda: self.panel_for(country))
+        return stats
+    
+    def select_country(self, country):
+        """Point the panel, stats and chart builder at country"""
+        self.country = country
+        self.stats = self.stats_for(country)
+        self.charts = ChartBuilder(self.stats)
+        self.panel = self.panel_for(country)
+    
+    def change_country(self, country):
+        """Switch country from the selector and redraw the open view for it"""
+        if country == self.country or country not in self.country_index:
+            return
+        self.select_country(country)
+        self.update_view_buttons()
+        
+        if self.current_view is not None:
+            if self.view_available(self.current_view_name()):
+                self.current_view()
+            else:
+                self.clear_chart_frame()
+                self.update_header(f"This view has no data for {country}")
+        self.plan_prefetch()
+    
+    def update_country_selector(self):
+        """List the loaded countries in the selector, falling back to the first if the default is missing"""
+        if self.country not in self.country_index and self.country_index.countries:
+            self.country = self.country_index.countries[0]
+            self.country_var.set(self.country)
+        self.country_selector.config(values=self.country_index.countries, state='readonly')
+    
+    def current_view_name(self):
+        return self.current_view.__name__[len('show_'):] if self.current_view else None
+    
+    def open_view(self, view):
+        """Show a view from the sidebar and remember it for country switches and prefetching"""
+        self.prefetcher.touch()
+        self.navigation[self.current_view_name()][view.__name__[len('show_'):]] += 1
+        self.current_view = view
+        view()
+        self.plan_prefetch()
+    
+    def plan_prefetch(self):
+        """Queue the prefetchable views most often opened after this one, then in sidebar order"""
+        order = [name for _, name in self.view_buttons]
+        current = self.current_view_name()
+        start = order.index(current) + 1 if current in order else 0
+        counts = self.navigation[current]
+        ranked = sorted(order[start:] + order[:start], key=lambda name: -counts.get(name, 0))
+        
+        plan = []
+        dpi = self.figures.dpi
+        charts = ChartBuilder(self.stats.snapshot())
+        for name in ranked:
+            if name == current or name not in PREFETCH_VIEWS or not self.view_available(name):
+                continue
+            size = self.chart_sizes.get(name, self.chart_size)
+            key = self.chart_image_key(name, PREFETCH_VIEWS[name], size)
+            if key:
+                plan.append((key, functools.partial(render_chart_image, charts, name,
+                                                    PREFETCH_VIEWS[name].get('chart_type'), dpi, size)))
+        self.prefetcher.schedule(plan)
+    
+    def view_available(self, name):
+        """Whether every dataset the view needs is loaded for the selected country"""
+        # The data table lists the raw files whatever country is selected
+        available = self.datasets_ready if name == 'data_table' else self.available_datasets()
+        return set(VIEW_DATASETS[name]) <= available
+    
+    def update_view_buttons(self):
+        """Enable each view button once all of its datasets are loaded for the selected country"""
+        for btn, name in self.view_buttons:
+            btn.config(state=tk.NORMAL if self.view_available(name) else tk.DISABLED)
     
     def toggle_theme(self):
         """Toggle between light and dark themes"""
@@ -137,6 +2814,21 @@ class IndianEconomyDashboard:
         
         ttk.Separator(self.sidebar_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, padx=10)
         
+        # Widget 7: Country Selector, filled in once econ_data has loaded
+        country_frame = tk.Frame(self.sidebar_frame, bg=self.light_theme['sidebar_bg'])
+        country_frame.pack(fill=tk.X, padx=10, pady=10)
+        tk.Label(country_frame, text="Country:", font=("Arial", 11), 
+               bg=self.light_theme['sidebar_bg'], fg=self.light_theme['sidebar_fg']).pack(side=tk.LEFT)
+        self.country_var = tk.StringVar(value=self.country)
+        self.country_selector = ttk.Combobox(country_frame, textvariable=self.country_var, 
+                                           values=[self.country], state='disabled', width=18)
+        self.country_selector.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        self.country_selector.bind("<<ComboboxSelected>>", 
+                                   lambda e: self.change_country(self.country_var.get()))
+        
+        ttk.Separator(self.sidebar_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, padx=10)
+        
+        # (label, view); a button is enabled once the datasets in VIEW_DATASETS are loaded
         buttons_info = [
             ("GDP Overview", self.show_gdp_overview),
             ("Population & Life Expectancy", self.show_population_life_expectancy),
@@ -157,21 +2849,39 @@ class IndianEconomyDashboard:
             "bd": 0, "padx": 10, "pady": 8, "width": 25
         }
         
-        for btn_text, btn_command in buttons_info:
-            btn = tk.Button(self.sidebar_frame, text=btn_text, command=btn_command, **button_style)
+        self.view_buttons = []
+        for btn_text, view in buttons_info:
+            btn = tk.Button(self.sidebar_frame, text=btn_text, 
+                            command=lambda view=view: self.open_view(view), **button_style)
             btn.pack(fill=tk.X, padx=10, pady=5)
+            self.view_buttons.append((btn, view.__name__[len('show_'):]))
+        self.update_view_buttons()
             
         ttk.Separator(self.sidebar_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, padx=10, pady=10)
         
-        export_btn = tk.Button(self.sidebar_frame, text="Export Current Chart", 
-                             command=self.export_chart, **button_style)
-        export_btn.pack(fill=tk.X, padx=10, pady=5)
+        self.export_btn = tk.Button(self.sidebar_frame, text="Export Current Chart", 
+                                  command=self.export_chart, **button_style)
+        self.export_btn.pack(fill=tk.X, padx=10, pady=5)
+        
+        # Export progress, shown below the button while the export queue is busy
+        self.export_frame = tk.Frame(self.sidebar_frame, bg=self.light_theme['sidebar_bg'])
+        self.export_label = tk.Label(self.export_frame, font=("Arial", 9), 
+                                   bg=self.light_theme['sidebar_bg'], fg=self.light_theme['sidebar_fg'])
+        self.export_label.pack(fill=tk.X)
+        self.export_bar = ttk.Progressbar(self.export_frame, orient=tk.HORIZONTAL, mode='determinate')
+        self.export_bar.pack(fill=tk.X)
+        self.export_steps = [0, 0]
         
         # Widget 1: Theme Toggle Button
         theme_btn = tk.Button(self.sidebar_frame, text="Toggle Dark/Light Theme", 
                             command=self.toggle_theme, **button_style)
         theme_btn.pack(fill=tk.X, padx=10, pady=5)
         
+        self.memory_label = tk.Label(self.sidebar_frame, text=self.figures.status_text(),
+                                   font=("Arial", 9), bg=self.light_theme['sidebar_bg'],
+                                   fg=self.light_theme['sidebar_fg'], justify=tk.LEFT)
+        self.memory_label.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=10)
+        
         self.content_frame = tk.Frame(self.root, bg=self.light_theme['content_bg'])
         self.content_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
         
@@ -185,9 +2895,27 @@ class IndianEconomyDashboard:
                                    fg=self.light_theme['header_fg'], pady=10)
         self.header_title.pack(side=tk.LEFT, padx=20)
         
+        # Loading progress, removed once every dataset has arrived
+        self.loading_frame = tk.Frame(self.header_frame, bg=self.light_theme['header_bg'])
+        self.loading_frame.pack(side=tk.RIGHT, padx=20)
+        self.loading_label = tk.Label(self.loading_frame, text=f"Loading data... (0/{len(DATA_SOURCES)})",
+                                    font=("Arial", 11), bg=self.light_theme['header_bg'],
+                                    fg=self.light_theme['header_fg'])
+        self.loading_label.pack(side=tk.LEFT, padx=5)
+        self.loading_bar = ttk.Progressbar(self.loading_frame, orient=tk.HORIZONTAL, length=150,
+                                         mode='determinate', maximum=len(DATA_SOURCES))
+        self.loading_bar.pack(side=tk.LEFT, padx=5)
+        
         self.chart_frame = tk.Frame(self.content_frame, bg=self.light_theme['chart_bg'])
         self.chart_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
+        if PROFILER.enabled:
+            # Profiling overlay in the bottom-right corner of the content area
+            self.profile_label = tk.Label(self.content_frame, text=f"Profiling to {PROFILER.log_path}",
+                                        font=("Consolas", 9), bg="#fffbe6", fg="#34495e",
+                                        bd=1, relief=tk.SOLID, padx=4)
+            self.profile_label.place(relx=1.0, rely=1.0, x=-4, y=-4, anchor=tk.SE)
+        
         welcome_frame = tk.Frame(self.chart_frame, bg=self.light_theme['chart_bg'])
         welcome_frame.pack(fill=tk.BOTH, expand=True)
         
@@ -224,259 +2952,409 @@ class IndianEconomyDashboard:
         
     def clear_chart_frame(self):
         """Clear the chart frame for new content"""
+        self.figures.release_all()
         for widget in self.chart_frame.winfo_children():
             widget.destroy()
         
-        if self.canvas:
-            self.canvas.get_tk_widget().destroy()
-            self.canvas = None
+        self.canvas = None
+        self.current_chart = None
+        self.pending_tabs = {}
+        self.tabs = None
+        self.chart_placeholder = None
+        self.cancel_chart_caching()
+        self.view_refresh = None
+        self.root.after_idle(self.update_memory_status)
+    
+    def refresh_view(self, changed):
+        """Redraw the open view for changed datasets, keeping its controls, selected tab and zoom"""
+        if self.view_refresh is not None:
+            self.view_refresh(changed)
+            return
+        self.view_seed = self.view_state()
+        try:
+            self.current_view()
+        finally:
+            seed, self.view_seed = self.view_seed, {}
+        
+        if seed.get('zoom'):
+            self.activate_chart()
+        for slot, name in enumerate(self.figures.names[:self.figures.next_slot]):
+            for tool in self.figures.tools[slot]:
+                if isinstance(tool, PanZoom):
+                    axes = tool.canvas.figure.axes
+                    for i, (lo, hi) in seed.get('zoom', {}).get(name, {}).items():
+                        if i < len(axes) and axes[i] in tool.home:
+                            tool.set_xlim(axes[i], lo, hi)
+    
+    def view_state(self):
+        """The open view's control values, selected tab and zoomed year ranges, as a view_seed"""
+        name = self.current_view_name()
+        state = {}
+        if name in ('inflation_trends', 'government_debt'):
+            state['chart_type'] = self.chart_type_var.get()
+        elif name == 'compare_indicators':
+            state['indicators'] = [ind for ind, var in self.check_vars.items() if var.get()]
+            state['years'] = (self.start_year_var.get(), self.end_year_var.get())
+            state['plotted'] = self.current_chart is not None or self.chart_placeholder is not None
+        if self.tabs is not None:
+            state['tab'] = self.tabs.index('current')
+        
+        zoom = {}
+        for slot, fig_name in enumerate(self.figures.names[:self.figures.next_slot]):
+            for tool in self.figures.tools[slot]:
+                if isinstance(tool, PanZoom):
+                    axes = tool.canvas.figure.axes
+                    zoomed = {i: ax.get_xlim() for i, ax in enumerate(axes)
+                              if ax in tool.home and ax.get_xlim() != tuple(tool.home[ax][0])}
+                    if zoomed:
+                        zoom[fig_name] = zoomed
+        state['zoom'] = zoom
+        return state
+        
+    def draw_cached_chart(self, view, params, build, master):
+        """Show a chart from the image cache until it is clicked or the user is idle, or build it live and cache it"""
+        # A view not laid out yet is assumed to get the size the last chart had
+        size = self.chart_sizes.get(view, self.chart_size)
+        key = self.chart_image_key(view, params, size)
+        png = self.images.get(key) if key else None
+        self.drop_chart_placeholder()
+        self.cancel_chart_caching()
+        
+        def track_size(event):
+            self.chart_sizes[view] = self.chart_size = (event.width, event.height)
+        
+        def show_live():
+            canvas = build()
+            if canvas is not None:
+                canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+                canvas.get_tk_widget().bind("<Configure>", track_size, add='+')
+                self.cache_chart_when_sized(view, params, canvas)
+        
+        if png is None:
+            show_live()
+            return
+        
+        if self.canvas is not None:
+            self.canvas.get_tk_widget().pack_forget()
+        image = tk.PhotoImage(data=base64.b64encode(png), format='png')
+        label = tk.Label(master, image=image, bd=0, cursor='hand2')
+        label.image = image  # Tk drops images Python no longer references
+        label.pack(fill=tk.BOTH, expand=True)
+        
+        def activate(event=None):
+            if self.chart_placeholder and self.chart_placeholder[0] is label:
+                self.drop_chart_placeholder()
+                show_live()
+        
+        def on_configure(event):
+            track_size(event)
+            if (event.width, event.height) != size:
+                activate()  # The image would not fill the frame the live chart will
+        
+        def activate_when_idle():
+            if not (self.chart_placeholder and self.chart_placeholder[0] is label):
+                return
+            if self.prefetcher.idle_ms() >= PREFETCH_IDLE_MS:
+                activate()
+            else:
+                self.root.after(PREFETCH_IDLE_MS, activate_when_idle)
+        
+        label.bind("<Configure>", on_configure)
+        label.bind("<Button-1>", activate)
+        self.root.after(PREFETCH_IDLE_MS, activate_when_idle)
+        self.chart_placeholder = (label, activate)
+    
+    def cache_chart_when_sized(self, view, params, canvas):
+        """Store a live chart in the image cache the first time it is drawn at the size Tk laid it out at"""
+        def on_draw(event):
+            size = canvas.get_width_height()
+            if size != self.chart_sizes.get(view):
+                return  # Drawn at the figure's own size, before Tk stretched it to the frame
+            self.cancel_chart_caching()
+            key = self.chart_image_key(view, params, size)
+            if key and not os.path.exists(self.images.path(key)):
+                self.images.put_canvas(key, canvas)
+        
+        self.chart_caching = (canvas, canvas.mpl_connect('draw_event', on_draw))
+    
+    def cancel_chart_caching(self):
+        # The callback lives on the figure, which the pool reuses for the next chart
+        if self.chart_caching is not None:
+            canvas, cid = self.chart_caching
+            canvas.mpl_disconnect(cid)
+            self.chart_caching = None
+    
+    def chart_image_key(self, view, params, size):
+        """Image cache key of a view's chart at size (width, height) for the selected country, or None when the size or a source's hash is unknown"""
+        versions = [self.data_versions.get(attr) for attr in VIEW_DATASETS[view]]
+        if size is None or None in versions:
+            return None
+        return ImageCache.key({'view': view, 'params': params, 'country': self.country,
+                               'data': versions, 'dpi': self.figures.dpi, 'size': list(size)})
+    
+    def drop_chart_placeholder(self):
+        if self.chart_placeholder is not None:
+            self.chart_placeholder[0].destroy()
+            self.chart_placeholder = None
+    
+    def activate_chart(self):
+        """Replace a cached chart image with its live figure"""
+        if self.chart_placeholder is not None:
+            self.chart_placeholder[1]()
+    
+    def lazy_tabs(self, notebook, builders):
+        """Run each {tab index: builder} the first time its tab is selected"""
+        self.pending_tabs = dict(builders)
+        self.tabs = notebook
+        if 'tab' in self.view_seed:
+            notebook.select(self.view_seed['tab'])
+        
+        def on_tab_changed(event=None):
+            build = self.pending_tabs.pop(notebook.index('current'), None)
+            if build is not None:
+                build()
+                self.root.after_idle(self.update_memory_status)
+        
+        notebook.bind("<<NotebookTabChanged>>", on_tab_changed)
+        on_tab_changed()
+    
+    def build_pending_tabs(self):
+        """Build every tab of the current view that has not been shown yet"""
+        for index in sorted(self.pending_tabs):
+            self.pending_tabs.pop(index)()
+    
+    def profile_context(self):
+        """Data sizes logged with every profile record, to compare runs across data sizes"""
+        # Also called from the loader thread, so it only reads what the Tk thread replaces whole
+        return {'country': self.country, 'rows': self.dataset_rows}
+    
+    def update_profile_overlay(self, record):
+        """Show the last render breakdown in the corner overlay"""
+        if threading.current_thread() is not threading.main_thread():
+            return  # Loader thread records only go to the log
+        self.profile_label.config(text=Profiler.summary(record))
+        self.profile_label.lift()
+    
+    def update_memory_status(self):
+        """Refresh the live figure count and RSS shown in the sidebar"""
+        self.memory_label.config(text=self.figures.status_text())
+            
+    @PROFILER.timed('apply_chart_type')
+    def apply_chart_type(self, chart_artists, chart_type):
+        """Switch a drawn chart to chart_type and redraw in place"""
+        drawn = not callable(chart_artists[chart_type])
+        ChartBuilder.set_chart_type(chart_artists, chart_type)
+        for tool in self.figures.tools[self.figures.pool.index(self.canvas.figure)]:
+            if isinstance(tool, PanZoom):
+                tool.rehome()
+            elif isinstance(tool, Crosshair) and not drawn:
+                tool.refresh()
+        self.canvas.draw_idle()
             
     def update_header(self, title):
         """Update the header title"""
         self.header_title.config(text=title)
         
     def export_chart(self):
-        """Export the current chart as an image"""
+        """Queue an export of the current chart, or of every chart in the view as a PDF or ZIP"""
+        self.activate_chart()
         if self.current_chart is None:
             messagebox.showwarning("Warning", "No chart available to export!")
             return
             
         file_path = filedialog.asksaveasfilename(
             defaultextension=".png",
-            filetypes=[("PNG files", "*.png"), ("JPEG files", "*.jpg"), ("All files", "*.*")]
+            filetypes=[("PNG files", "*.png"), ("JPEG files", "*.jpg"), ("SVG files", "*.svg"),
+                       ("PDF, all charts in view", "*.pdf"), ("ZIP of PNGs, all charts in view", "*.zip"),
+                       ("All files", "*.*")]
         )
         
         if file_path:
+            if os.path.splitext(file_path)[1].lower() in ('.pdf', '.zip'):
+                self.build_pending_tabs()
+                figures = self.figures.in_use()
+            else:
+                figures = [(name, fig) for name, fig in self.figures.in_use() if fig is self.current_chart]
             try:
-                self.current_chart.savefig(file_path, dpi=300, bbox_inches='tight')
-                messagebox.showinfo("Success", f"Chart exported successfully to {file_path}")
+                self.exports.submit(figures or [("chart", self.current_chart)], file_path)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export chart: {str(e)}")
-                
+                return
+            
+            self.export_steps[1] += len(figures) or 1
+            if self.exports.pending == 1:
+                self.export_frame.pack(fill=tk.X, padx=10, pady=5, after=self.export_btn)
+                self.root.after(100, self.poll_exports)
+            self.update_export_progress()
+    
+    def poll_exports(self):
+        """Report finished exports and advance the export progress bar"""
+        for event in self.exports.poll():
+            if event[0] == 'progress':
+                self.export_steps[0] += 1
+            else:
+                _, path, error = event
+                if error is None:
+                    messagebox.showinfo("Success", f"Chart exported successfully to {path}")
+                else:
+                    messagebox.showerror("Error", f"Failed to export chart: {str(error)}")
+        
+        if self.exports.pending:
+            self.update_export_progress()
+            self.root.after(100, self.poll_exports)
+        else:
+            self.export_steps = [0, 0]
+            self.export_frame.pack_forget()
+    
+    def update_export_progress(self):
+        done, total = self.export_steps
+        self.export_bar.config(maximum=total, value=done)
+        self.export_label.config(text=f"Exporting... {done}/{total} charts ({self.exports.pending} queued)")
+    
     def show_gdp_overview(self):
         """Show GDP overview chart"""
         self.clear_chart_frame()
         self.update_header("GDP Overview (1960-2020)")
         
-        # Initialize zoom state
-        self.zoom_level = 1.0
+        gdp = self.stats.summary('GDP (current US$)')
+        gdp_per_capita = self.stats.summary('GDP per capita (current US$)')
+        gdp_growth = self.stats.summary('GDP growth (annual %)')
         
-        def update_gdp_plot():
-            if self.canvas:
-                self.canvas.get_tk_widget().destroy()
-            
-            fig, ax = plt.subplots(figsize=(12, 6))
-            ax.plot(self.econ_data['Year'], self.econ_data['GDP (current US$)'] / 1e9, 
-                    marker='o', linestyle='-', color='#3498db', linewidth=2)
-            ax.grid(True, linestyle='--', alpha=0.7)
-            ax.set_xlabel('Year', fontsize=12, fontweight='bold')
-            ax.set_ylabel('GDP (Billion US$)', fontsize=12, fontweight='bold')
-            ax.set_title('India GDP Trend (1960-2020)', fontsize=14, fontweight='bold')
-            ax.set_xticks(self.econ_data['Year'][::5])
-            ax.tick_params(axis='both', labelsize=10)
-            
-            events = [
-                (1991, "Economic Liberalization"),
-                (2008, "Global Financial Crisis"),
-                (2016, "Demonetization"),
-                (2020, "COVID-19 Pandemic")
-            ]
-            
-            for year, event in events:
-                idx = self.econ_data[self.econ_data['Year'] == year].index
-                if len(idx) > 0:
-                    idx = idx[0]
-                    gdp = self.econ_data.loc[idx, 'GDP (current US$)'] / 1e9
-                    ax.annotate(event, xy=(year, gdp), xytext=(0, 20), 
-                              textcoords='offset points', ha='center', va='bottom',
-                              bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.5),
-                              arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0.3'))
-            
-            ax2 = ax.twinx()
-            ax2.plot(self.econ_data['Year'], self.econ_data['GDP per capita (current US$)'], 
-                    marker='^', linestyle='--', color='#e74c3c', linewidth=2)
-            ax2.set_ylabel('GDP per Capita (US$)', fontsize=12, fontweight='bold', color='#e74c3c')
-            ax2.tick_params(axis='y', labelcolor='#e74c3c')
-            
-            # Apply zoom
-            gdp_max = (self.econ_data['GDP (current US$)'] / 1e9).max()
-            gdp_per_capita_max = self.econ_data['GDP per capita (current US$)'].max()
-            ax.set_ylim(0, gdp_max / self.zoom_level)
-            ax2.set_ylim(0, gdp_per_capita_max / self.zoom_level)
-            
-            ax.legend(['GDP (Billion US$)', 'GDP per Capita (US$)'], loc='upper left')
-            plt.tight_layout()
+        pan_zoom = None
+        
+        def build_gdp_plot():
+            nonlocal pan_zoom
+            fig = self.figures.acquire(ChartBuilder.FIGSIZES['gdp_overview'], slot=0, name='gdp_overview')
+            self.charts.gdp_overview(fig)
             
-            self.canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-            self.canvas.draw()
-            self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            self.canvas = self.figures.canvas(fig, chart_holder)
             self.current_chart = fig
-        
-        # Widget 6: Zoom Control Buttons
+            pan_zoom = self.figures.attach(fig, Crosshair, PanZoom)[1]
+            return self.canvas
+        
+        def zoom(factor=None):
+            self.activate_chart()  # A cached image has no axes to zoom yet
+            if factor is None:
+                pan_zoom.reset()
+            else:
+                pan_zoom.zoom(factor)
+        
+        # Widget 6: Zoom Control Buttons. They zoom the year range around its
+        # centre, like the mouse wheel; dragging the chart pans it
         control_frame = tk.Frame(self.chart_frame, bg=self.light_theme['chart_bg'])
         control_frame.pack(fill=tk.X, pady=10)
         
-        def zoom_in():
-            self.zoom_level = max(0.5, self.zoom_level * 0.8)
-            update_gdp_plot()
-        
-        def zoom_out():
-            self.zoom_level = min(2.0, self.zoom_level * 1.2)
-            update_gdp_plot()
-        
-        zoom_in_btn = tk.Button(control_frame, text="Zoom In", command=zoom_in,
-                               font=("Arial", 11), bg="#3498db", fg="white",
-                               activebackground="#2980b9", activeforeground="white")
-        zoom_in_btn.pack(side=tk.LEFT, padx=10)
-        
-        zoom_out_btn = tk.Button(control_frame, text="Zoom Out", command=zoom_out,
-                                font=("Arial", 11), bg="#3498db", fg="white",
-                                activebackground="#2980b9", activeforeground="white")
-        zoom_out_btn.pack(side=tk.LEFT, padx=10)
+        for text, command in [("Zoom In", lambda: zoom(1 / PAN_ZOOM_STEP)),
+                              ("Zoom Out", lambda: zoom(PAN_ZOOM_STEP)),
+                              ("Reset", zoom)]:
+            tk.Button(control_frame, text=text, command=command,
+                      font=("Arial", 11), bg="#3498db", fg="white",
+                      activebackground="#2980b9", activeforeground="white").pack(side=tk.LEFT, padx=10)
         
         stats_frame = tk.Frame(control_frame, bg=self.light_theme['chart_bg'])
         stats_frame.pack(side=tk.LEFT, padx=20)
         
-        recent_data = self.econ_data.iloc[-1]
         stats_text = f"""
-        Latest GDP (2020): ${recent_data['GDP (current US$)'] / 1e9:.2f} Billion
-        Latest GDP per Capita (2020): ${recent_data['GDP per capita (current US$)']:.2f}
-        Average GDP Growth (1960-2020): {self.econ_data['GDP growth (annual %)'].mean():.2f}%
-        Highest GDP Growth: {self.econ_data['GDP growth (annual %)'].max():.2f}% in {self.econ_data.loc[self.econ_data['GDP growth (annual %)'].idxmax(), 'Year']}
-        Lowest GDP Growth: {self.econ_data['GDP growth (annual %)'].min():.2f}% in {self.econ_data.loc[self.econ_data['GDP growth (annual %)'].idxmin(), 'Year']}
+        Latest GDP ({na(gdp['last_year'])}): {na(scaled('GDP (current US$)', gdp['last']), '.2f')} {unit_of('GDP (current US$)')}
+        Latest GDP per Capita ({na(gdp_per_capita['last_year'])}): ${na(gdp_per_capita['last'], '.2f')}
+        Average GDP Growth ({na(gdp_growth['first_year'])}-{na(gdp_growth['last_year'])}): {na(gdp_growth['mean'], '.2f')}%
+        Highest GDP Growth: {na(gdp_growth['max'], '.2f')}% in {na(gdp_growth['max_year'])}
+        Lowest GDP Growth: {na(gdp_growth['min'], '.2f')}% in {na(gdp_growth['min_year'])}
         """
         stats_label = tk.Label(stats_frame, text=stats_text, font=("Arial", 11), 
                              bg=self.light_theme['chart_bg'], fg="#34495e", justify=tk.LEFT)
         stats_label.pack()
         
-        update_gdp_plot()
+        chart_holder = tk.Frame(self.chart_frame, bg=self.light_theme['chart_bg'])
+        chart_holder.pack(fill=tk.BOTH, expand=True)
+        self.draw_cached_chart('gdp_overview', PREFETCH_VIEWS['gdp_overview'], build_gdp_plot, chart_holder)
         
     def show_population_life_expectancy(self):
         """Show population and life expectancy chart"""
         self.clear_chart_frame()
         self.update_header("Population & Life Expectancy Trends")
         
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), sharex=True)
+        chart_holder = tk.Frame(self.chart_frame, bg=self.light_theme['chart_bg'])
+        chart_holder.pack(fill=tk.BOTH, expand=True)
         
-        ax1.plot(self.econ_data['Year'], self.econ_data['Population, total'] / 1e9, 
-                marker='o', linestyle='-', color='#3498db', linewidth=2)
-        ax1.set_ylabel('Population (Billions)', fontsize=12, fontweight='bold')
-        ax1.set_title('India Population Growth (1960-2020)', fontsize=14, fontweight='bold')
-        ax1.grid(True, linestyle='--', alpha=0.7)
-        
-        ax1_twin = ax1.twinx()
-        ax1_twin.plot(self.econ_data['Year'], self.econ_data['Population growth (annual %)'], 
-                     marker='^', linestyle='--', color='#e74c3c', linewidth=2)
-        ax1_twin.set_ylabel('Population Growth Rate (%)', fontsize=12, fontweight='bold', color='#e74c3c')
-        ax1_twin.tick_params(axis='y', labelcolor='#e74c3c')
-        
-        ax1.legend(['Population'], loc='upper left')
-        ax1_twin.legend(['Growth Rate'], loc='upper right')
-        
-        ax2.plot(self.econ_data['Year'], self.econ_data['Life expectancy at birth, total (years)'], 
-                marker='s', linestyle='-', color='#2ecc71', linewidth=2)
-        ax2.set_xlabel('Year', fontsize=12, fontweight='bold')
-        ax2.set_ylabel('Life Expectancy (Years)', fontsize=12, fontweight='bold')
-        ax2.set_title('Life Expectancy at Birth (1960-2020)', fontsize=14, fontweight='bold')
-        ax2.grid(True, linestyle='--', alpha=0.7)
-        
-        ax2.set_xticks(self.econ_data['Year'][::5])
-        
-        plt.tight_layout()
+        def build_population_plot():
+            fig = self.figures.acquire(ChartBuilder.FIGSIZES['population_life_expectancy'], name='population_life_expectancy')
+            self.charts.population_life_expectancy(fig)
+            
+            self.canvas = self.figures.canvas(fig, chart_holder)
+            self.figures.attach(fig, PanZoom)
+            self.current_chart = fig
+            return self.canvas
         
-        self.canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.draw_cached_chart('population_life_expectancy', PREFETCH_VIEWS['population_life_expectancy'], build_population_plot, chart_holder)
         
         stats_frame = tk.Frame(self.chart_frame, bg=self.light_theme['chart_bg'])
         stats_frame.pack(fill=tk.X, pady=10)
         
-        first_year = self.econ_data.iloc[0]['Year']
-        last_year = self.econ_data.iloc[-1]['Year']
+        population = self.stats.summary('Population, total')
+        life = self.stats.summary('Life expectancy at birth, total (years)')
+        population_growth = self.stats.summary('Population growth (annual %)')
         
-        first_pop = self.econ_data.iloc[0]['Population, total'] / 1e6
-        last_pop = self.econ_data.iloc[-1]['Population, total'] / 1e6
+        first_year = population['first_year']
+        last_year = population['last_year']
         
-        first_life = self.econ_data.iloc[0]['Life expectancy at birth, total (years)']
-        last_life = self.econ_data.iloc[-1]['Life expectancy at birth, total (years)']
+        first_pop = scaled('Population, total', population['first'])
+        last_pop = scaled('Population, total', population['last'])
+        pop_unit = unit_of('Population, total')
+        
+        first_life = life['first']
+        last_life = life['last']
+        
+        pop_growth_pct = ((last_pop / first_pop) - 1) * 100 if first_pop else np.nan
+        life_growth_pct = ((last_life / first_life) - 1) * 100 if first_life else np.nan
         
         stats_text = f"""
-        Population in {first_year}: {first_pop:.2f} Million
-        Population in {last_year}: {last_pop:.2f} Million
-        Population increase: {(last_pop - first_pop):.2f} Million ({((last_pop/first_pop)-1)*100:.2f}% growth)
+        Population in {na(first_year)}: {na(first_pop, '.2f')} {pop_unit}
+        Population in {na(last_year)}: {na(last_pop, '.2f')} {pop_unit}
+        Population increase: {na(last_pop - first_pop, '.2f')} {pop_unit} ({na(pop_growth_pct, '.2f')}% growth)
         
-        Life expectancy in {first_year}: {first_life:.1f} years
-        Life expectancy in {last_year}: {last_life:.1f} years
-        Improvement in life expectancy: {(last_life - first_life):.1f} years ({((last_life/first_life)-1)*100:.2f}% increase)
+        Life expectancy in {na(first_year)}: {na(first_life, '.1f')} years
+        Life expectancy in {na(last_year)}: {na(last_life, '.1f')} years
+        Improvement in life expectancy: {na(last_life - first_life, '.1f')} years ({na(life_growth_pct, '.2f')}% increase)
         
-        Current population growth rate (2020): {self.econ_data.iloc[-1]['Population growth (annual %)']:.2f}%
+        Current population growth rate ({na(last_year)}): {na(population_growth['last'], '.2f')}%
         """
         
         stats_label = tk.Label(stats_frame, text=stats_text, font=("Arial", 11), 
                              bg=self.light_theme['chart_bg'], fg="#34495e", justify=tk.LEFT)
         stats_label.pack(padx=20)
         
-        self.current_chart = fig
-        
     def show_inflation_trends(self):
         """Show inflation trends chart using India_Inflation_Rate.csv"""
         self.clear_chart_frame()
         self.update_header("Inflation Trends (1960-2022)")
     
         # Widget 4: Chart Type Selector
-        self.chart_type_var = tk.StringVar(value="Line")
+        self.chart_type_var = tk.StringVar(value=self.view_seed.get('chart_type', CHART_TYPES[0]))
     
-        def update_inflation_plot():
-            if self.canvas:
-                self.canvas.get_tk_widget().destroy()
-        
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), sharex=True)
-        
-            chart_type = self.chart_type_var.get()
-            data = self.inflation_data.sort_values('Year')  # Ensure chronological order
-        
-            # Check if data is empty
-            if data.empty:
+        chart_artists = None
+    
+        def build_inflation_plot():
+            nonlocal chart_artists
+            fig = self.figures.acquire(ChartBuilder.FIGSIZES['inflation_trends'], slot=0, name='inflation_trends')
+            chart_artists = self.charts.inflation_trends(fig)
+            if chart_artists is None:
                 messagebox.showerror("Error", "No inflation data available for the specified period.")
-                return
-        
-            # Plot Inflation Rate
-            if chart_type == "Line":
-                ax1.plot(data['Year'], data['Inflation Rate (%)'], 
-                    marker='o', linestyle='-', color='#e74c3c', linewidth=2)
-            else:  # Bar
-                ax1.bar(data['Year'], data['Inflation Rate (%)'], 
-                    color='#e74c3c', alpha=0.7, width=0.6)
-        
-            ax1.axhline(y=5, color='green', linestyle='--', alpha=0.7, label='Moderate Inflation (5%)')
-            ax1.axhline(y=10, color='orange', linestyle='--', alpha=0.7, label='High Inflation (10%)')
-            ax1.grid(True, linestyle='--', alpha=0.7)
-            ax1.set_ylabel('Inflation Rate (%)', fontsize=12, fontweight='bold')
-            ax1.set_title('India Inflation Trends (1960-2022)', fontsize=14, fontweight='bold')
-            ax1.legend(loc='upper right')
+                return None
         
-            
-            # Plot Inflation Growth Rate
-            if chart_type == "Line":
-                ax2.plot(data['Year'], data['Inflation Growth Rate (%)'], 
-                    marker='s', linestyle='--', color='#2ecc71', linewidth=2)
-            else:  # Bar
-                ax2.bar(data['Year'], data['Inflation Growth Rate (%)'], 
-                    color='#2ecc71', alpha=0.7, width=0.6)
-        
-            ax2.axhline(y=0, color='black', linestyle='-', alpha=0.3)
-            ax2.grid(True, linestyle='--', alpha=0.7)
-            ax2.set_xlabel('Year', fontsize=12, fontweight='bold')
-            ax2.set_ylabel('Inflation Growth Rate (%)', fontsize=12, fontweight='bold')
-            ax2.set_title('Annual Change in Inflation Rate (1960-2022)', fontsize=14, fontweight='bold')
-        
-            ax2.set_xticks(data['Year'][::5])
-        
-            plt.tight_layout()
-            self.canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-            self.canvas.draw()
-            self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            ChartBuilder.set_chart_type(chart_artists, self.chart_type_var.get())
+            self.canvas = self.figures.canvas(fig, chart_holder)
+            self.figures.attach(fig, Crosshair, PanZoom)
             self.current_chart = fig
+            return self.canvas
+    
+        def show_chart_type(event=None):
+            # A live chart just toggles its artists; until then each type comes from the image cache
+            if chart_artists is not None:
+                self.apply_chart_type(chart_artists, self.chart_type_var.get())
+            else:
+                self.draw_cached_chart('inflation_trends', {'chart_type': self.chart_type_var.get()},
+                                       build_inflation_plot, chart_holder)
     
         stats_frame = tk.Frame(self.chart_frame, bg=self.light_theme['chart_bg'])
         stats_frame.pack(fill=tk.X, pady=10)
@@ -487,27 +3365,15 @@ class IndianEconomyDashboard:
         tk.Label(control_frame, text="Chart Type:", font=("Arial", 11, "bold"), 
            bg=self.light_theme['chart_bg'], fg="#34495e").pack(side=tk.LEFT, padx=5)
         chart_type_dropdown = ttk.Combobox(control_frame, textvariable=self.chart_type_var, 
-                                     values=["Line", "Bar"], width=10)
+                                     values=CHART_TYPES, width=10)
         chart_type_dropdown.pack(side=tk.LEFT, padx=5)
-        chart_type_dropdown.bind("<<ComboboxSelected>>", lambda e: update_inflation_plot())
+        chart_type_dropdown.bind("<<ComboboxSelected>>", show_chart_type)
     
         # Handle potential missing or invalid data
         try:
-            avg_inflation = self.inflation_data['Inflation Rate (%)'].mean()
-            median_inflation = self.inflation_data['Inflation Rate (%)'].median()
-            max_inflation = self.inflation_data['Inflation Rate (%)'].max()
-            max_inflation_year = self.inflation_data.loc[self.inflation_data['Inflation Rate (%)'].idxmax(), 'Year']
-            min_inflation = self.inflation_data['Inflation Rate (%)'].min()
-            min_inflation_year = self.inflation_data.loc[self.inflation_data['Inflation Rate (%)'].idxmin(), 'Year']
-            recent_inflation = self.inflation_data.iloc[-1]['Inflation Rate (%)']  # Most recent (2022)
-        
-            avg_growth = self.inflation_data['Inflation Growth Rate (%)'].mean()
-            max_growth = self.inflation_data['Inflation Growth Rate (%)'].max()
-            max_growth_year = self.inflation_data.loc[self.inflation_data['Inflation Growth Rate (%)'].idxmax(), 'Year']
-        
-            self.inflation_data = self.inflation_data.copy()  # Avoid SettingWithCopyWarning
-            self.inflation_data['Decade'] = (self.inflation_data['Year'] // 10) * 10
-            decade_inflation = self.inflation_data.groupby('Decade')['Inflation Rate (%)'].mean().reset_index()
+            inflation = self.stats.summary('Inflation Rate (%)', above=(10,), below=(0,))
+            inflation_growth = self.stats.summary('Inflation Growth Rate (%)')
+            decade_inflation = self.stats.decade_means('Inflation Rate (%)')
         except Exception as e:
             messagebox.showerror("Error", f"Failed to process inflation data: {str(e)}")
             return
@@ -524,35 +3390,37 @@ class IndianEconomyDashboard:
         tk.Label(decade_table, text="Avg. Inflation (%)", font=("Arial", 11, "bold"), 
            bg=self.light_theme['chart_bg'], fg="#34495e").grid(row=1, column=1, padx=10, pady=5)
     
-        for i, (_, row) in enumerate(decade_inflation.iterrows()):
-            decade_text = f"{int(row['Decade'])}s"
+        for i, (decade, decade_avg) in enumerate(decade_inflation.items()):
+            decade_text = f"{int(decade)}s"
             tk.Label(decade_table, text=decade_text, font=("Arial", 11), 
                bg=self.light_theme['chart_bg'], fg="#34495e").grid(row=i+2, column=0, padx=10, pady=2)
-            tk.Label(decade_table, text=f"{row['Inflation Rate (%)']:.2f}%", 
+            tk.Label(decade_table, text=f"{decade_avg:.2f}%", 
                font=("Arial", 11), bg=self.light_theme['chart_bg'], fg="#34495e").grid(row=i+2, column=1, padx=10, pady=2)
 
         stats_container = tk.Frame(stats_frame, bg=self.light_theme['chart_bg'])
         stats_container.pack(side=tk.LEFT, padx=20, fill=tk.X, expand=True)
 
         stats_text = f"""
-        Average Inflation (1960-2022): {avg_inflation:.2f}%
-        Median Inflation: {median_inflation:.2f}%
-        Highest Inflation: {max_inflation:.2f}% in {max_inflation_year}
-        Lowest Inflation: {min_inflation:.2f}% in {min_inflation_year}
-        Most Recent Inflation (2022): {recent_inflation:.2f}%
+        Average Inflation ({inflation['first_year']}-{inflation['last_year']}): {inflation['mean']:.2f}%
+        Median Inflation: {inflation['median']:.2f}%
+        Highest Inflation: {inflation['max']:.2f}% in {inflation['max_year']}
+        Lowest Inflation: {inflation['min']:.2f}% in {inflation['min_year']}
+        Most Recent Inflation ({inflation['last_year']}): {inflation['last']:.2f}%
     
-        Average Inflation Growth Rate: {avg_growth:.2f}%
-        Highest Inflation Growth: {max_growth:.2f}% in {max_growth_year}
+        Average Inflation Growth Rate: {inflation_growth['mean']:.2f}%
+        Highest Inflation Growth: {inflation_growth['max']:.2f}% in {inflation_growth['max_year']}
     
-        Years with Inflation > 10%: {len(self.inflation_data[self.inflation_data['Inflation Rate (%)'] > 10])}
-        Years with Negative Inflation: {len(self.inflation_data[self.inflation_data['Inflation Rate (%)'] < 0])}
+        Years with Inflation > 10%: {inflation['above'][10]}
+        Years with Negative Inflation: {inflation['below'][0]}
         """
     
         stats_label = tk.Label(stats_frame, text=stats_text, font=("Arial", 11), 
                          bg=self.light_theme['chart_bg'], fg="#34495e", justify=tk.LEFT)
         stats_label.pack(side=tk.LEFT, padx=10)
     
-        update_inflation_plot()
+        chart_holder = tk.Frame(self.chart_frame, bg=self.light_theme['chart_bg'])
+        chart_holder.pack(fill=tk.BOTH, expand=True)
+        show_chart_type()
         
     def show_import_export(self):
         """Show import/export analysis chart"""
@@ -567,52 +3435,15 @@ class IndianEconomyDashboard:
         import_export_frame = tk.Frame(main_frame, bg=self.light_theme['chart_bg'])
         import_export_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))  # Add bottom padding
 
-        fig, ax = plt.subplots(figsize=(12, 3))
+        imports_col = 'Imports of goods and services (% of GDP)'
+        exports_col = 'Exports of goods and services (% of GDP)'
+        reserves_col = 'Total reserves (includes gold, current US$)'
 
-        ax.plot(self.econ_data['Year'], self.econ_data['Imports of goods and services (% of GDP)'], 
-            marker='o', linestyle='-', color='#3498db', linewidth=2, label='Imports (% of GDP)')
-
-        ax.plot(self.econ_data['Year'], self.econ_data['Exports of goods and services (% of GDP)'], 
-            marker='s', linestyle='-', color='#2ecc71', linewidth=2, label='Exports (% of GDP)')
-
-        trade_balance = self.econ_data['Exports of goods and services (% of GDP)'] - self.econ_data['Imports of goods and services (% of GDP)']
-        ax.plot(self.econ_data['Year'], trade_balance, 
-            marker='^', linestyle='--', color='#e74c3c', linewidth=1.5, label='Trade Balance (% of GDP)')
-
-        ax.axhline(y=0, color='black', linestyle='-', alpha=0.3)
-
-        ax.grid(True, linestyle='--', alpha=0.7)
-
-        ax.set_xlabel('Year', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Percentage of GDP', fontsize=12, fontweight='bold')
-        ax.set_title('India Import/Export Trends (1960-2020)', fontsize=14, fontweight='bold')
-
-        ax.set_xticks(self.econ_data['Year'][::5])
-
-        ax.legend(loc='upper left')
-
-        events = [
-            (1991, "Economic Liberalization"),
-            (2000, "Y2K & IT Boom"),
-            (2008, "Global Financial Crisis"),
-            (2020, "COVID-19 Pandemic")
-        ]
-
-        for year, event in events:
-            idx = self.econ_data[self.econ_data['Year'] == year].index
-            if len(idx) > 0:
-                idx = idx[0]
-                imports = self.econ_data.loc[idx, 'Imports of goods and services (% of GDP)']
-                ax.annotate(event, xy=(year, imports), xytext=(0, 20), 
-                        textcoords='offset points', ha='center', va='bottom',
-                        bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.5),
-                        arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0.3'))
+        fig = self.figures.acquire(ChartBuilder.FIGSIZES['import_export'], name='import_export')
+        self.charts.import_export(fig)
 
-        plt.tight_layout()
-
-        self.canvas = FigureCanvasTkAgg(fig, master=import_export_frame)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.canvas = self.figures.canvas(fig, import_export_frame)
+        self.figures.attach(fig, PanZoom)
 
         # Controls Frame with Tabs
         controls_frame = tk.Frame(main_frame, bg=self.light_theme['chart_bg'])
@@ -629,39 +3460,39 @@ class IndianEconomyDashboard:
         tab_control.pack(expand=1, fill=tk.BOTH)
 
         # Summary Statistics
-        first_decade = self.econ_data[self.econ_data['Year'] < 1970]
-        last_decade = self.econ_data[self.econ_data['Year'] >= 2010]
-
-        first_decade_avg_imports = first_decade['Imports of goods and services (% of GDP)'].mean()
-        first_decade_avg_exports = first_decade['Exports of goods and services (% of GDP)'].mean()
+        imports = self.stats.summary(imports_col)
+        exports = self.stats.summary(exports_col)
+        
+        first_decade_avg_imports = self.stats.mean_between(imports_col, imports['first_year'], 1969)
+        first_decade_avg_exports = self.stats.mean_between(exports_col, exports['first_year'], 1969)
 
-        last_decade_avg_imports = last_decade['Imports of goods and services (% of GDP)'].mean()
-        last_decade_avg_exports = last_decade['Exports of goods and services (% of GDP)'].mean()
+        last_decade_avg_imports = self.stats.mean_between(imports_col, 2010, imports['last_year'])
+        last_decade_avg_exports = self.stats.mean_between(exports_col, 2010, exports['last_year'])
 
-        max_imports = self.econ_data['Imports of goods and services (% of GDP)'].max()
-        max_imports_year = self.econ_data.loc[self.econ_data['Imports of goods and services (% of GDP)'].idxmax(), 'Year']
+        max_imports = imports['max']
+        max_imports_year = imports['max_year']
 
-        max_exports = self.econ_data['Exports of goods and services (% of GDP)'].max()
-        max_exports_year = self.econ_data.loc[self.econ_data['Exports of goods and services (% of GDP)'].idxmax(), 'Year']
+        max_exports = exports['max']
+        max_exports_year = exports['max_year']
 
         summary_text = f"""
         1960s Average:
-        - Imports: {first_decade_avg_imports:.2f}% of GDP
-        - Exports: {first_decade_avg_exports:.2f}% of GDP
-        - Trade Balance: {first_decade_avg_exports - first_decade_avg_imports:.2f}% of GDP
+        - Imports: {na(first_decade_avg_imports, '.2f')}% of GDP
+        - Exports: {na(first_decade_avg_exports, '.2f')}% of GDP
+        - Trade Balance: {na(first_decade_avg_exports - first_decade_avg_imports, '.2f')}% of GDP
 
         2010s Average:
-        - Imports: {last_decade_avg_imports:.2f}% of GDP
-        - Exports: {last_decade_avg_exports:.2f}% of GDP
-        - Trade Balance: {last_decade_avg_exports - last_decade_avg_imports:.2f}% of GDP
+        - Imports: {na(last_decade_avg_imports, '.2f')}% of GDP
+        - Exports: {na(last_decade_avg_exports, '.2f')}% of GDP
+        - Trade Balance: {na(last_decade_avg_exports - last_decade_avg_imports, '.2f')}% of GDP
 
-        Peak Import Level: {max_imports:.2f}% of GDP in {max_imports_year}
-        Peak Export Level: {max_exports:.2f}% of GDP in {max_exports_year}
+        Peak Import Level: {na(max_imports, '.2f')}% of GDP in {na(max_imports_year)}
+        Peak Export Level: {na(max_exports, '.2f')}% of GDP in {na(max_exports_year)}
 
-        Current (2020):
-        - Imports: {self.econ_data.iloc[-1]['Imports of goods and services (% of GDP)']:.2f}% of GDP
-        - Exports: {self.econ_data.iloc[-1]['Exports of goods and services (% of GDP)']:.2f}% of GDP
-        - Trade Balance: {self.econ_data.iloc[-1]['Exports of goods and services (% of GDP)'] - self.econ_data.iloc[-1]['Imports of goods and services (% of GDP)']:.2f}% of GDP
+        Current ({na(imports['last_year'])}):
+        - Imports: {na(imports['last'], '.2f')}% of GDP
+        - Exports: {na(exports['last'], '.2f')}% of GDP
+        - Trade Balance: {na(exports['last'] - imports['last'], '.2f')}% of GDP
         """
 
         summary_label = tk.Label(summary_tab, text=summary_text, font=("Arial", 11), 
@@ -672,28 +3503,31 @@ class IndianEconomyDashboard:
         reserves_plot_frame = tk.Frame(reserves_tab, bg=self.light_theme['chart_bg'])
         reserves_plot_frame.pack(fill=tk.BOTH, expand=True)
 
-        reserves_fig, reserves_ax = plt.subplots(figsize=(10, 6))
-        reserves_ax.plot(self.econ_data['Year'], self.econ_data['Total reserves (includes gold, current US$)'] / 1e9, 
-                    marker='o', linestyle='-', color='#f39c12', linewidth=2)
-
-        reserves_ax.grid(True, linestyle='--', alpha=0.7)
-        reserves_ax.set_xlabel('Year', fontsize=12, fontweight='bold')
-        reserves_ax.set_ylabel('Foreign Reserves (Billion US$)', fontsize=12, fontweight='bold')
-        reserves_ax.set_title('India Foreign Reserves (1960-2020)', fontsize=14, fontweight='bold')
-        reserves_ax.set_xticks(self.econ_data['Year'][::5])
+        @PROFILER.timed('build_reserves_tab')
+        def build_reserves_tab():
+            reserves_fig = self.figures.acquire(ChartBuilder.FIGSIZES['foreign_reserves'], name='foreign_reserves')
+            self.charts.foreign_reserves(reserves_fig)
+            self.figures.canvas(reserves_fig, reserves_plot_frame)
+            self.figures.attach(reserves_fig, PanZoom)
 
-        reserves_canvas = FigureCanvasTkAgg(reserves_fig, master=reserves_plot_frame)
-        reserves_canvas.draw()
-        reserves_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.lazy_tabs(tab_control, {1: build_reserves_tab})
 
         # Foreign Reserves Statistics
         reserves_stats_frame = tk.Frame(reserves_tab, bg=self.light_theme['chart_bg'])
         reserves_stats_frame.pack(fill=tk.X, pady=10)
 
+        reserves = self.stats.summary(reserves_col)
+        reserves_2000 = self.panel.value(2000, reserves_col)
+        reserves_years = reserves['last_year'] - 2000 if reserves['count'] else 0
+        # Annualised only with a positive base value in 2000 and at least a year after it
+        if reserves_years > 0 and reserves_2000 > 0:
+            reserves_growth = ((reserves['last'] / reserves_2000) ** (1 / reserves_years) - 1) * 100
+        else:
+            reserves_growth = np.nan
         reserves_stats = f"""
-        Current Foreign Reserves (2020): ${self.econ_data.iloc[-1]['Total reserves (includes gold, current US$)'] / 1e9:.2f} Billion
-        Increase since 2000: {(self.econ_data.iloc[-1]['Total reserves (includes gold, current US$)'] - self.econ_data[self.econ_data['Year']==2000].iloc[0]['Total reserves (includes gold, current US$)']) / 1e9:.2f} Billion
-        Average Annual Growth (2000-2020): {((self.econ_data.iloc[-1]['Total reserves (includes gold, current US$)'] / self.econ_data[self.econ_data['Year']==2000].iloc[0]['Total reserves (includes gold, current US$)']) ** (1/20) - 1) * 100:.2f}%
+        Current Foreign Reserves ({na(reserves['last_year'])}): {na(scaled(reserves_col, reserves['last']), '.2f')} {unit_of(reserves_col)}
+        Increase since 2000: {na(scaled(reserves_col, reserves['last'] - reserves_2000), '.2f')} {unit_of(reserves_col)}
+        Average Annual Growth (2000-{na(reserves['last_year'])}): {na(reserves_growth, '.2f')}%
         """
 
         reserves_label = tk.Label(reserves_stats_frame, text=reserves_stats, font=("Arial", 11), 
@@ -722,83 +3556,38 @@ class IndianEconomyDashboard:
         
         tab_control.pack(expand=1, fill=tk.BOTH)
         
-        revenue_fig, revenue_ax = plt.subplots(figsize=(10, 5))
-        revenue_ax.bar(self.tax_data['Year'], self.tax_data['Net Custom Revenue from Import Duties (in ? Crore)'], 
-                      color='#3498db')
-        
-        revenue_ax.grid(True, linestyle='--', alpha=0.7, axis='y')
-        revenue_ax.set_xlabel('Year', fontsize=12, fontweight='bold')
-        revenue_ax.set_ylabel('Revenue (₹ Crore)', fontsize=12, fontweight='bold')
-        revenue_ax.set_title('Net Custom Revenue from Import Duties (2000-2017)', fontsize=14, fontweight='bold')
-        
-        revenue_ax.set_xticks(self.tax_data['Year'])
-        revenue_ax.set_xticklabels([f"{year}" for year in self.tax_data['Year']], rotation=45)
-        
-        plt.tight_layout()
-        
-        revenue_canvas = FigureCanvasTkAgg(revenue_fig, master=revenue_tab)
-        revenue_canvas.draw()
-        revenue_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        rates_fig, rates_ax = plt.subplots(figsize=(10, 5))
-        rates_ax.plot(self.tax_data['Year'], self.tax_data['Collection Rates (Percent)'], 
-                     marker='o', linestyle='-', color='#e74c3c', linewidth=2)
-        
-        rates_ax.grid(True, linestyle='--', alpha=0.7)
-        rates_ax.set_xlabel('Year', fontsize=12, fontweight='bold')
-        rates_ax.set_ylabel('Collection Rate (%)', fontsize=12, fontweight='bold')
-        rates_ax.set_title('Import Duties Collection Rates (2000-2017)', fontsize=14, fontweight='bold')
-        
-        rates_ax.set_xticks(self.tax_data['Year'])
-        rates_ax.set_xticklabels([f"{year}" for year in self.tax_data['Year']], rotation=45)
-        
-        plt.tight_layout()
-        
-        rates_canvas = FigureCanvasTkAgg(rates_fig, master=rates_tab)
-        rates_canvas.draw()
-        rates_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        growth_fig, growth_ax = plt.subplots(figsize=(10, 5))
-        
-        width = 0.35
-        indices = range(len(self.tax_data) - 1)
-        
-        growth_ax.bar([i - width/2 for i in indices], self.tax_data['Growth in Value of Imports ( %)'][1:], 
-                      width, color='#3498db', label='Import Value Growth (%)')
-        
-        growth_ax.bar([i + width/2 for i in indices], self.tax_data['Growth in Revenue from Import Duty (%)'][1:], 
-                      width, color='#e74c3c', label='Import Revenue Growth (%)')
-        
-        growth_ax.grid(True, linestyle='--', alpha=0.7, axis='y')
-        growth_ax.set_xlabel('Year', fontsize=12, fontweight='bold')
-        growth_ax.set_ylabel('Growth Rate (%)', fontsize=12, fontweight='bold')
-        growth_ax.set_title('Comparison of Import Value vs. Revenue Growth (2001-2017)', fontsize=14, fontweight='bold')
-        
-        growth_ax.set_xticks(indices)
-        growth_ax.set_xticklabels([f"{year}" for year in self.tax_data['Year'][1:]], rotation=45)
-        
-        growth_ax.legend()
-        
-        plt.tight_layout()
-        
-        growth_canvas = FigureCanvasTkAgg(growth_fig, master=growth_tab)
-        growth_canvas.draw()
-        growth_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # Each tab's figure is built the first time the tab is shown
+        def tab_builder(tab, name, *tools):
+            @PROFILER.timed(f'build_{name}_tab')
+            def build():
+                fig = self.figures.acquire(ChartBuilder.FIGSIZES[name], name=name)
+                getattr(self.charts, name)(fig)
+                self.figures.canvas(fig, tab)
+                self.figures.attach(fig, *tools)
+                if self.current_chart is None:
+                    self.current_chart = fig
+            return build
+        
+        self.lazy_tabs(tab_control, {0: tab_builder(revenue_tab, 'tax_revenue'),
+                                     1: tab_builder(rates_tab, 'tax_collection_rates', PanZoom),
+                                     2: tab_builder(growth_tab, 'tax_growth')})
         
         stats_frame = tk.Frame(self.chart_frame, bg=self.light_theme['chart_bg'])
         stats_frame.pack(fill=tk.X, pady=10)
         
-        avg_collection_rate = self.tax_data['Collection Rates (Percent)'].mean()
-        min_collection_rate = self.tax_data['Collection Rates (Percent)'].min()
-        min_year = self.tax_data.loc[self.tax_data['Collection Rates (Percent)'].idxmin(), 'Year']
-        max_collection_rate = self.tax_data['Collection Rates (Percent)'].max()
-        max_year = self.tax_data.loc[self.tax_data['Collection Rates (Percent)'].idxmax(), 'Year']
+        collection = self.stats.summary('Collection Rates (Percent)')
+        import_value = self.stats.summary('Value of Import (in ? Crore)')
+        import_revenue = self.stats.summary('Net Custom Revenue from Import Duties (in ? Crore)')
+        
+        avg_collection_rate = collection['mean']
+        min_collection_rate = collection['min']
+        min_year = collection['min_year']
+        max_collection_rate = collection['max']
+        max_year = collection['max_year']
         
-        total_import_growth = ((self.tax_data.iloc[-1]['Value of Import (in ? Crore)'] / 
-                              self.tax_data.iloc[0]['Value of Import (in ? Crore)']) - 1) * 100
+        total_import_growth = ((import_value['last'] / import_value['first']) - 1) * 100
         
-        total_revenue_growth = ((self.tax_data.iloc[-1]['Net Custom Revenue from Import Duties (in ? Crore)'] / 
-                               self.tax_data.iloc[0]['Net Custom Revenue from Import Duties (in ? Crore)']) - 1) * 100
+        total_revenue_growth = ((import_revenue['last'] / import_revenue['first']) - 1) * 100
         
         stats_text = f"""
         Average Collection Rate (2000-2017): {avg_collection_rate:.2f}%
@@ -808,75 +3597,43 @@ class IndianEconomyDashboard:
         Total Import Value Growth (2000-2017): {total_import_growth:.2f}%
         Total Import Revenue Growth (2000-2017): {total_revenue_growth:.2f}%
         
-        Current Collection Rate (2017): {self.tax_data.iloc[-1]['Collection Rates (Percent)']:.2f}%
+        Current Collection Rate ({collection['last_year']}): {collection['last']:.2f}%
         """
         
         stats_label = tk.Label(stats_frame, text=stats_text, font=("Arial", 11), 
                              bg=self.light_theme['chart_bg'], fg="#34495e", justify=tk.LEFT)
         stats_label.pack(padx=20)
         
-        self.current_chart = revenue_fig
-        
     def show_government_debt(self):
         """Show government debt analysis chart using India_Government_Debt.csv"""
         self.clear_chart_frame()
         self.update_header("Government Debt Analysis (1990-2018)")
     
         # Widget 4: Chart Type Selector
-        self.chart_type_var = tk.StringVar(value="Line")
+        self.chart_type_var = tk.StringVar(value=self.view_seed.get('chart_type', CHART_TYPES[0]))
     
-        def update_debt_plot():
-            if self.canvas:
-                self.canvas.get_tk_widget().destroy()
-        
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8), sharex=True)
-        
-            chart_type = self.chart_type_var.get()
-            # Filter data for 1990-2018 (non-zero debt values)
-            data = self.debt_data[(self.debt_data['Year'] >= 1990) & 
-                            (self.debt_data['Year'] <= 2018) & 
-                            (self.debt_data['Government Debt (% of GDP)'] > 0)].sort_values('Year')
-        
-            # Check if data is empty
-            if data.empty:
+        chart_artists = None
+    
+        def build_debt_plot():
+            nonlocal chart_artists
+            fig = self.figures.acquire(ChartBuilder.FIGSIZES['government_debt'], slot=0, name='government_debt')
+            chart_artists = self.charts.government_debt(fig)
+            if chart_artists is None:
                 messagebox.showerror("Error", "No government debt data available for the specified period.")
-                return
+                return None
         
-            # Plot Government Debt as % of GDP
-            if chart_type == "Line":
-                ax1.plot(data['Year'], data['Government Debt (% of GDP)'], 
-                    marker='o', linestyle='-', color='#f39c12', linewidth=2)
-            else:  # Bar
-                ax1.bar(data['Year'], data['Government Debt (% of GDP)'], 
-                   color='#f39c12', alpha=0.7)
-        
-            ax1.axhline(y=60, color='red', linestyle='--', alpha=0.7, label='High Debt Threshold (60%)')
-            ax1.grid(True, linestyle='--', alpha=0.7)
-            ax1.set_ylabel('Debt (% of GDP)', fontsize=12, fontweight='bold')
-            ax1.set_title('India Government Debt as % (1990-2018)', fontsize=14, fontweight='bold')
-            ax1.legend(loc='upper right')
-        
-            # Plot Debt Growth Rate
-            if chart_type == "Line":
-                ax2.plot(data['Year'], data['Debt Growth Rate (%)'], 
-                    marker='s', linestyle='--', color='#9b59b6', linewidth=2)
-            else:  # Bar
-                ax2.bar(data['Year'], data['Debt Growth Rate (%)'], 
-                   color='#9b59b6', alpha=0.7)
-        
-            ax2.axhline(y=0, color='black', linestyle='-', alpha=0.3)
-            ax2.grid(True, linestyle='--', alpha=0.7)
-            ax2.set_xlabel('Year', fontsize=12, fontweight='bold')
-            ax2.set_ylabel('Debt Growth Rate (%)', fontsize=12, fontweight='bold')
-            ax2.set_title('Annual Change in Government Debt (1990-2018)', fontsize=14, fontweight='bold')
-        
-            ax2.set_xticks(data['Year'][::2])  # Every 2 years for clarity
-        
-            plt.tight_layout()
-            self.canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-            self.canvas.draw()
-            self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            ChartBuilder.set_chart_type(chart_artists, self.chart_type_var.get())
+            self.canvas = self.figures.canvas(fig, chart_holder)
+            self.figures.attach(fig, Crosshair, PanZoom)
             self.current_chart = fig
+            return self.canvas
+    
+        def show_chart_type(event=None):
+            if chart_artists is not None:
+                self.apply_chart_type(chart_artists, self.chart_type_var.get())
+            else:
+                self.draw_cached_chart('government_debt', {'chart_type': self.chart_type_var.get()},
+                                       build_debt_plot, chart_holder)
     
         stats_frame = tk.Frame(self.chart_frame, bg=self.light_theme['chart_bg'])
         stats_frame.pack(fill=tk.X, pady=10)
@@ -887,34 +3644,19 @@ class IndianEconomyDashboard:
         tk.Label(control_frame, text="Chart Type:", font=("Arial", 11, "bold"), 
            bg=self.light_theme['chart_bg'], fg="#34495e").pack(side=tk.LEFT, padx=5)
         chart_type_dropdown = ttk.Combobox(control_frame, textvariable=self.chart_type_var, 
-                                     values=["Line", "Bar"], width=10)
+                                     values=CHART_TYPES, width=10)
         chart_type_dropdown.pack(side=tk.LEFT, padx=5)
-        chart_type_dropdown.bind("<<ComboboxSelected>>", lambda e: update_debt_plot())
+        chart_type_dropdown.bind("<<ComboboxSelected>>", show_chart_type)
     
         # Handle potential missing or invalid data
         try:
-            filtered_data = self.debt_data[(self.debt_data['Year'] >= 1990) & 
-                                     (self.debt_data['Year'] <= 2018) & 
-                                     (self.debt_data['Government Debt (% of GDP)'] > 0)]
-        
-            if filtered_data.empty:
+            if self.stats.frame('debt_1990_2018').empty:
                 messagebox.showerror("Error", "No valid government debt data available for 1990-2018.")
                 return
         
-            avg_debt = filtered_data['Government Debt (% of GDP)'].mean()
-            max_debt = filtered_data['Government Debt (% of GDP)'].max()
-            max_debt_year = filtered_data.loc[filtered_data['Government Debt (% of GDP)'].idxmax(), 'Year']
-            min_debt = filtered_data['Government Debt (% of GDP)'].min()
-            min_debt_year = filtered_data.loc[filtered_data['Government Debt (% of GDP)'].idxmin(), 'Year']
-            recent_debt = filtered_data.iloc[-1]['Government Debt (% of GDP)']  # Most recent (2018)
-        
-            avg_growth = filtered_data['Debt Growth Rate (%)'].mean()
-            max_growth = filtered_data['Debt Growth Rate (%)'].max()
-            max_growth_year = filtered_data.loc[filtered_data['Debt Growth Rate (%)'].idxmax(), 'Year']
-        
-            filtered_data = filtered_data.copy()  # Avoid SettingWithCopyWarning
-            filtered_data['Decade'] = (filtered_data['Year'] // 10) * 10
-            decade_debt = filtered_data.groupby('Decade')['Government Debt (% of GDP)'].mean().reset_index()
+            debt = self.stats.summary('Government Debt (% of GDP)', 'debt_1990_2018', above=(60,))
+            debt_growth = self.stats.summary('Debt Growth Rate (%)', 'debt_1990_2018')
+            decade_debt = self.stats.decade_means('Government Debt (% of GDP)', 'debt_1990_2018')
         except Exception as e:
             messagebox.showerror("Error", f"Failed to process government debt data: {str(e)}")
             return
@@ -931,94 +3673,59 @@ class IndianEconomyDashboard:
         tk.Label(decade_table, text="Avg. Debt (% of GDP)", font=("Arial", 11, "bold"), 
            bg=self.light_theme['chart_bg'], fg="#34495e").grid(row=1, column=1, padx=10, pady=5)
     
-        for i, (_, row) in enumerate(decade_debt.iterrows()):
-            decade_text = f"{int(row['Decade'])}s"
+        for i, (decade, decade_avg) in enumerate(decade_debt.items()):
+            decade_text = f"{int(decade)}s"
             tk.Label(decade_table, text=decade_text, font=("Arial", 11), 
                bg=self.light_theme['chart_bg'], fg="#34495e").grid(row=i+2, column=0, padx=10, pady=2)
-            tk.Label(decade_table, text=f"{row['Government Debt (% of GDP)']:.2f}%", 
+            tk.Label(decade_table, text=f"{decade_avg:.2f}%", 
                font=("Arial", 11), bg=self.light_theme['chart_bg'], fg="#34495e").grid(row=i+2, column=1, padx=10, pady=2)
     
         stats_text = f"""
-        Average Debt (1990-2018): {avg_debt:.2f}% of GDP
-        Highest Debt: {max_debt:.2f}% in {max_debt_year}
-        Lowest Debt: {min_debt:.2f}% in {min_debt_year}
-        Most Recent Debt (2018): {recent_debt:.2f}%
+        Average Debt ({debt['first_year']}-{debt['last_year']}): {debt['mean']:.2f}% of GDP
+        Highest Debt: {debt['max']:.2f}% in {debt['max_year']}
+        Lowest Debt: {debt['min']:.2f}% in {debt['min_year']}
+        Most Recent Debt ({debt['last_year']}): {debt['last']:.2f}%
     
-        Average Debt Growth Rate: {avg_growth:.2f}%
-        Highest Debt Growth: {max_growth:.2f}% in {max_growth_year}
+        Average Debt Growth Rate: {debt_growth['mean']:.2f}%
+        Highest Debt Growth: {debt_growth['max']:.2f}% in {debt_growth['max_year']}
     
-        Years with Debt > 60%: {len(filtered_data[filtered_data['Government Debt (% of GDP)'] > 60])}
+        Years with Debt > 60%: {debt['above'][60]}
         """
     
         stats_label = tk.Label(stats_frame, text=stats_text, font=("Arial", 11), 
                          bg=self.light_theme['chart_bg'], fg="#34495e", justify=tk.LEFT)
         stats_label.pack(side=tk.LEFT, padx=20)
     
-        update_debt_plot()
+        chart_holder = tk.Frame(self.chart_frame, bg=self.light_theme['chart_bg'])
+        chart_holder.pack(fill=tk.BOTH, expand=True)
+        show_chart_type()
         
     def show_growth_indicators(self):
         """Show economic growth indicators chart"""
         self.clear_chart_frame()
         self.update_header("Economic Growth Indicators")
         
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10), sharex=True)
-        
-        ax1.plot(self.econ_data['Year'], self.econ_data['GDP growth (annual %)'], 
-                marker='o', linestyle='-', color='#3498db', linewidth=2)
-        
-        ax1.axhline(y=0, color='black', linestyle='-', alpha=0.3)
-        
-        ax1.grid(True, linestyle='--', alpha=0.7)
-        
-        ax1.set_ylabel('GDP Growth Rate (%)', fontsize=12, fontweight='bold')
-        ax1.set_title('GDP Annual Growth Rate (1960-2020)', fontsize=14, fontweight='bold')
-        
-        events = [
-            (1979, "Oil Crisis"),
-            (1991, "Economic Liberalization"),
-            (2008, "Global Financial Crisis"),
-            (2016, "Demonetization"),
-            (2020, "COVID-19 Pandemic")
-        ]
-        
-        for year, event in events:
-            idx = self.econ_data[self.econ_data['Year'] == year].index
-            if len(idx) > 0:
-                idx = idx[0]
-                growth = self.econ_data.loc[idx, 'GDP growth (annual %)']
-                ax1.annotate(event, xy=(year, growth), xytext=(0, 15 if growth > 0 else -15), 
-                           textcoords='offset points', ha='center', va='bottom' if growth > 0 else 'top',
-                           bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.5),
-                           arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0.3'))
-        
-        ax2.plot(self.inflation_data['Year'], self.inflation_data['Inflation Rate (%)'], 
-                marker='s', linestyle='-', color='#e74c3c', linewidth=2)
-        
-        ax2.axhline(y=0, color='black', linestyle='-', alpha=0.3)
-        
-        ax2.grid(True, linestyle='--', alpha=0.7)
-        
-        ax2.set_xlabel('Year', fontsize=12, fontweight='bold')
-        ax2.set_ylabel('Inflation Rate (%)', fontsize=12, fontweight='bold')
-        ax2.set_title('Inflation Rate (1960-2022)', fontsize=14, fontweight='bold')
-        
-        ax2.set_xticks(self.inflation_data['Year'][::5])
+        chart_holder = tk.Frame(self.chart_frame, bg=self.light_theme['chart_bg'])
+        chart_holder.pack(fill=tk.BOTH, expand=True)
         
-        plt.tight_layout()
+        def build_growth_plot():
+            fig = self.figures.acquire(ChartBuilder.FIGSIZES['growth_indicators'], name='growth_indicators')
+            self.charts.growth_indicators(fig)
+            
+            self.canvas = self.figures.canvas(fig, chart_holder)
+            self.figures.attach(fig, PanZoom)
+            self.current_chart = fig
+            return self.canvas
         
-        self.canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.draw_cached_chart('growth_indicators', PREFETCH_VIEWS['growth_indicators'], build_growth_plot, chart_holder)
         
         controls_frame = tk.Frame(self.chart_frame, bg=self.light_theme['chart_bg'])
         controls_frame.pack(fill=tk.X, pady=10)
         
-        self.inflation_data = self.inflation_data.copy()  # Avoid SettingWithCopyWarning
-        self.inflation_data['Decade'] = (self.inflation_data['Year'] // 10) * 10
-        decade_stats = self.inflation_data.groupby('Decade').agg({
-            'Inflation Rate (%)': 'mean'
-        }).reset_index()
-        decade_stats['GDP Growth (annual %)'] = self.econ_data.groupby((self.econ_data['Year'] // 10) * 10)['GDP growth (annual %)'].mean().reindex(decade_stats['Decade']).values
+        decade_inflation = self.stats.decade_means('Inflation Rate (%)')
+        decade_growth = self.stats.decade_means('GDP growth (annual %)')
+        gdp_growth = self.stats.summary('GDP growth (annual %)')
+        inflation = self.stats.summary('Inflation Rate (%)')
         
         stats_frame = tk.Frame(controls_frame, bg=self.light_theme['chart_bg'])
         stats_frame.pack(side=tk.LEFT, padx=20, pady=10)
@@ -1035,68 +3742,88 @@ class IndianEconomyDashboard:
         tk.Label(stats_frame, text="Avg. Inflation (%)", font=("Arial", 11, "bold"), 
                bg=self.light_theme['chart_bg'], fg="#34495e").grid(row=1, column=2, padx=10, pady=5)
         
-        for i, (_, row) in enumerate(decade_stats.iterrow()):
-            decade_text = f"{int(row['Decade'])}s"
+        for i, decade in enumerate(decade_inflation):
+            decade_text = f"{int(decade)}s"
             tk.Label(stats_frame, text=decade_text, font=("Arial", 11), 
                    bg=self.light_theme['chart_bg'], fg="#34495e").grid(row=i+2, column=0, padx=10, pady=2)
-            tk.Label(stats_frame, text=f"{row['GDP Growth (annual %)']:.2f}%", 
+            tk.Label(stats_frame, text=f"{decade_growth.get(decade, np.nan):.2f}%", 
                    font=("Arial", 11), bg=self.light_theme['chart_bg'], fg="#34495e").grid(row=i+2, column=1, padx=10, pady=2)
-            tk.Label(stats_frame, text=f"{row['Inflation Rate (%)']:.2f}%", 
+            tk.Label(stats_frame, text=f"{decade_inflation[decade]:.2f}%", 
                    font=("Arial", 11), bg=self.light_theme['chart_bg'], fg="#34495e").grid(row=i+2, column=2, padx=10, pady=2)
         
         stats_text = f"""
-        GDP Growth Stats (1960-2020):
-        - Average GDP Growth: {self.econ_data['GDP growth (annual %)'].mean():.2f}%
-        - Highest GDP Growth: {self.econ_data['GDP growth (annual %)'].max():.2f}% in {self.econ_data.loc[self.econ_data['GDP growth (annual %)'].idxmax(), 'Year']}
-        - Lowest GDP Growth: {self.econ_data['GDP growth (annual %)'].min():.2f}% in {self.econ_data.loc[self.econ_data['GDP growth (annual %)'].idxmin(), 'Year']}
-        
-        Inflation Stats (1960-2022):
-        - Average Inflation: {self.inflation_data['Inflation Rate (%)'].mean():.2f}%
-        - Highest Inflation: {self.inflation_data['Inflation Rate (%)'].max():.2f}% in {self.inflation_data.loc[self.inflation_data['Inflation Rate (%)'].idxmax(), 'Year']}
-        - Lowest Inflation: {self.inflation_data['Inflation Rate (%)'].min():.2f}% in {self.inflation_data.loc[self.inflation_data['Inflation Rate (%)'].idxmin(), 'Year']}
+        GDP Growth Stats ({gdp_growth['first_year']}-{gdp_growth['last_year']}):
+        - Average GDP Growth: {gdp_growth['mean']:.2f}%
+        - Highest GDP Growth: {gdp_growth['max']:.2f}% in {gdp_growth['max_year']}
+        - Lowest GDP Growth: {gdp_growth['min']:.2f}% in {gdp_growth['min_year']}
+        
+        Inflation Stats ({inflation['first_year']}-{inflation['last_year']}):
+        - Average Inflation: {inflation['mean']:.2f}%
+        - Highest Inflation: {inflation['max']:.2f}% in {inflation['max_year']}
+        - Lowest Inflation: {inflation['min']:.2f}% in {inflation['min_year']}
         """
         
         stats_label = tk.Label(controls_frame, text=stats_text, font=("Arial", 11), 
                              bg=self.light_theme['chart_bg'], fg="#34495e", justify=tk.LEFT)
         stats_label.pack(side=tk.LEFT, padx=20)
         
-        self.current_chart = fig
-        
     def show_compare_indicators(self):
         """Show comparison plot for selected indicators"""
         self.clear_chart_frame()
         self.update_header("Compare Economic Indicators")
         
-        indicators = [
-            'GDP (current US$)', 'GDP per capita (current US$)', 'GDP growth (annual %)',
-            'Population, total', 'Population growth (annual %)', 
-            'Life expectancy at birth, total (years)', 
-            'Imports of goods and services (% of GDP)', 
-            'Exports of goods and services (% of GDP)', 
-            'Total reserves (includes gold, current US$)',
-            'Inflation Rate (%)', 'Inflation Growth Rate (%)',
-            'Government Debt (% of GDP)', 'Debt Growth Rate (%)'
-        ]
+        indicators = COMPARE_INDICATORS
         
         self.selected_indicators = []
-        self.check_vars = {ind: tk.BooleanVar(value=False) for ind in indicators}
+        checked = self.view_seed.get('indicators', ())
+        self.check_vars = {ind: tk.BooleanVar(value=ind in checked) for ind in indicators}
+        
+        matrix = self.stats.correlation_matrix()
         
         # Widget 2: Year Range Slider
-        min_year = min(self.econ_data['Year'].min(), self.inflation_data['Year'].min(), self.debt_data['Year'].min())
-        max_year = max(self.econ_data['Year'].max(), self.inflation_data['Year'].max(), self.debt_data['Year'].max())
+        min_year = matrix.years[0]
+        max_year = matrix.years[-1]
         
-        self.start_year_var = tk.DoubleVar(value=min_year)
-        self.end_year_var = tk.DoubleVar(value=max_year)
+        start_year, end_year = self.view_seed.get('years', (min_year, max_year))
+        self.start_year_var = tk.DoubleVar(value=start_year)
+        self.end_year_var = tk.DoubleVar(value=end_year)
         
         def update_year_labels():
             start_label.config(text=f"Start Year: {int(self.start_year_var.get())}")
             end_label.config(text=f"End Year: {int(self.end_year_var.get())}")
         
+        def build_compare_plot(indicators, start_year, end_year):
+            fig, ax = self.figures.subplots(figsize=(12, 6), slot=0, name='compare_indicators')
+            
+            colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6', '#1abc9c', '#34495e',
+                      '#e67e22', '#16a085', '#c0392b', '#8e44ad', '#27ae60', '#d35400']
+            data = matrix.frame.iloc[matrix.window(start_year, end_year)]
+            for i, indicator in enumerate(indicators):
+                spec = INDICATOR_REGISTRY[indicator]
+                label = indicator if spec.scale == 1 else f"{indicator} [{spec.unit}]"
+                LevelOfDetailLine(ax, data.index, scaled(indicator, data[indicator]), marker='o', linestyle='-', 
+                                  color=colors[i % len(colors)], linewidth=2, label=label)
+            
+            ax.grid(True, linestyle='--', alpha=0.7)
+            ax.set_xlabel('Year', fontsize=12, fontweight='bold')
+            ax.set_ylabel('Value', fontsize=12, fontweight='bold')
+            ax.set_title(f'Comparison of Selected Indicators ({start_year}-{end_year})', fontsize=14, fontweight='bold')
+            ax.legend(loc='upper left')
+            set_year_ticks(ax, data.index, 2)
+            
+            with PROFILER.phase('tight_layout'):
+                fig.tight_layout()
+            self.canvas = self.figures.canvas(fig, chart_holder)
+            self.figures.attach(fig, PanZoom)
+            self.current_chart = fig
+            return self.canvas
+        
+        @PROFILER.timed('generate_plot')
         def generate_plot():
             self.selected_indicators = [ind for ind, var in self.check_vars.items() if var.get()]
             
-            if len(self.selected_indicators) < 1 or len(self.selected_indicators) > 3:
-                messagebox.showwarning("Warning", "Please select 1 to 3 indicators to compare.")
+            if len(self.selected_indicators) < 1:
+                messagebox.showwarning("Warning", "Please select at least one indicator to compare.")
                 return
                 
             start_year = int(self.start_year_var.get())
@@ -1105,79 +3832,27 @@ class IndianEconomyDashboard:
             if start_year >= end_year:
                 messagebox.showwarning("Warning", "Start year must be less than end year.")
                 return
-                
-            if self.canvas:
-                self.canvas.get_tk_widget().destroy()
-            
-            fig, ax = plt.subplots(figsize=(12, 6))
-            
-            colors = ['#3498db', '#e74c3c', '#2ecc71']
-            for i, indicator in enumerate(self.selected_indicators):
-                if indicator in self.econ_data.columns:
-                    data = self.econ_data[(self.econ_data['Year'] >= start_year) & (self.econ_data['Year'] <= end_year)]
-                    y_data = data[indicator]
-                    if indicator == 'GDP (current US$)':
-                        y_data = y_data / 1e9
-                        ylabel = 'GDP (Billion US$)'
-                    elif indicator == 'Population, total':
-                        y_data = y_data / 1e6
-                        ylabel = 'Population (Million)'
-                    elif indicator == 'Total reserves (includes gold, current US$)':
-                        y_data = y_data / 1e9
-                        ylabel = 'Reserves (Billion US$)'
-                    else:
-                        ylabel = indicator
-                elif indicator in self.inflation_data.columns:
-                    data = self.inflation_data[(self.inflation_data['Year'] >= start_year) & (self.inflation_data['Year'] <= end_year)]
-                    y_data = data[indicator]
-                    ylabel = indicator
-                elif indicator in self.debt_data.columns:
-                    data = self.debt_data[(self.debt_data['Year'] >= start_year) & (self.debt_data['Year'] <= end_year)]
-                    y_data = data[indicator]
-                    ylabel = indicator
-                else:
-                    continue
-                
-                ax.plot(data['Year'], y_data, marker='o', linestyle='-', color=colors[i % len(colors)], 
-                       linewidth=2, label=indicator)
             
-            ax.grid(True, linestyle='--', alpha=0.7)
-            ax.set_xlabel('Year', fontsize=12, fontweight='bold')
-            ax.set_ylabel('Value', fontsize=12, fontweight='bold')
-            ax.set_title(f'Comparison of Selected Indicators ({start_year}-{end_year})', fontsize=14, fontweight='bold')
-            ax.legend(loc='upper left')
-            ax.set_xticks(data['Year'][::2])
+            params = {'indicators': self.selected_indicators, 'years': [start_year, end_year]}
+            self.draw_cached_chart('compare_indicators', params, functools.partial(
+                build_compare_plot, list(self.selected_indicators), start_year, end_year), chart_holder)
             
-            plt.tight_layout()
-            self.canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-            self.canvas.draw()
-            self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            self.current_chart = fig
+            # Correlation Analysis: every pair in one lookup, strongest first
+            correlations = matrix.correlations(start_year, end_year, self.selected_indicators)
+            pairs = []
+            for i, ind1 in enumerate(self.selected_indicators):
+                for ind2 in self.selected_indicators[i+1:]:
+                    correlation = correlations.loc[ind1, ind2]
+                    if not np.isnan(correlation):
+                        pairs.append((ind1, ind2, correlation))
+            pairs.sort(key=lambda pair: -abs(pair[2]))
             
-            # Correlation Analysis
+            max_pairs = 10
             correlation_text = "Correlation Coefficients:\n"
-            for i, ind1 in enumerate(self.selected_indicators):
-                for j, ind2 in enumerate(self.selected_indicators[i+1:], i+1):
-                    if ind1 in self.econ_data.columns:
-                        data1 = self.econ_data[(self.econ_data['Year'] >= start_year) & (self.econ_data['Year'] <= end_year)][ind1]
-                    elif ind1 in self.inflation_data.columns:
-                        data1 = self.inflation_data[(self.inflation_data['Year'] >= start_year) & (self.inflation_data['Year'] <= end_year)][ind1]
-                    else:
-                        data1 = self.debt_data[(self.debt_data['Year'] >= start_year) & (self.debt_data['Year'] <= end_year)][ind1]
-                        
-                    if ind2 in self.econ_data.columns:
-                        data2 = self.econ_data[(self.econ_data['Year'] >= start_year) & (self.econ_data['Year'] <= end_year)][ind2]
-                    elif ind2 in self.inflation_data.columns:
-                        data2 = self.inflation_data[(self.inflation_data['Year'] >= start_year) & (self.inflation_data['Year'] <= end_year)][ind2]
-                    else:
-                        data2 = self.debt_data[(self.debt_data['Year'] >= start_year) & (self.debt_data['Year'] <= end_year)][ind2]
-                    
-                    # Align data by year
-                    df_temp = pd.DataFrame({'ind1': data1, 'ind2': data2, 'Year': data['Year']})
-                    df_temp = df_temp.dropna()
-                    if not df_temp.empty:
-                        correlation = df_temp['ind1'].corr(df_temp['ind2'])
-                        correlation_text += f"{ind1} vs {ind2}: {correlation:.2f}\n"
+            for ind1, ind2, correlation in pairs[:max_pairs]:
+                correlation_text += f"{ind1} vs {ind2}: {correlation:.2f}\n"
+            if len(pairs) > max_pairs:
+                correlation_text += f"... and {len(pairs) - max_pairs} weaker pairs\n"
             
             correlation_label.config(text=correlation_text)
         
@@ -1224,7 +3899,7 @@ class IndianEconomyDashboard:
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        tk.Label(scrollable_frame, text="Select Indicators (up to 3):", font=("Arial", 12, "bold"), 
+        tk.Label(scrollable_frame, text="Select Indicators:", font=("Arial", 12, "bold"), 
                bg=self.light_theme['chart_bg'], fg="#34495e").pack(anchor='w', padx=10, pady=5)
         
         for indicator in indicators:
@@ -1243,52 +3918,73 @@ class IndianEconomyDashboard:
                                   justify=tk.LEFT)
         correlation_label.pack(padx=20, pady=10)
         
+        chart_holder = tk.Frame(self.chart_frame, bg=self.light_theme['chart_bg'])
+        chart_holder.pack(fill=tk.BOTH, expand=True)
+        if self.view_seed.get('plotted'):
+            generate_plot()
+        
     def show_data_table(self):
         """Show data table view"""
         self.clear_chart_frame()
         self.update_header("Data Table View")
         
-        datasets = {
-            "Indian Economy Data": self.econ_data,
-            "Import Tax Data": self.tax_data,
-            "Inflation Data": self.inflation_data,
-            "Government Debt Data": self.debt_data
+        sources = {
+            "Indian Economy Data": 'econ_data',
+            "Import Tax Data": 'tax_data',
+            "Inflation Data": 'inflation_data',
+            "Government Debt Data": 'debt_data'
         }
+        datasets = {label: getattr(self, attr) for label, attr in sources.items()}
         
         self.dataset_var = tk.StringVar(value="Indian Economy Data")
         self.filter_var = tk.StringVar(value="All Columns")
         self.search_var = tk.StringVar()
         
+        search_indexes = {}
+        pending_search = [None]
+        
+        def index_for(label):
+            # Index a dataset in the background when it is selected, before anything is typed
+            if label not in search_indexes:
+                search_indexes[label] = TableSearchIndex(datasets[label])
+                threading.Thread(target=search_indexes[label].build, daemon=True).start()
+            return search_indexes[label]
+        
+        @PROFILER.timed('update_table')
         def update_table():
-            for item in tree.get_children():
-                tree.delete(item)
-            
-            selected_dataset = self.dataset_var.get()
-            df = datasets[selected_dataset].copy()
-            
-            search_text = self.search_var.get().lower()
-            filter_column = self.filter_var.get()
-            
-            if search_text:
-                if filter_column == "All Columns":
-                    mask = df.apply(lambda row: row.astype(str).str.lower().str.contains(search_text).any(), axis=1)
+            pending_search[0] = None
+            index = search_indexes[self.dataset_var.get()]
+            text = self.search_var.get()
+            if text and not index.is_predicate(text) and not index.ready.is_set():
+                result_label.config(text="Indexing...", fg="#34495e")
+                pending_search[0] = self.root.after(100, update_table)
+                return
+            start = time.perf_counter()
+            try:
+                if index.is_predicate(text):
+                    rows = index.query(text, self.filter_var.get())
                 else:
-                    mask = df[filter_column].astype(str).str.lower().str.contains(search_text)
-                df = df[mask]
-            
-            for _, row in df.iterrows():
-                tree.insert("", tk.END, values=[row[col] for col in df.columns])
+                    rows = index.search(text, self.filter_var.get())
+            except ValueError as e:
+                result_label.config(text=str(e), fg="#c0392b")
+                return
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            table.show_rows(rows)
+            result_label.config(text=f"{len(rows):,} of {len(index.df):,} rows · {elapsed_ms:.1f} ms", fg="#34495e")
         
+        def schedule_update_table():
+            # Debounce typing so a burst of keystrokes runs a single search
+            if pending_search[0] is not None:
+                self.root.after_cancel(pending_search[0])
+            pending_search[0] = self.root.after(200, update_table)
+        
+        @PROFILER.timed('update_columns')
         def update_columns():
             selected_dataset = self.dataset_var.get()
             columns = ["All Columns"] + list(datasets[selected_dataset].columns)
             filter_dropdown['values'] = columns
             self.filter_var.set("All Columns")
-            tree.delete(*tree.get_children())
-            tree['columns'] = datasets[selected_dataset].columns
-            for col in tree['columns']:
-                tree.heading(col, text=col)
-                tree.column(col, width=100, anchor='w')
+            table.set_data(index_for(selected_dataset).df)
             update_table()
         
         control_frame = tk.Frame(self.chart_frame, bg=self.light_theme['chart_bg'])
@@ -1315,51 +4011,132 @@ class IndianEconomyDashboard:
         tk.Label(control_frame, text="Search:", font=("Arial", 11, "bold"), 
                 bg=self.light_theme['chart_bg'], fg="#34495e").pack(side=tk.LEFT, padx=10)
         
-        search_entry = tk.Entry(control_frame, textvariable=self.search_var, width=20)
+        # Plain text is a substring search; "Year>=1991 & GDP growth (annual %) < 0" filters by value
+        search_entry = tk.Entry(control_frame, textvariable=self.search_var, width=30)
         search_entry.pack(side=tk.LEFT, padx=5)
-        search_entry.bind("<KeyRelease>", lambda e: update_table())
+        search_entry.bind("<KeyRelease>", lambda e: schedule_update_table())
+        
+        result_label = tk.Label(control_frame, text="", font=("Arial", 10),
+                                bg=self.light_theme['chart_bg'], fg="#34495e")
+        result_label.pack(side=tk.LEFT, padx=5)
+        filter_dropdown.bind("<<ComboboxSelected>>", lambda e: update_table())
         
         # Treeview
         tree_frame = tk.Frame(self.chart_frame, bg=self.light_theme['chart_bg'])
         tree_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        tree_scroll_y = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL)
-        tree_scroll_y.pack(side=tk.RIGHT, fill=tk.Y)
+        table = VirtualTable(tree_frame, height=20)
         
-        tree_scroll_x = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL)
-        tree_scroll_x.pack(side=tk.BOTTOM, fill=tk.X)
+        # Initial table setup
+        update_columns()
         
-        tree = ttk.Treeview(tree_frame, yscrollcommand=tree_scroll_y.set, 
-                          xscrollcommand=tree_scroll_x.set, height=20)
-        tree.pack(fill=tk.BOTH, expand=True)
+        def refresh(changed):
+            # Swap in the reloaded frames but keep the dataset, column, search text and scroll position
+            for label, attr in sources.items():
+                if attr in changed:
+                    datasets[label] = getattr(self, attr)
+                    search_indexes.pop(label, None)
+            selected_dataset = self.dataset_var.get()
+            if selected_dataset not in search_indexes:
+                offset = table.offset
+                table.set_data(index_for(selected_dataset).df)
+                update_table()
+                table.scroll(offset)
         
-        tree_scroll_y.config(command=tree.yview)
-        tree_scroll_x.config(command=tree.xview)
+        self.view_refresh = refresh
         
-        # Initial table setup
-        update_columns()
+        # Export data button: streams the rows the table currently shows on a worker thread
+        export = [None]
         
-        # Export data button
         def export_data():
-            selected_dataset = self.dataset_var.get()
             file_path = filedialog.asksaveasfilename(
                 defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+                filetypes=TableExport.filetypes()
             )
-            if file_path:
-                try:
-                    datasets[selected_dataset].to_csv(file_path, index=False)
-                    messagebox.showinfo("Success", f"Data exported successfully to {file_path}")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to export data: {str(e)}")
+            if not file_path:
+                return
+            try:
+                export[0] = TableExport(table.df, table.rows, file_path).start()
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to export data: {str(e)}")
+                return
+            export_btn.config(state=tk.DISABLED)
+            export_bar.config(maximum=max(len(table.rows), 1), value=0)
+            export_label.config(text=f"Exporting 0/{len(table.rows):,} rows...")
+            progress_frame.pack(side=tk.LEFT, padx=5)
+            self.root.after(100, poll_export)
+        
+        def poll_export():
+            # The export outlives the view; only report through widgets that still exist
+            visible = progress_frame.winfo_exists()
+            for event in export[0].poll():
+                if event[0] == 'progress' and visible:
+                    _, _, done, total = event
+                    export_bar.config(value=done)
+                    export_label.config(text=f"Exporting {done:,}/{total:,} rows...")
+                elif event[0] == 'done':
+                    _, path, error = event
+                    if error is None:
+                        messagebox.showinfo("Success", f"Data exported successfully to {path}")
+                    else:
+                        messagebox.showerror("Error", f"Failed to export data: {str(error)}")
+            
+            if export[0].thread.is_alive() or not export[0].events.empty():
+                self.root.after(100, poll_export)
+            elif visible:
+                export_btn.config(state=tk.NORMAL)
+                progress_frame.pack_forget()
         
         export_btn = tk.Button(control_frame, text="Export Table", 
                              command=export_data, font=("Arial", 11), 
                              bg="#3498db", fg="white",
                              activebackground="#2980b9", activeforeground="white")
         export_btn.pack(side=tk.LEFT, padx=10)
+        
+        progress_frame = tk.Frame(control_frame, bg=self.light_theme['chart_bg'])
+        export_bar = ttk.Progressbar(progress_frame, orient=tk.HORIZONTAL, length=120, mode='determinate')
+        export_bar.pack(side=tk.LEFT, padx=5)
+        export_label = tk.Label(progress_frame, text="", font=("Arial", 9),
+                                bg=self.light_theme['chart_bg'], fg="#34495e")
+        export_label.pack(side=tk.LEFT, padx=5)
+        tk.Button(progress_frame, text="Cancel", command=lambda: export[0].cancel(),
+                  font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
 
-if __name__ == "__main__":
+def main(argv=None):
+    """Launch the dashboard, or render every view to files with `render --out DIR`"""
+    parser = argparse.ArgumentParser(description="Indian Economy Dashboard")
+    parser.add_argument('--profile', nargs='?', const=PROFILE_LOG, metavar='LOG',
+                        help=f"time each view render, show the breakdown and append it to LOG (default: {PROFILE_LOG})")
+    commands = parser.add_subparsers(dest='command')
+    render = commands.add_parser('render', help="render the dashboard views to image files without opening a window")
+    render.add_argument('--out', required=True, help="directory to write the images to")
+    render.add_argument('--views', nargs='+', choices=list(RENDER_VIEWS), help="views to render (default: all)")
+    render.add_argument('--formats', nargs='+', choices=['png', 'pdf', 'svg'], default=['png', 'pdf'])
+    render.add_argument('--dpi', type=int, default=100)
+    render.add_argument('--jobs', type=int, help="worker processes (default: one per CPU)")
+    render.add_argument('--country', default=DEFAULT_COUNTRY,
+                        help=f"country to plot (default: {DEFAULT_COUNTRY})")
+    render.add_argument('--chart-types', nargs='+', choices=CHART_TYPES, default=CHART_TYPES[:1],
+                        help="variants of the charts with a Line/Bar switch; several are written as "
+                             "<chart>_<type>.<fmt> (default: Line)")
+    args = parser.parse_args(argv)
+    
+    if args.command == 'render':
+        start = time.perf_counter()
+        try:
+            render_all(args.out, args.views, args.formats, args.dpi, args.jobs, args.country, args.chart_types)
+        except (OSError, ValueError) as e:
+            parser.exit(1, f"render failed: {e}\n")
+        print(f"Rendered to {args.out} in {time.perf_counter() - start:.2f}s")
+        return
+    
+    if args.profile:
+        PROFILER.enable(args.profile)
+    PROFILER.milestone('module')
     root = tk.Tk()
     app = IndianEconomyDashboard(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,13 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ds1  # noqa: E402
+
+
+@pytest.fixture(autouse=True, scope='session')
+def resolved_imports():
+    ds1.resolve_lazy_imports()
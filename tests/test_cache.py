@@ -0,0 +1,61 @@
+import os
+
+import pandas as pd
+
+import ds1
+
+CSV = "Year,Country Name,Value\n2000,India,1.5\n2001,India,2.5\n2001,Chile,0.5\n"
+
+
+def counting_parser(calls):
+    def parse(path):
+        calls.append(path)
+        return pd.read_csv(path)
+    return parse
+
+
+def test_data_cache_round_trip(tmp_path):
+    source = tmp_path / 'data.csv'
+    source.write_text(CSV)
+    calls = []
+    parser = counting_parser(calls)
+    parsed = ds1.DataCache(str(tmp_path / 'cache')).load('data', str(source), parser)
+
+    # A later launch reads the columns back without parsing
+    cached = ds1.DataCache(str(tmp_path / 'cache')).load('data', str(source), parser)
+    assert len(calls) == 1
+    assert cached.to_dict('list') == parsed.to_dict('list')
+    assert (cached['Year'].dtype, cached['Value'].dtype) == (parsed['Year'].dtype, parsed['Value'].dtype)
+
+
+def test_data_cache_touched_and_changed_source(tmp_path):
+    source = tmp_path / 'data.csv'
+    source.write_text(CSV)
+    calls = []
+    parser = counting_parser(calls)
+    cache_dir = str(tmp_path / 'cache')
+    ds1.DataCache(cache_dir).load('data', str(source), parser)
+
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    ds1.DataCache(cache_dir).load('data', str(source), parser)
+    assert len(calls) == 1  # Same content under a new mtime still hits
+
+    source.write_text(CSV + "2002,India,3.5\n")
+    df = ds1.DataCache(cache_dir).load('data', str(source), parser)
+    assert len(calls) == 2 and len(df) == 4
+
+
+def test_merge_rows_replaces_repeated_years():
+    df = pd.DataFrame({'Year': [2000, 2001], 'Value': [1.0, 2.0]})
+    tail = pd.DataFrame({'Year': [2001, 2002], 'Value': [2.5, 3.0]})
+    merged = ds1.merge_rows('debt_data', df, tail)
+    assert merged['Year'].tolist() == [2000, 2001, 2002]
+    assert merged['Value'].tolist() == [1.0, 2.5, 3.0]
+
+
+def test_merge_rows_keys_multi_country_sources_on_country():
+    df = pd.DataFrame({'Country Name': ['India', 'Chile'], 'Year': [2001, 2001], 'Value': [1.0, 2.0]})
+    tail = pd.DataFrame({'Country Name': ['Chile'], 'Year': [2001], 'Value': [2.5]})
+    merged = ds1.merge_rows('econ_data', df, tail)
+    assert merged.values.tolist() == [['India', 2001, 1.0], ['Chile', 2001, 2.5]]
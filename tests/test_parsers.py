@@ -0,0 +1,21 @@
+import io
+
+import ds1
+
+HEADER = "Year,Country Name,GDP (current US$) ,GDP growth (annual %)\n"
+ROWS = "2019,India,2.8e12,3.9\n2020,India,2.6e12,-5.8\n2020,Chile,2.5e11,..\n"
+FOOTER = "\n,,,\n\nData from database: World Development Indicators\nLast Updated: 07/01/2024\n"
+
+
+def test_econ_data_skips_blank_and_footer_rows():
+    for countries in (None, ['India']):
+        df = ds1.parse_econ_data(io.StringIO(HEADER + ROWS + FOOTER), countries=countries)
+        assert df['Year'].dtype == 'int64'
+        assert len(df) == (3 if countries is None else 2)
+
+
+def test_econ_data_coerces_stray_tokens():
+    df = ds1.parse_econ_data(io.StringIO(HEADER + ROWS + "2021,India,n/a,8.7\n"), chunksize=2)
+    assert df['GDP (current US$)'].isna().tolist() == [False, False, False, True]
+    assert df['GDP growth (annual %)'].tolist()[-1] == 8.7
+    assert df.columns[2] == 'GDP (current US$)'
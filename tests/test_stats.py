@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+
+import ds1
+
+
+def series(n, seed=0, missing=0.2):
+    rng = np.random.default_rng(seed)
+    values = rng.normal(size=n)
+    values[rng.random(n) < missing] = np.nan
+    return values
+
+
+def test_range_minmax_matches_nanmin_nanmax():
+    values = series(37)
+    table = ds1.RangeMinMax(values)
+    for start in range(len(values)):
+        for end in range(start + 1, len(values) + 1):
+            window = values[start:end]
+            if np.isnan(window).all():
+                assert np.isnan(table.query(start, end)).all()
+            else:
+                assert table.query(start, end) == (np.nanmin(window), np.nanmax(window))
+
+
+def test_range_minmax_empty_slice():
+    table = ds1.RangeMinMax([1.0, 2.0, 3.0])
+    assert np.isnan(table.query(2, 2)).all()
+
+
+def test_minmax_indices_keeps_each_bucket_extremes_and_ends():
+    values = series(103, seed=1)
+    values[20:30] = np.nan  # A whole bucket without data
+    indices = ds1.minmax_indices(values, 10)
+    assert indices[0] == 0 and indices[-1] == len(values) - 1
+    assert (np.diff(indices) > 0).all()
+    for start in range(0, len(values), 11):
+        bucket = values[start:start + 11]
+        if np.isnan(bucket).all():
+            continue
+        assert start + np.nanargmin(bucket) in indices
+        assert start + np.nanargmax(bucket) in indices
+
+
+def test_correlation_matrix_matches_dataframe_corr():
+    years = np.arange(1960, 2021)
+    frame = pd.DataFrame({f"ind{i}": series(len(years), seed=i) * 10 ** i for i in range(4)}, index=years)
+    matrix = ds1.CorrelationMatrix(frame)
+    for start, end in [(1960, 2020), (1975, 1990), (2000, 2003)]:
+        expected = frame.loc[start:end].corr()
+        pd.testing.assert_frame_equal(matrix.correlations(start, end), expected, atol=1e-9, rtol=0)
+
+
+def test_correlation_matrix_constant_window_is_nan():
+    years = np.arange(1990, 2010)
+    frame = pd.DataFrame({'a': np.r_[np.full(10, 5.0), np.arange(10.0)],
+                          'b': np.arange(20.0) ** 2}, index=years)
+    result = ds1.CorrelationMatrix(frame).correlations(1990, 1999)
+    assert np.isnan(result.loc['a', 'b']) and np.isnan(result.loc['a', 'a'])
+    assert result.loc['b', 'b'] == 1.0
+    assert np.isclose(ds1.CorrelationMatrix(frame).correlations(2000, 2009).loc['a', 'b'],
+                      frame.loc[2000:2009].corr().loc['a', 'b'])
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import ds1
+
+FRAME = pd.DataFrame({
+    'Year': [1989, 1991, 1995, 1999, 2000, 2005, 1991],
+    'Country Name': ['India', 'India', 'India', 'Chile', 'India', 'Chile', 'Chile'],
+    'GDP growth (annual %) ': [6.0, 1.1, np.nan, -0.8, 3.8, 6.2, 7.9],
+})
+
+
+def query(text, column=ds1.TableSearchIndex.ALL_COLUMNS):
+    return ds1.TableSearchIndex(FRAME).query(text, column).tolist()
+
+
+def test_query_single_clause_and_flipped():
+    assert query("Year>=1995") == [2, 3, 4, 5]
+    assert query("1995 > year") == [0, 1, 6]
+    assert query("Year != 1991") == [0, 2, 3, 4, 5]
+
+
+def test_query_range_and_clauses():
+    assert query("1991 <= Year < 2000") == [1, 2, 3, 6]
+    assert query("Year >= 1991 & GDP growth (annual %) < 2") == [1, 3]
+
+
+def test_query_skips_missing_values():
+    assert query("GDP growth (annual %) > -100") == [0, 1, 3, 4, 5, 6]
+
+
+def test_query_text_column_ignores_case():
+    assert query("Country Name = INDIA & Year > 1990") == [1, 2, 4]
+
+
+def test_query_uses_the_selected_column():
+    assert query(">= 2000", column='Year') == [4, 5]
+
+
+@pytest.mark.parametrize('text', ["Population > 5", "Year > abc", "Year > 1990 &", ">= 2000"])
+def test_query_errors(text):
+    with pytest.raises(ValueError):
+        query(text)
+
+
+def test_search_after_build():
+    index = ds1.TableSearchIndex(FRAME)
+    index.build()
+    assert index.ready.is_set()
+    assert index.search("chile").tolist() == [3, 5, 6]
+    assert index.search("chile", 'Year').tolist() == []